@@ -3,8 +3,10 @@ Agent 1: Break Ingestion Agent
 Normalizes incoming reconciliation breaks
 """
 from agents.base_agent import BaseReconAgent
-from mcp.tools.break_tools import BREAK_TOOLS
-from typing import Dict, Any
+from mcp.tools.break_tools import BREAK_TOOLS, stream_breaks
+from shared.config import settings
+from shared.records import compact_break
+from typing import Dict, Any, Iterable, Iterator
 
 
 class BreakIngestionAgent(BaseReconAgent):
@@ -18,13 +20,20 @@ class BreakIngestionAgent(BaseReconAgent):
             message_bus=message_bus
         )
     
-    def ingest_break(self, break_id: str = None, raw_break: Dict[str, Any] = None) -> Dict[str, Any]:
+    def ingest_break(
+        self,
+        break_id: str = None,
+        raw_break: Dict[str, Any] = None,
+        compact: bool = None
+    ) -> Dict[str, Any]:
         """
         Main entry point for break ingestion
         
         Args:
             break_id: Break ID to fetch, or
             raw_break: Raw break data to normalize
+            compact: Return ``break_data`` as a read-only CompactBreak instead
+                of a dict (defaults to ``settings.compact_break_records``)
         
         Returns:
             Normalized and validated break
@@ -41,48 +50,92 @@ class BreakIngestionAgent(BaseReconAgent):
         if "error" in raw_break:
             return raw_break
         
-        # Normalize break
-        normalize_func = self.tools["normalize_break"]["function"]
-        normalized = normalize_func(raw_break)
+        # Normalize and validate break in one pass
+        normalize_func = self.tools["normalize_and_validate_break"]["function"]
+        result = normalize_func(raw_break)
         
-        if "error" in normalized:
-            return normalized
+        if "error" in result:
+            return result
         
-        # Validate break
-        validate_func = self.tools["validate_break"]["function"]
-        validation = validate_func(normalized)
+        validation = result["validation"]
+        break_data = result["break_data"]
+        if settings.compact_break_records if compact is None else compact:
+            break_data = compact_break(break_data)
         
         return {
-            "break_data": normalized,
+            "break_data": break_data,
             "validation": validation,
             "status": "INGESTED" if validation.get("is_valid") else "VALIDATION_FAILED"
         }
     
-    def ingest_multiple_breaks(self, limit: int = 10, break_type: str = None) -> Dict[str, Any]:
+    def iter_ingested_breaks(
+        self,
+        breaks: Iterable[Dict[str, Any]] = None,
+        limit: int = 10,
+        break_type: str = None,
+        compact: bool = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Normalize and validate breaks one at a time as they arrive
+        
+        Args:
+            breaks: Raw breaks to ingest (streamed from the API if omitted)
+            limit: Number of breaks to stream when ``breaks`` is omitted
+            break_type: Optional filter when streaming
+            compact: Yield CompactBreak records (see ``ingest_break``)
+        
+        Yields:
+            Ingestion result for each break, in arrival order
+        """
+        if breaks is None:
+            breaks = stream_breaks(limit=limit, break_type=break_type)
+        
+        for raw_break in breaks:
+            yield self.ingest_break(raw_break=raw_break, compact=compact)
+    
+    def ingest_multiple_breaks(
+        self,
+        limit: int = 10,
+        break_type: str = None,
+        include_results: bool = True
+    ) -> Dict[str, Any]:
         """
         Ingest multiple breaks
         
+        Breaks are streamed from the API and ingested as they arrive.
+        
         Args:
             limit: Number of breaks to ingest
             break_type: Optional filter
+            include_results: Keep every ingestion result in the response;
+                pass False for large backfills to return counts only
         
         Returns:
-            Ingestion results
+            Ingestion results; if ingestion stops part way, the counts so
+            far plus an ``error`` entry
         """
-        get_breaks_func = self.tools["get_breaks"]["function"]
-        breaks = get_breaks_func(limit=limit, break_type=break_type)
-        
-        if "error" in breaks:
-            return breaks
-        
         results = []
-        for raw_break in breaks:
-            result = self.ingest_break(raw_break=raw_break)
-            results.append(result)
+        total = successful = failed = 0
+        error = None
+        try:
+            for result in self.iter_ingested_breaks(limit=limit, break_type=break_type):
+                total += 1
+                if result.get("status") == "INGESTED":
+                    successful += 1
+                elif result.get("status") == "VALIDATION_FAILED":
+                    failed += 1
+                if include_results:
+                    results.append(result)
+        except Exception as e:
+            error = f"Ingestion stopped after {total} breaks: {str(e)}"
         
-        return {
-            "total": len(results),
-            "successful": sum(1 for r in results if r.get("status") == "INGESTED"),
-            "failed": sum(1 for r in results if r.get("status") == "VALIDATION_FAILED"),
-            "results": results
+        response = {
+            "total": total,
+            "successful": successful,
+            "failed": failed
         }
+        if include_results:
+            response["results"] = results
+        if error:
+            response["error"] = error
+        return response
@@ -39,7 +39,7 @@ class MatchingCorrelationAgent(BaseReconAgent):
         candidates = find_func(break_data, enriched_data, threshold)
         
         correlate_func = self.tools["correlate_trades"]["function"]
-        correlation = correlate_func(candidates)
+        correlation = correlate_func(candidates, break_data)
         
         return {
             "break_id": break_data.get("break_id"),
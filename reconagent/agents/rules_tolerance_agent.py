@@ -3,8 +3,8 @@ Agent 4: Rules & Tolerance Agent
 Applies business rules and tolerance checks
 """
 from agents.base_agent import BaseReconAgent
-from mcp.tools.rules_tools import RULES_TOOLS
-from typing import Dict, Any
+from mcp.tools.rules_tools import RULES_TOOLS, RulesBatch
+from typing import Dict, Any, Sequence
 
 
 class RulesToleranceAgent(BaseReconAgent):
@@ -45,3 +45,17 @@ class RulesToleranceAgent(BaseReconAgent):
             "all_critical_rules_passed": is_valid,
             "status": "RULES_PASSED" if is_valid else "RULES_FAILED"
         }
+    
+    def evaluate_rules_many(self, breaks: Sequence[Dict[str, Any]]) -> RulesBatch:
+        """
+        Evaluate business rules for a batch of breaks
+        
+        Args:
+            breaks: Normalized breaks
+        
+        Returns:
+            RulesBatch; use ``all_critical_rules_passed`` for statuses and
+            ``evaluation(idx)`` for the full result of a surfaced break
+        """
+        apply_many = self.tools["apply_business_rules_many"]["function"]
+        return apply_many(breaks)
@@ -68,7 +68,9 @@ class WorkflowFeedbackAgent(BaseReconAgent):
         break_id: str,
         decision: Dict[str, Any],
         human_action: str = None,
-        human_notes: str = None
+        human_notes: str = None,
+        break_type: str = None,
+        root_cause: str = None
     ) -> Dict[str, Any]:
         """
         Log feedback for learning
@@ -78,12 +80,17 @@ class WorkflowFeedbackAgent(BaseReconAgent):
             decision: Agent decision
             human_action: Human action taken
             human_notes: Human notes
+            break_type: Break type (with root_cause, updates the pattern store)
+            root_cause: Root cause the break was resolved with
         
         Returns:
             Feedback record
         """
         log_func = self.tools["log_feedback"]["function"]
-        feedback = log_func(break_id, decision, human_action, human_notes)
+        feedback = log_func(
+            break_id, decision, human_action, human_notes,
+            break_type=break_type, root_cause=root_cause
+        )
         
         return {
             "break_id": break_id,
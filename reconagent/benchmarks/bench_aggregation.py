@@ -0,0 +1,50 @@
+"""
+Benchmark: aggregation matcher latency and accuracy by candidate count
+
+For each candidate count, builds breaks whose target is the sum of a random
+subset of fills and reports mean/max search latency, the share of breaks
+whose exact aggregation was recovered, and how many searches hit the time
+budget.
+
+Usage:
+    python benchmarks/bench_aggregation.py [--sizes 8,16,24,50,200] [--breaks 50] [--budget-ms 50]
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.tools.aggregation_matcher import find_aggregation
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='8,16,24,50,200')
+    parser.add_argument('--breaks', type=int, default=50)
+    parser.add_argument('--budget-ms', type=float, default=50.0)
+    args = parser.parse_args()
+
+    rng = random.Random(17)
+    print(f"{'fills':>6} {'method':<20} {'mean ms':>8} {'max ms':>8} {'exact':>7} {'timeouts':>9}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        latencies, exact, timeouts, method = [], 0, 0, None
+        for _ in range(args.breaks):
+            fills = [
+                {"candidate_id": f"F{i}", "data": {"quantity": rng.randint(1, 1000) * 10}}
+                for i in range(size)
+            ]
+            members = rng.sample(fills, rng.randint(2, max(2, size // 3)))
+            target = sum(f["data"]["quantity"] for f in members)
+            result = find_aggregation(fills, target, time_budget_ms=args.budget_ms)
+            method = result["method"]
+            latencies.append(result["elapsed_ms"])
+            exact += result["residual_quantity"] == 0
+            timeouts += not result["complete"]
+        print(f"{size:>6} {method:<20} {sum(latencies) / len(latencies):>8.2f} "
+              f"{max(latencies):>8.2f} {exact / args.breaks:>6.0%} {timeouts:>9}")
+
+
+if __name__ == '__main__':
+    main()
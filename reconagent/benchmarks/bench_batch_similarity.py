@@ -0,0 +1,62 @@
+"""
+Benchmark: scalar vs vectorized candidate similarity scoring
+
+Scores each break against a block of candidates with calculate_similarity in
+a Python loop, and with score_candidates over a prebuilt CandidateBlock.
+Also times building the block per break (from_records + score), which is
+what find_match_candidates does for large open-trade hit lists.
+
+Usage:
+    python benchmarks/bench_batch_similarity.py [--candidates 500] [--breaks 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.tools.matching_tools import CandidateBlock, calculate_similarity, score_candidates
+
+
+def make_record(rng: random.Random) -> dict:
+    quantity = rng.randint(90, 110) * 10
+    price = round(rng.uniform(95, 105), 2)
+    return {
+        "instrument": rng.choice(["AAPL", "MSFT"]),
+        "currency": rng.choice(["USD", "EUR"]),
+        "quantity": quantity,
+        "amount": round(quantity * price, 2),
+        "price": price
+    }
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, default=500)
+    parser.add_argument('--breaks', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    candidates = [make_record(rng) for _ in range(args.candidates)]
+    breaks = [make_record(rng) for _ in range(args.breaks)]
+    block = CandidateBlock.from_records(candidates)
+
+    scalar = timed(lambda: [[calculate_similarity(b, c) for c in candidates] for b in breaks])
+    rebuilt = timed(lambda: [score_candidates(b, CandidateBlock.from_records(candidates)) for b in breaks])
+    vector = timed(lambda: [score_candidates(b, block) for b in breaks])
+
+    print(f"{'scorer':<18} {'ms/break':>10} {'speedup':>8}")
+    for label, seconds in (("scalar loop", scalar), ("block per break", rebuilt), ("prebuilt block", vector)):
+        print(f"{label:<18} {seconds * 1000 / args.breaks:>10.3f} {scalar / seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: open-trade candidate search, blocking index vs full scan
+
+Builds a pool of synthetic open trades, then times candidate lookups for
+breaks drawn from the pool: a linear scan scoring every trade with
+calculate_similarity, and CandidateIndex.search followed by scoring only
+the hits. Also reports bulk-load time and incremental insert/remove cost.
+
+Usage:
+    python benchmarks/bench_candidate_index.py [--trades 1000000] [--queries 1000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.tools.candidate_index import CandidateIndex
+from mcp.tools.matching_tools import calculate_similarity
+
+
+INSTRUMENTS = [f"SEC{i:04d}" for i in range(500)]
+CURRENCIES = ["USD", "EUR", "GBP", "JPY"]
+DATES = [f"2026-01-{day:02d}" for day in range(1, 21)]
+
+
+def make_trades(count: int, rng: random.Random) -> list:
+    trades = []
+    for i in range(count):
+        quantity = rng.randint(1, 1000) * 10
+        price = round(rng.uniform(10, 500), 2)
+        trades.append({
+            "trade_id": f"OT-{i:08d}",
+            "instrument": rng.choice(INSTRUMENTS),
+            "currency": rng.choice(CURRENCIES),
+            "trade_date": rng.choice(DATES),
+            "quantity": quantity,
+            "amount": round(quantity * price, 2),
+            "price": price
+        })
+    return trades
+
+
+def scan(trades: list, probe: dict) -> list:
+    return [t for t in trades if calculate_similarity(probe, t) >= 0.7]
+
+
+def indexed(index: CandidateIndex, probe: dict) -> list:
+    hits = index.search(
+        probe["instrument"], probe["currency"], probe["trade_date"],
+        quantity=probe["quantity"], amount=probe["amount"]
+    )
+    return [t for t in hits if calculate_similarity(probe, t) >= 0.7]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--trades', type=int, default=1000000)
+    parser.add_argument('--queries', type=int, default=1000)
+    parser.add_argument('--scan-queries', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    trades = make_trades(args.trades, rng)
+    probes = [dict(rng.choice(trades)) for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    index = CandidateIndex(trades)
+    print(f"bulk load: {len(index)} trades in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    for probe in probes[:args.scan_queries]:
+        scan(trades, probe)
+    scan_ms = (time.perf_counter() - start) * 1000 / args.scan_queries
+
+    start = time.perf_counter()
+    for probe in probes:
+        indexed(index, probe)
+    index_ms = (time.perf_counter() - start) * 1000 / args.queries
+
+    print(f"{'lookup':<10} {'ms/query':>10}")
+    print(f"{'scan':<10} {scan_ms:>10.3f}")
+    print(f"{'index':<10} {index_ms:>10.3f}")
+    print(f"speedup: {scan_ms / index_ms:.0f}x")
+
+    extra = make_trades(args.queries, random.Random(7))
+    for trade in extra:
+        trade["trade_id"] = "NEW-" + trade["trade_id"]
+    start = time.perf_counter()
+    for trade in extra:
+        index.add_trade(trade)
+    for trade in extra:
+        index.remove_trade(trade["trade_id"])
+    churn_us = (time.perf_counter() - start) * 1e6 / (2 * len(extra))
+    print(f"insert/remove: {churn_us:.1f} us/op")
+
+
+if __name__ == '__main__':
+    main()
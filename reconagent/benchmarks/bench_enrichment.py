@@ -0,0 +1,95 @@
+"""
+Benchmark: enrichment round trips for a batch of breaks
+
+Enriches a synthetic batch against an in-process mock API server three ways:
+per-ID calls from concurrent breaks (the default), ``enrich_cases`` with one
+bulk lookup per source for the whole batch, and the per-ID calls again with
+``enrichment_batching_enabled`` turned on. Counts HTTP requests seen by the server.
+
+Usage:
+    python benchmarks/bench_enrichment.py [--breaks 1000] [--concurrency 16] [--latency-ms 2]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mock_server import start_mock_server
+from mcp.tools import enrichment_tools
+from mock_apis.main import ACCOUNTS, INSTRUMENTS, app
+from shared.config import settings
+
+
+request_count = 0
+
+
+@app.middleware("http")
+async def count_requests(request, call_next):
+    global request_count
+    request_count += 1
+    return await call_next(request)
+
+
+def make_breaks(count: int) -> list:
+    return [
+        {
+            "break_id": f"BRK-{i}",
+            "entities": {
+                "order_ids": [f"O{i}"],
+                "trade_ids": [f"T{i}"],
+                "account": random.choice(ACCOUNTS),
+                "instrument": random.choice(INSTRUMENTS)
+            }
+        }
+        for i in range(count)
+    ]
+
+
+def reset_caches():
+    enrichment_tools.account_data_cache.clear()
+    enrichment_tools.reference_data_cache.clear()
+
+
+def run(label: str, func):
+    global request_count
+    reset_caches()
+    request_count = 0
+    start = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - start
+    failed = sum(
+        1 for enriched in results for value in enriched.values() if "error" in value
+    )
+    print(f"{label:<28} {elapsed * 1000:>10.0f} {request_count:>9} {failed:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--breaks', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=16, help="Breaks enriched at once")
+    parser.add_argument('--latency-ms', type=float, default=2.0, help="Simulated server latency")
+    args = parser.parse_args()
+
+    start_mock_server(latency_ms=args.latency_ms)
+    breaks = make_breaks(args.breaks)
+
+    def concurrent_enrich_case():
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            return list(pool.map(enrichment_tools.enrich_case, breaks))
+
+    print(f"{'mode':<28} {'wall ms':>10} {'requests':>9} {'errors':>7}")
+
+    settings.enrichment_batching_enabled = False
+    run("per-ID calls", concurrent_enrich_case)
+    run("enrich_cases (bulk)", lambda: enrichment_tools.enrich_cases(breaks))
+
+    settings.enrichment_batching_enabled = True
+    run("micro-batched enrich_case", concurrent_enrich_case)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: connection reuse in the shared HTTP client
+
+Issues the same mix of downstream GETs the MCP tools make against an
+in-process mock API server, first with a bare ``requests.get`` per call
+(new TCP connection each time, as the tools used to do) and then through
+the pooled ``shared.http_client`` sync session and async client.
+
+Usage:
+    python benchmarks/bench_http_client.py [--calls 500] [--threads 1 8] [--latency-ms 0]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import requests
+
+from mock_server import start_mock_server
+from shared.http_client import HttpClient
+
+
+PATHS = [
+    "/api/oms/orders/O123456",
+    "/api/trade-capture/trades/T123456",
+    "/api/broker/confirms/T123456",
+    "/api/settlement/positions/ACC-12345",
+    "/api/custodian/holdings/ACC-12345",
+    "/api/reference-data/instrument/AAPL",
+]
+
+
+def urls(base_url: str, calls: int) -> list:
+    return [base_url + PATHS[i % len(PATHS)] for i in range(calls)]
+
+
+def run_unpooled(targets: list, threads: int) -> float:
+    def fetch(url):
+        response = requests.get(url, timeout=30)
+        response.raise_for_status()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(fetch, targets))
+    return time.perf_counter() - start
+
+
+def run_pooled(targets: list, threads: int) -> float:
+    client = HttpClient(pool_maxsize_per_host=max(threads, 1))
+
+    def fetch(url):
+        client.get("bench", url).raise_for_status()
+
+    # Open the pool's connections before timing, as a long-running process would have
+    fetch(targets[0])
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(fetch, targets))
+    elapsed = time.perf_counter() - start
+    client.close()
+    return elapsed
+
+
+def run_async(targets: list, concurrency: int) -> float:
+    async def main():
+        client = HttpClient(pool_maxsize_per_host=max(concurrency, 1))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url):
+            async with semaphore:
+                (await client.aget("bench", url)).raise_for_status()
+
+        await fetch(targets[0])
+        start = time.perf_counter()
+        await asyncio.gather(*(fetch(url) for url in targets))
+        elapsed = time.perf_counter() - start
+        await client.aclose()
+        return elapsed
+
+    return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=500)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Simulated server latency")
+    args = parser.parse_args()
+
+    base_url = start_mock_server(latency_ms=args.latency_ms)
+    targets = urls(base_url, args.calls)
+
+    print(f"{'threads':>7} {'unpooled req/s':>15} {'pooled req/s':>13} {'async req/s':>12} {'speedup':>8}")
+    for threads in args.threads:
+        unpooled = run_unpooled(targets, threads)
+        pooled = run_pooled(targets, threads)
+        async_elapsed = run_async(targets, threads)
+        print(
+            f"{threads:>7} {args.calls / unpooled:>15.0f} {args.calls / pooled:>13.0f} "
+            f"{args.calls / async_elapsed:>12.0f} {unpooled / pooled:>7.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
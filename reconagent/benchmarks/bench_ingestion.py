@@ -0,0 +1,56 @@
+"""
+Benchmark: materialized vs streaming break ingestion
+
+Ingests (normalize + validate) a backlog of breaks from an in-process mock
+API server three ways: the single-list ``/api/breaks`` endpoint, cursor
+pages and the NDJSON stream. Reports time to the first ingested break, total
+time and peak Python memory (tracemalloc, server and client together).
+
+Usage:
+    python benchmarks/bench_ingestion.py [--breaks 50000] [--page-size 500]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mock_server import start_mock_server
+from agents.break_ingestion_agent import BreakIngestionAgent
+from mcp.tools.break_tools import get_breaks, iter_breaks, stream_breaks
+
+
+def run(label: str, agent: BreakIngestionAgent, make_source):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first_ms = None
+    count = 0
+    for _ in agent.iter_ingested_breaks(breaks=make_source()):
+        if first_ms is None:
+            first_ms = (time.perf_counter() - start) * 1000
+        count += 1
+    total_s = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {count:>8} {first_ms:>10.1f} {total_s:>9.2f} {peak / 1e6:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--breaks', type=int, default=50000)
+    parser.add_argument('--page-size', type=int, default=500)
+    args = parser.parse_args()
+
+    start_mock_server()
+    agent = BreakIngestionAgent()
+
+    print(f"{'mode':<12} {'breaks':>8} {'first ms':>10} {'total s':>9} {'peak MB':>12}")
+    run("list", agent, lambda: get_breaks(limit=args.breaks))
+    run("pages", agent, lambda: iter_breaks(limit=args.breaks, page_size=args.page_size))
+    run("ndjson", agent, lambda: stream_breaks(limit=args.breaks))
+
+
+if __name__ == '__main__':
+    main()
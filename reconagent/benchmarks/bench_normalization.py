@@ -0,0 +1,60 @@
+"""
+Benchmark: break normalization and validation throughput
+
+Normalizes and validates synthetic breaks from the mock API generator two
+ways: the old Break model construct + model_dump followed by validate_break,
+and the single-pass TypeAdapter path (normalize_and_validate_break).
+
+Usage:
+    python benchmarks/bench_normalization.py [--breaks 100000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.tools.break_tools import normalize_and_validate_break, validate_break
+from mock_apis.main import backlog_break
+from shared.schemas import Break
+
+
+def model_round_trip(raw_breaks: list):
+    for raw in raw_breaks:
+        normalized = Break(**raw).model_dump()
+        validate_break(normalized)
+
+
+def single_pass(raw_breaks: list):
+    for raw in raw_breaks:
+        normalize_and_validate_break(raw)
+
+
+def best_of(func, raw_breaks: list, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(raw_breaks)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--breaks', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    raw_breaks = [backlog_break(index) for index in range(args.breaks)]
+
+    print(f"{'path':<22} {'seconds':>8} {'breaks/s':>10}")
+    baseline = best_of(model_round_trip, raw_breaks, args.repeat)
+    print(f"{'model + dump + check':<22} {baseline:>8.2f} {args.breaks / baseline:>10.0f}")
+    fast = best_of(single_pass, raw_breaks, args.repeat)
+    print(f"{'TypeAdapter one pass':<22} {fast:>8.2f} {args.breaks / fast:>10.0f}")
+    print(f"speedup: {baseline / fast:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
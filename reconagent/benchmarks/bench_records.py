@@ -0,0 +1,47 @@
+"""
+Benchmark: memory held by normalized breaks as dicts vs compact records
+
+Normalizes synthetic breaks from the mock API generator and keeps them all
+alive, once as the nested dicts returned by normalize_break and once as
+CompactBreak records. Reports traced bytes per break.
+
+Usage:
+    python benchmarks/bench_records.py [--breaks 100000]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.tools.break_tools import normalize_break
+from mock_apis.main import backlog_break
+from shared.records import compact_break
+
+
+def measure(label: str, raw_breaks: list, convert) -> None:
+    gc.collect()
+    tracemalloc.start()
+    kept = [convert(raw) for raw in raw_breaks]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {current / 1e6:>10.1f} {current / len(kept):>12.0f}")
+    del kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--breaks', type=int, default=100000)
+    args = parser.parse_args()
+
+    raw_breaks = [backlog_break(index) for index in range(args.breaks)]
+
+    print(f"{'records':<10} {'MB':>10} {'bytes/break':>12}")
+    measure("dict", raw_breaks, normalize_break)
+    measure("compact", raw_breaks, lambda raw: compact_break(normalize_break(raw)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: per-break vs vectorized business rules
+
+Evaluates AMOUNT_TOLERANCE, QUANTITY_TOLERANCE, CURRENCY_MATCH and
+TIMING_LAG for a batch of normalized mock breaks with apply_business_rules
++ validate_rules per break, and with apply_business_rules_many. The batch
+path then materializes full evaluations (with reason strings) only for the
+first ``--surfaced`` failed breaks, as a UI page or a ticket would.
+
+Usage:
+    python benchmarks/bench_rules.py [--breaks 100000] [--surfaced 100] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.tools.break_tools import normalize_break
+from mcp.tools.rules_tools import apply_business_rules, apply_business_rules_many, validate_rules
+from mock_apis.main import backlog_break
+
+
+def per_break(breaks: list) -> int:
+    failed = 0
+    for break_data in breaks:
+        failed += not validate_rules(apply_business_rules(break_data, {}))
+    return failed
+
+
+def batched(breaks: list, surfaced: int) -> int:
+    batch = apply_business_rules_many(breaks)
+    failed = (~batch.all_critical_rules_passed).nonzero()[0]
+    for idx in failed[:surfaced]:
+        batch.evaluation(idx)
+    return len(failed)
+
+
+def best_of(func, breaks: list, repeat: int):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(breaks)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--breaks', type=int, default=100000)
+    parser.add_argument('--surfaced', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    breaks = [normalize_break(backlog_break(index)) for index in range(args.breaks)]
+
+    print(f"{'path':<12} {'seconds':>8} {'breaks/s':>11} {'failed':>8}")
+    baseline, failed = best_of(per_break, breaks, args.repeat)
+    print(f"{'per break':<12} {baseline:>8.3f} {args.breaks / baseline:>11.0f} {failed:>8}")
+    fast, failed = best_of(lambda b: batched(b, args.surfaced), breaks, args.repeat)
+    print(f"{'batch':<12} {fast:>8.3f} {args.breaks / fast:>11.0f} {failed:>8}")
+    print(f"speedup: {baseline / fast:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
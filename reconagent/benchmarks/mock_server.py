@@ -0,0 +1,46 @@
+"""
+Helper to run the mock API server in-process for benchmarks
+"""
+import socket
+import threading
+import time
+
+import uvicorn
+
+from mock_apis.main import app
+from shared.config import settings
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_mock_server(latency_ms: float = 0.0) -> str:
+    """
+    Start the mock API server on a free port in a background thread
+
+    Args:
+        latency_ms: Simulated round-trip latency added to every response
+
+    Returns:
+        Base URL of the server (also written to settings.mock_api_base_url)
+    """
+    app.state.latency_ms = latency_ms
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.time() + 10
+    while not server.started:
+        if time.time() > deadline:
+            raise RuntimeError("Mock API server failed to start")
+        time.sleep(0.01)
+
+    base_url = f"http://127.0.0.1:{port}"
+    settings.mock_api_base_url = base_url
+    return base_url
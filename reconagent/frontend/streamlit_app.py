@@ -388,13 +388,16 @@ elif page == "📝 Review Queue":
             
             with col1:
                 if st.button("✅ Approve & Resolve", use_container_width=True, type="primary"):
-                    # Log feedback
+                    # Log feedback; approving confirms the predicted root cause,
+                    # so only this path feeds it back into the pattern store
                     from mcp.tools.workflow_tools import log_feedback
                     log_feedback(
                         break_id=break_data.get('break_id'),
                         decision=decision,
                         human_action="AUTO_RESOLVE",
-                        human_notes="Human approved agent recommendation"
+                        human_notes="Human approved agent recommendation",
+                        break_type=break_data.get('break_type'),
+                        root_cause=ml_insights.get('probable_root_cause')
                     )
                     st.success("✅ Case approved and resolved!")
                     # Remove from HIL queue
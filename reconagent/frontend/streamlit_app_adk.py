@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from orchestrator_adk.orchestrator import ADKReconciliationOrchestrator
 from orchestrator.v2 import DynamicReconciliationOrchestrator
+from shared.config import settings
 
 # Page config
 st.set_page_config(
@@ -36,6 +37,8 @@ if 'adk_orchestrator' not in st.session_state:
 if 'v2_orchestrator' not in st.session_state:
     try:
         st.session_state.v2_orchestrator = DynamicReconciliationOrchestrator()
+        if settings.reference_prewarm_on_startup:
+            st.session_state.v2_orchestrator.prewarm_reference_data()
     except:
         pass
 
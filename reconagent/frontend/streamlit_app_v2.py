@@ -14,6 +14,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from orchestrator.v2 import DynamicReconciliationOrchestrator
 from orchestrator.workflow import ReconciliationOrchestrator
+from shared.config import settings
 
 # Page config
 st.set_page_config(
@@ -26,6 +27,8 @@ st.set_page_config(
 # Initialize session state
 if 'orch_v2' not in st.session_state:
     st.session_state.orch_v2 = DynamicReconciliationOrchestrator()
+    if settings.reference_prewarm_on_startup:
+        st.session_state.orch_v2.prewarm_reference_data()
 if 'orch_v1' not in st.session_state:
     st.session_state.orch_v1 = ReconciliationOrchestrator()
 if 'v2_results' not in st.session_state:
@@ -567,11 +570,11 @@ elif page == "📖 Policy Viewer":
                 
                 with col1:
                     st.write("**Mandatory Agents:**")
-                    for agent in policy.get('mandatory_agents', []):
+                    for agent in policy.mandatory_agents:
                         st.write(f"- {agent}")
                     
                     st.write("**Optional Agents:**")
-                    optional = policy.get('optional_agents', [])
+                    optional = policy.optional_agents
                     if optional:
                         for agent in optional:
                             st.write(f"- {agent}")
@@ -580,13 +583,13 @@ elif page == "📖 Policy Viewer":
                 
                 with col2:
                     st.write("**Configuration:**")
-                    st.write(f"- Max Parallel: {policy.get('max_parallel', 3)}")
-                    st.write(f"- Early Exit: {'Enabled' if policy.get('early_exit_enabled') else 'Disabled'}")
-                    st.write(f"- Checkpoints: {len(policy.get('decision_checkpoints', []))}")
+                    st.write(f"- Max Parallel: {policy.max_parallel}")
+                    st.write(f"- Early Exit: {'Enabled' if policy.early_exit_enabled else 'Disabled'}")
+                    st.write(f"- Checkpoints: {len(policy.decision_checkpoints)}")
                 
                 # Show parallel groups
                 st.write("**Execution Order:**")
-                parallel_groups = policy.get('parallel_groups', [])
+                parallel_groups = policy.parallel_groups
                 for idx, group in enumerate(parallel_groups, 1):
                     if len(group) > 1:
                         st.write(f"Stage {idx}: {' || '.join(group)} (parallel)")
@@ -594,7 +597,7 @@ elif page == "📖 Policy Viewer":
                         st.write(f"Stage {idx}: {group[0]}")
                 
                 # Show checkpoints
-                checkpoints = policy.get('decision_checkpoints', [])
+                checkpoints = policy.decision_checkpoints
                 if checkpoints:
                     st.write("**Decision Checkpoints:**")
                     for cp in checkpoints:
@@ -0,0 +1,264 @@
+"""
+N:M aggregation matching for partial fills and block trades
+
+Finds the subset of candidate fills whose quantities (then amounts) sum
+closest to a break's target. Small candidate sets are searched exactly with
+meet-in-the-middle; larger ones with a greedy fill followed by a subset-sum
+DP over bucketed quantities. Both stop at a time budget and return the best
+aggregation found so far, and the candidate list is capped up front, so a
+break with hundreds of fills stays within the matching agent's latency.
+"""
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from shared.config import settings
+
+
+# Check the clock every this many inner iterations
+_CLOCK_INTERVAL = 1024
+
+# Subsets tied on quantity examined per meet-in-the-middle lookup
+_MAX_TIES = 64
+
+# Reachable DP buckets nearest the target that are re-scored exactly
+_DP_RECHECK = 8
+
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class _Search:
+    """Best-so-far state shared by the search strategies"""
+
+    def __init__(
+        self,
+        quantities: List[float],
+        amounts: List[Optional[float]],
+        target_quantity: float,
+        target_amount: Optional[float],
+        deadline: float
+    ):
+        self.quantities = quantities
+        self.amounts = amounts
+        self.target_quantity = target_quantity
+        self.target_amount = target_amount
+        self.deadline = deadline
+        self.best: Tuple[float, float, int] = (abs(target_quantity), self._amount_residual(()), 0)
+        self.best_subset: Tuple[int, ...] = ()
+        self.timed_out = False
+
+    def _amount_residual(self, subset: Sequence[int]) -> float:
+        if self.target_amount is None:
+            return 0.0
+        total = 0.0
+        for idx in subset:
+            if self.amounts[idx] is not None:
+                total += self.amounts[idx]
+        return abs(self.target_amount - total)
+
+    def offer(self, subset: Sequence[int]):
+        """Keep ``subset`` if it beats the best (quantity, amount, size) residual"""
+        quantity = sum(self.quantities[idx] for idx in subset)
+        key = (abs(self.target_quantity - quantity), self._amount_residual(subset), len(subset))
+        if key < self.best:
+            self.best = key
+            self.best_subset = tuple(sorted(subset))
+
+    def expired(self) -> bool:
+        if time.perf_counter() >= self.deadline:
+            self.timed_out = True
+        return self.timed_out
+
+
+def _subset_sums(quantities: List[float], indices: List[int]) -> List[Tuple[float, int]]:
+    """(sum, bitmask over ``indices``) for every subset"""
+    sums = [(0.0, 0)]
+    for bit, idx in enumerate(indices):
+        quantity = quantities[idx]
+        sums += [(total + quantity, mask | (1 << bit)) for total, mask in sums]
+    return sums
+
+
+def _meet_in_the_middle(search: _Search, indices: List[int]):
+    """Exact search over all subsets of ``indices`` in O(2^(n/2) log 2^(n/2))"""
+    half = len(indices) // 2
+    left_indices, right_indices = indices[:half], indices[half:]
+    left = _subset_sums(search.quantities, left_indices)
+    right = sorted(_subset_sums(search.quantities, right_indices))
+    right_totals = [total for total, _ in right]
+
+    def unpack(mask: int, members: List[int]) -> List[int]:
+        return [idx for bit, idx in enumerate(members) if mask >> bit & 1]
+
+    for step, (left_total, left_mask) in enumerate(left):
+        if step % _CLOCK_INTERVAL == 0 and search.expired():
+            return
+        want = search.target_quantity - left_total
+        pos = bisect_left(right_totals, want)
+        # Closest sums either side of the target, plus every subset tied
+        # with them (ties only differ in amount and size)
+        for near in (pos - 1, pos):
+            if not 0 <= near < len(right):
+                continue
+            near_total = right_totals[near]
+            if abs(want - near_total) > search.best[0]:
+                continue
+            lo = bisect_left(right_totals, near_total)
+            left_size = bin(left_mask).count("1")
+            for tie in range(lo, min(lo + _MAX_TIES, len(right))):
+                if right_totals[tie] != near_total:
+                    break
+                if search.target_amount is None and (
+                    abs(want - near_total), 0.0, left_size + bin(right[tie][1]).count("1")
+                ) >= search.best:
+                    continue
+                search.offer(
+                    unpack(left_mask, left_indices) + unpack(right[tie][1], right_indices)
+                )
+
+
+def _greedy(search: _Search, indices: List[int]):
+    """Largest fills first, taking each one that does not overshoot"""
+    remaining = search.target_quantity
+    subset = []
+    for idx in sorted(indices, key=lambda i: search.quantities[i], reverse=True):
+        if search.quantities[idx] <= remaining + 1e-9:
+            subset.append(idx)
+            remaining -= search.quantities[idx]
+    search.offer(subset)
+
+
+def _bucketed_dp(search: _Search, indices: List[int], buckets: int):
+    """
+    0/1 subset-sum DP with quantities rounded to ``target / buckets``
+
+    ``first_item[s]`` records the item that first made bucket ``s``
+    reachable; since every reachable ``s - w`` was reached by an earlier
+    item, walking back from any bucket reconstructs a valid subset.
+    """
+    resolution = search.target_quantity / buckets
+    limit = buckets + buckets // 10
+    weights = [int(round(search.quantities[idx] / resolution)) for idx in indices]
+
+    reachable = np.zeros(limit + 1, dtype=bool)
+    reachable[0] = True
+    first_item = np.full(limit + 1, -1, dtype=np.int32)
+    for position, weight in enumerate(weights):
+        if search.expired():
+            break
+        if weight <= 0 or weight > limit:
+            continue
+        newly = reachable[:-weight] & ~reachable[weight:]
+        first_item[weight:][newly] = position
+        reachable[weight:] |= newly
+
+    # Rounding can misorder buckets near the target, so check the few
+    # nearest ones on exact quantities
+    sums = np.flatnonzero(reachable)
+    nearest = sums[np.argsort(np.abs(sums - buckets), kind='stable')[:_DP_RECHECK]]
+    for bucket in nearest:
+        subset = []
+        while bucket > 0:
+            position = int(first_item[bucket])
+            subset.append(indices[position])
+            bucket -= weights[position]
+        search.offer(subset)
+
+
+def find_aggregation(
+    candidates: Sequence[Dict[str, Any]],
+    target_quantity: float,
+    target_amount: Optional[float] = None,
+    time_budget_ms: Optional[float] = None,
+    max_candidates: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Find the subset of candidates that best aggregates to a target
+
+    Candidates are ranked by quantity residual, then amount residual, then
+    number of fills. Candidates without a usable quantity, or whose quantity
+    alone exceeds the target by more than 10%, are skipped.
+
+    Args:
+        candidates: Match candidates (``data.quantity`` / ``data.amount``) or plain records
+        target_quantity: Quantity the fills should sum to (sign is ignored)
+        target_amount: Amount the fills should sum to, used to break ties
+        time_budget_ms: Search budget (defaults to settings.aggregation_time_budget_ms)
+        max_candidates: Candidate cap (defaults to settings.aggregation_max_candidates)
+
+    Returns:
+        Best aggregation: candidate ids, sums, residuals, method and whether
+        the search completed within budget
+    """
+    start = time.perf_counter()
+    if time_budget_ms is None:
+        time_budget_ms = settings.aggregation_time_budget_ms
+    if max_candidates is None:
+        max_candidates = settings.aggregation_max_candidates
+
+    target_quantity = abs(float(target_quantity))
+    if target_amount is not None:
+        target_amount = abs(float(target_amount))
+
+    records, quantities, amounts = [], [], []
+    for candidate in candidates:
+        data = candidate.get("data", candidate)
+        quantity = _as_float(data.get("quantity"))
+        if not quantity or abs(quantity) > target_quantity * 1.1:
+            continue
+        amount = _as_float(data.get("amount"))
+        records.append(candidate)
+        quantities.append(abs(quantity))
+        amounts.append(abs(amount) if amount is not None else None)
+
+    considered = len(records)
+    if considered > max_candidates:
+        # Keep the most similar candidates (records without a score keep their order)
+        keep = sorted(
+            range(considered),
+            key=lambda i: -float(records[i].get("similarity_score", 0.0))
+        )[:max_candidates]
+        keep.sort()
+        records = [records[i] for i in keep]
+        quantities = [quantities[i] for i in keep]
+        amounts = [amounts[i] for i in keep]
+
+    search = _Search(quantities, amounts, target_quantity, target_amount,
+                     start + time_budget_ms / 1000.0)
+    indices = list(range(len(records)))
+    if not indices or target_quantity == 0:
+        method = "none"
+    elif len(indices) <= settings.aggregation_exact_max_candidates:
+        method = "meet_in_the_middle"
+        _greedy(search, indices)
+        _meet_in_the_middle(search, indices)
+    else:
+        method = "greedy_dp"
+        _greedy(search, indices)
+        _bucketed_dp(search, indices, settings.aggregation_dp_buckets)
+
+    subset = search.best_subset
+    quantity = sum(quantities[idx] for idx in subset)
+    amount = sum(amounts[idx] for idx in subset if amounts[idx] is not None)
+    return {
+        "candidate_ids": [
+            records[idx].get("candidate_id") or records[idx].get("trade_id") for idx in subset
+        ],
+        "num_fills": len(subset),
+        "aggregated_quantity": quantity,
+        "aggregated_amount": amount,
+        "residual_quantity": target_quantity - quantity,
+        "residual_amount": target_amount - amount if target_amount is not None else None,
+        "method": method,
+        "candidates_considered": considered,
+        "candidates_searched": len(indices),
+        "complete": not search.timed_out and considered <= max_candidates,
+        "elapsed_ms": (time.perf_counter() - start) * 1000
+    }
@@ -1,10 +1,16 @@
 """
 MCP Tools for Break Ingestion Agent
 """
-import requests
-from typing import List, Dict, Any
+import copy
+import json
+from functools import partial
+from typing import List, Dict, Any, Callable, Iterator, Tuple, Type
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from shared.config import settings
-from shared.schemas import Break, BreakType
+from shared.http_client import http_client
+from shared.schemas import (
+    Break, BreakType, BreakEntities, BreakRecord, SystemData
+)
 
 
 def get_breaks(limit: int = 10, break_type: str = None) -> List[Dict[str, Any]]:
@@ -23,10 +29,10 @@ def get_breaks(limit: int = 10, break_type: str = None) -> List[Dict[str, Any]]:
         params["break_type"] = break_type
     
     try:
-        response = requests.get(
+        response = http_client.get(
+            "breaks",
             f"{settings.mock_api_base_url}/api/breaks",
-            params=params,
-            timeout=settings.agent_timeout_seconds
+            params=params
         )
         response.raise_for_status()
         return response.json()
@@ -45,9 +51,9 @@ def get_break_by_id(break_id: str) -> Dict[str, Any]:
         Break record
     """
     try:
-        response = requests.get(
-            f"{settings.mock_api_base_url}/api/breaks/{break_id}",
-            timeout=settings.agent_timeout_seconds
+        response = http_client.get(
+            "breaks",
+            f"{settings.mock_api_base_url}/api/breaks/{break_id}"
         )
         response.raise_for_status()
         return response.json()
@@ -55,6 +61,143 @@ def get_break_by_id(break_id: str) -> Dict[str, Any]:
         return {"error": f"Failed to fetch break {break_id}: {str(e)}"}
 
 
+def iter_breaks(limit: int = 1000, break_type: str = None, page_size: int = None) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over breaks page by page using cursor pagination
+    
+    Only one page is held in memory at a time.
+    
+    Args:
+        limit: Number of breaks to fetch
+        break_type: Optional filter by break type
+        page_size: Breaks per request (defaults to settings)
+    
+    Yields:
+        Break records
+    
+    Raises:
+        requests.HTTPError: If a page request fails
+    """
+    params = {"limit": limit, "page_size": page_size or settings.break_page_size}
+    if break_type:
+        params["break_type"] = break_type
+    
+    cursor = None
+    while True:
+        if cursor:
+            params["cursor"] = cursor
+        response = http_client.get("breaks", f"{settings.mock_api_base_url}/api/breaks/page", params=params)
+        response.raise_for_status()
+        page = response.json()
+        yield from page["breaks"]
+        cursor = page.get("next_cursor")
+        if not cursor:
+            return
+
+
+def stream_breaks(limit: int = 1000, break_type: str = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream breaks from the NDJSON endpoint as they arrive
+    
+    Args:
+        limit: Number of breaks to fetch
+        break_type: Optional filter by break type
+    
+    Yields:
+        Break records
+    
+    Raises:
+        requests.HTTPError: If the request fails
+    """
+    params = {"limit": limit}
+    if break_type:
+        params["break_type"] = break_type
+    
+    for line in http_client.iter_lines("breaks", f"{settings.mock_api_base_url}/api/breaks/stream", params=params):
+        yield json.loads(line)
+
+
+# Compiled once; validates straight to a dict instead of a Break instance
+_break_adapter = TypeAdapter(BreakRecord)
+
+
+def _defaults(model: Type[BaseModel]) -> List[Tuple[str, Callable[[], Any]]]:
+    """(field name, default maker) for each optional field of a model"""
+    defaults = []
+    for name, field in model.model_fields.items():
+        if field.is_required():
+            continue
+        if field.default_factory is not None:
+            make = field.default_factory
+        elif isinstance(field.default, (dict, list, set)):
+            # Fresh container per record, as pydantic copies mutable defaults
+            make = type(field.default) if not field.default else partial(copy.deepcopy, field.default)
+        else:
+            make = partial(lambda value: value, field.default)
+        defaults.append((name, make))
+    return defaults
+
+
+_BREAK_DEFAULTS = _defaults(Break)
+_SYSTEM_DEFAULTS = _defaults(SystemData)
+_ENTITY_DEFAULTS = _defaults(BreakEntities)
+
+
+def _fill_defaults(record: Dict[str, Any], defaults: List[Tuple[str, Callable[[], Any]]]):
+    for name, make in defaults:
+        if name not in record:
+            record[name] = make()
+
+
+def normalize_and_validate_break(raw_break: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a raw break and check its completeness in one pass
+    
+    Produces the same record as ``Break(**raw_break).model_dump()`` but
+    validates with a precompiled TypeAdapter over plain dicts, then fills
+    model defaults and computes the ``validate_break`` flags from the result.
+    
+    Args:
+        raw_break: Raw break data
+    
+    Returns:
+        {"break_data": normalized break, "validation": validation flags},
+        or an error entry if the break does not match the schema
+    """
+    try:
+        record = _break_adapter.validate_python(raw_break)
+    except ValidationError as e:
+        return {"error": f"Failed to normalize break: {str(e)}", "raw_data": raw_break}
+    
+    _fill_defaults(record, _BREAK_DEFAULTS)
+    system_a = record["system_a"]
+    system_b = record["system_b"]
+    entities = record["entities"]
+    _fill_defaults(system_a, _SYSTEM_DEFAULTS)
+    _fill_defaults(system_b, _SYSTEM_DEFAULTS)
+    _fill_defaults(entities, _ENTITY_DEFAULTS)
+    
+    # break_id, break_type, system names and instrument are required by the
+    # schema, so only emptiness can fail here
+    validations = {
+        "has_break_id": bool(record["break_id"]),
+        "has_break_type": True,
+        "has_system_a": True,
+        "has_system_b": True,
+        "has_entities": True,
+        "has_instrument": bool(entities["instrument"]),
+        "system_a_has_amount": system_a["amount"] is not None,
+        "system_b_has_amount": system_b["amount"] is not None,
+    }
+    validations["is_valid"] = all(validations.values())
+    
+    # Normalized order matches Break field order
+    return {
+        "break_data": {name: record[name] for name in Break.model_fields},
+        "validation": validations
+    }
+
+
 def normalize_break(raw_break: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalize raw break data to standard schema
@@ -65,12 +208,8 @@ def normalize_break(raw_break: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Normalized break data
     """
-    try:
-        # Validate and normalize using Pydantic schema
-        break_obj = Break(**raw_break)
-        return break_obj.model_dump()
-    except Exception as e:
-        return {"error": f"Failed to normalize break: {str(e)}", "raw_data": raw_break}
+    result = normalize_and_validate_break(raw_break)
+    return result.get("break_data", result)
 
 
 def validate_break(break_data: Dict[str, Any]) -> Dict[str, bool]:
@@ -122,6 +261,13 @@ BREAK_TOOLS = {
             "raw_break": {"type": "object", "description": "Raw break data"}
         }
     },
+    "normalize_and_validate_break": {
+        "function": normalize_and_validate_break,
+        "description": "Normalize raw break data and validate completeness in one pass",
+        "parameters": {
+            "raw_break": {"type": "object", "description": "Raw break data"}
+        }
+    },
     "validate_break": {
         "function": validate_break,
         "description": "Validate break data completeness",
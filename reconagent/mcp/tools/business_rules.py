@@ -0,0 +1,321 @@
+"""
+Business-rule DSL for the Rules & Tolerance agent
+
+Rule sets are declared in ``orchestrator/v2/policies/business_rules.yaml``
+(next to the routing policies) per break type and asset class, with
+optional per-counterparty overrides. Loading validates every rule and
+compiles the file into a decision table keyed by (break_type, asset_class),
+so evaluating a break is one lookup followed by only the rules that apply
+to it. The file is reloaded when it changes on disk; an invalid file is
+rejected and the previous rule sets stay in force.
+"""
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+import yaml
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from shared.config import settings
+
+
+RULES_FILE = Path(__file__).resolve().parents[2] / "orchestrator" / "v2" / "policies" / "business_rules.yaml"
+
+# Rule names, in evaluation order; a rule's bit in RulesBatch bitsets is
+# its position here
+RULE_NAMES = ["AMOUNT_TOLERANCE", "QUANTITY_TOLERANCE", "CURRENCY_MATCH", "TIMING_LAG"]
+
+DEFAULT_KEY = "DEFAULT"
+
+
+class RuleLoadError(ValueError):
+    """Raised when a business-rule file cannot be parsed or validated"""
+
+
+class RuleSpec(BaseModel):
+    """One rule as written in the YAML file"""
+
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
+    rule: Literal["AMOUNT_TOLERANCE", "QUANTITY_TOLERANCE", "CURRENCY_MATCH", "TIMING_LAG"]
+    critical: bool = False
+    # Tolerance rules; None falls back to the Settings defaults
+    tolerance_bps: Optional[float] = None
+    tolerance_abs: Optional[float] = None
+    # TIMING_LAG; None accepts any lag
+    max_lag_days: Optional[float] = None
+
+    @property
+    def bit(self) -> int:
+        return 1 << RULE_NAMES.index(self.rule)
+
+
+class RuleSet:
+    """
+    Compiled rules for one decision-table cell (and counterparty)
+
+    Rules are kept in RULE_NAMES order, so evaluation output lists rules in
+    the same order whatever order the file declares them in.
+    """
+
+    __slots__ = ('key', 'rules', 'critical_rules', 'applied_mask', 'critical_mask')
+
+    def __init__(self, key: Tuple[str, ...], rules: List[RuleSpec]):
+        self.key = key
+        self.rules: Tuple[RuleSpec, ...] = tuple(sorted(rules, key=lambda r: RULE_NAMES.index(r.rule)))
+        self.critical_rules: List[str] = [r.rule for r in self.rules if r.critical]
+        self.applied_mask = sum(r.bit for r in self.rules)
+        self.critical_mask = sum(r.bit for r in self.rules if r.critical)
+
+    def rule(self, name: str) -> Optional[RuleSpec]:
+        for spec in self.rules:
+            if spec.rule == name:
+                return spec
+        return None
+
+    def __repr__(self) -> str:
+        return f"RuleSet({'/'.join(self.key)}: {', '.join(r.rule for r in self.rules)})"
+
+
+class _Cell:
+    __slots__ = ('rule_set', 'counterparties')
+
+    def __init__(self, rule_set: RuleSet, counterparties: Dict[str, RuleSet]):
+        self.rule_set = rule_set
+        self.counterparties = counterparties
+
+
+# Rules used when the file has no DEFAULT/DEFAULT cell: the checks
+# apply_business_rules has always made
+BUILTIN_RULE_SET = RuleSet((DEFAULT_KEY, DEFAULT_KEY), [
+    RuleSpec(rule="AMOUNT_TOLERANCE", critical=True),
+    RuleSpec(rule="QUANTITY_TOLERANCE"),
+    RuleSpec(rule="CURRENCY_MATCH", critical=True),
+    RuleSpec(rule="TIMING_LAG"),
+])
+
+
+class RuleSnapshot:
+    """One loaded version of the rule file (never modified once built)"""
+
+    __slots__ = ('version', 'mtime', 'table')
+
+    def __init__(self, version: int, mtime: Optional[int], table: Dict[Tuple[str, str], _Cell]):
+        self.version = version
+        self.mtime = mtime
+        self.table = table
+
+    def lookup(self, break_type: str, asset_class: str, counterparty: str = None) -> RuleSet:
+        table = self.table
+        cell = (
+            table.get((break_type, asset_class))
+            or table.get((break_type, DEFAULT_KEY))
+            or table.get((DEFAULT_KEY, asset_class))
+            or table.get((DEFAULT_KEY, DEFAULT_KEY))
+        )
+        if cell is None:
+            return BUILTIN_RULE_SET
+        if counterparty and cell.counterparties:
+            return cell.counterparties.get(counterparty, cell.rule_set)
+        return cell.rule_set
+
+
+def _parse_rules(where: str, entries: Any) -> List[RuleSpec]:
+    if not isinstance(entries, list):
+        raise TypeError(f"{where}: rules must be a list, got {type(entries).__name__}")
+    specs = [RuleSpec(**entry) for entry in entries]
+    names = [spec.rule for spec in specs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"{where}: duplicate rules {duplicates}")
+    return specs
+
+
+def compile_rules(data: Dict[str, Any]) -> Dict[Tuple[str, str], _Cell]:
+    """
+    Compile a parsed rule file into the decision table
+
+    Args:
+        data: Parsed YAML (``{"rule_sets": {break_type: {asset_class: ...}}}``)
+
+    Returns:
+        (break_type, asset_class) -> compiled cell
+
+    Raises:
+        RuleLoadError: If the file or any rule set is invalid
+    """
+    if not isinstance(data, dict):
+        raise RuleLoadError(f"Invalid business rules: expected a mapping, got {type(data).__name__}")
+    rule_sets = data.get('rule_sets') or {}
+    if not isinstance(rule_sets, dict):
+        raise RuleLoadError(
+            f"Invalid business rules: rule_sets must be a mapping, got {type(rule_sets).__name__}"
+        )
+
+    table = {}
+    errors = []
+    for break_type, asset_classes in rule_sets.items():
+        if not isinstance(asset_classes or {}, dict):
+            errors.append(f"{break_type}: asset classes must be a mapping, got {type(asset_classes).__name__}")
+            continue
+        for asset_class, config in (asset_classes or {}).items():
+            where = f"{break_type}/{asset_class}"
+            try:
+                if not isinstance(config, dict):
+                    raise TypeError(f"rule set must be a mapping, got {type(config).__name__}")
+                unknown = set(config) - {'rules', 'counterparties'}
+                if unknown:
+                    raise ValueError(f"unknown keys {sorted(unknown)}")
+                base = _parse_rules(where, config.get('rules') or [])
+
+                # Counterparty rules replace the base rule of the same name
+                counterparties = {}
+                overrides_by_counterparty = config.get('counterparties') or {}
+                if not isinstance(overrides_by_counterparty, dict):
+                    raise TypeError(
+                        f"counterparties must be a mapping, got {type(overrides_by_counterparty).__name__}"
+                    )
+                for counterparty, override in overrides_by_counterparty.items():
+                    if not isinstance(override or {}, dict):
+                        raise TypeError(
+                            f"{counterparty}: override must be a mapping, got {type(override).__name__}"
+                        )
+                    overrides = _parse_rules(f"{where}/{counterparty}", (override or {}).get('rules') or [])
+                    merged = {spec.rule: spec for spec in base}
+                    merged.update((spec.rule, spec) for spec in overrides)
+                    counterparties[counterparty] = RuleSet(
+                        (break_type, asset_class, counterparty), list(merged.values())
+                    )
+
+                table[(break_type, asset_class)] = _Cell(RuleSet((break_type, asset_class), base), counterparties)
+            except (ValidationError, TypeError, ValueError) as e:
+                errors.append(f"{where}: {e}")
+
+    if errors:
+        raise RuleLoadError("Invalid business rules:\n" + "\n".join(errors))
+    return table
+
+
+class BusinessRuleLoader:
+    """
+    Loads the business-rule file and keeps its decision table current
+
+    Like the routing PolicyLoader, changes are picked up by polling the
+    file's mtime (at most once per ``settings.policy_reload_check_seconds``)
+    and swapping in a new snapshot, so readers need no lock.
+    """
+
+    def __init__(self, rules_file: str = None):
+        """
+        Initialize loader
+
+        Args:
+            rules_file: Path to the YAML rule file (defaults to RULES_FILE)
+
+        Raises:
+            RuleLoadError: If the rule file is malformed or invalid
+        """
+        self.rules_file = RULES_FILE if rules_file is None else rules_file
+        self._reload_lock = threading.Lock()
+        self._rejected_mtime = None
+        self._last_check = time.monotonic()
+
+        try:
+            self._snapshot = self._load_snapshot(version=1)
+        except FileNotFoundError:
+            print(f"Warning: Business rule file not found: {self.rules_file}")
+            self._snapshot = RuleSnapshot(1, None, {})
+
+    @property
+    def version(self) -> int:
+        """Version of the rule sets currently in force"""
+        return self._snapshot.version
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.rules_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load_snapshot(self, version: int) -> RuleSnapshot:
+        """
+        Parse and compile the rule file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            RuleLoadError: If the file is malformed or any rule set is invalid
+        """
+        mtime = self._file_mtime()
+        try:
+            with open(self.rules_file, 'r') as f:
+                data = yaml.safe_load(f) or {}
+        except yaml.YAMLError as e:
+            raise RuleLoadError(f"Error parsing rule file {self.rules_file}: {e}")
+        return RuleSnapshot(version, mtime, compile_rules(data))
+
+    def reload(self) -> bool:
+        """
+        Reload and validate the rule file, swapping it in if valid
+
+        Returns:
+            True if new rule sets are now in force
+        """
+        with self._reload_lock:
+            current = self._snapshot
+            try:
+                snapshot = self._load_snapshot(version=current.version + 1)
+            except Exception as e:
+                # Whatever is wrong with the file, keep the rule sets in force
+                # and do not re-read it until it changes again
+                self._rejected_mtime = self._file_mtime()
+                print(f"Error reloading business rules, keeping version {current.version}: {e}")
+                return False
+
+            self._snapshot = snapshot
+            self._rejected_mtime = None
+            print(f"Reloaded business rules {self.rules_file} (version {snapshot.version})")
+            return True
+
+    def reload_if_changed(self, force_check: bool = False) -> bool:
+        """
+        Reload the rule file if it changed on disk
+
+        Args:
+            force_check: Stat the file now instead of waiting for the check interval
+
+        Returns:
+            True if the rule sets were reloaded
+        """
+        now = time.monotonic()
+        if not force_check and now - self._last_check < settings.policy_reload_check_seconds:
+            return False
+        self._last_check = now
+        mtime = self._file_mtime()
+        if mtime is None or mtime == self._snapshot.mtime or mtime == self._rejected_mtime:
+            return False
+        return self.reload()
+
+    def rule_set(self, break_type: str, asset_class: str = None, counterparty: str = None) -> RuleSet:
+        """
+        Rules that apply to a break
+
+        Args:
+            break_type: Break type
+            asset_class: Asset class of the instrument (DEFAULT if unknown)
+            counterparty: Counterparty, for counterparty overrides
+
+        Returns:
+            Rule set for (break_type, asset_class), falling back to the
+            break type's DEFAULT asset class, then DEFAULT break type
+        """
+        self.reload_if_changed()
+        return self._snapshot.lookup(break_type or DEFAULT_KEY, asset_class or DEFAULT_KEY, counterparty)
+
+    def list_rule_sets(self) -> List[Tuple[str, str]]:
+        """(break_type, asset_class) cells in the decision table"""
+        return list(self._snapshot.table)
+
+
+business_rules = BusinessRuleLoader()
@@ -0,0 +1,262 @@
+"""
+Blocking index over the pool of open (unmatched) trades
+
+Trades are grouped into blocks by (instrument, currency, trade date); each
+block keeps its quantities and amounts in sorted arrays, so finding the
+trades within a tolerance of a break is two bisects plus a scan of the
+hits, instead of scoring every trade in the pool.
+"""
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+BlockKey = Tuple[str, Optional[str], Optional[str]]
+
+
+def trade_date_key(value: Any) -> Optional[str]:
+    """ISO date for a date, datetime or ISO timestamp string (None if missing)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)[:10] or None
+
+
+class _SortedColumn:
+    """Values kept sorted, with the trade id at the same position"""
+
+    __slots__ = ('values', 'ids')
+
+    def __init__(self):
+        self.values: List[float] = []
+        self.ids: List[str] = []
+
+    def insert(self, value: float, trade_id: str):
+        pos = bisect_right(self.values, value)
+        self.values.insert(pos, value)
+        self.ids.insert(pos, trade_id)
+
+    def remove(self, value: float, trade_id: str):
+        lo = bisect_left(self.values, value)
+        hi = bisect_right(self.values, value, lo)
+        for pos in range(lo, hi):
+            if self.ids[pos] == trade_id:
+                del self.values[pos]
+                del self.ids[pos]
+                return
+
+    def rebuild(self, pairs: List[Tuple[float, str]]):
+        pairs.sort()
+        self.values = [value for value, _ in pairs]
+        self.ids = [trade_id for _, trade_id in pairs]
+
+    def between(self, low: float, high: float) -> List[str]:
+        lo = bisect_left(self.values, low)
+        hi = bisect_right(self.values, high, lo)
+        return self.ids[lo:hi]
+
+
+class _Block:
+    __slots__ = ('quantity', 'amount')
+
+    def __init__(self):
+        self.quantity = _SortedColumn()
+        self.amount = _SortedColumn()
+
+
+class CandidateIndex:
+    """
+    Open trades indexed for tolerance range queries
+
+    Trades are dicts with at least ``trade_id``, ``instrument``, ``quantity``
+    and ``amount``; ``currency`` and ``trade_date`` (date, datetime or ISO
+    string) complete the block key. Inserts and removals are incremental so
+    the pool can follow trades as breaks resolve.
+    """
+
+    def __init__(self, trades: Iterable[Dict[str, Any]] = None):
+        """
+        Initialize index
+
+        Args:
+            trades: Initial open trades (bulk-loaded)
+        """
+        self._trades: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, BlockKey] = {}
+        self._blocks: Dict[BlockKey, _Block] = {}
+        self._lock = threading.RLock()
+        if trades is not None:
+            self.add_trades(trades)
+
+    @staticmethod
+    def block_key(instrument: str, currency: Optional[str], trade_date: Any) -> BlockKey:
+        """Block for an instrument, currency and trade date"""
+        return (instrument, currency, trade_date_key(trade_date))
+
+    def _key_for(self, trade: Dict[str, Any]) -> BlockKey:
+        return self.block_key(trade["instrument"], trade.get("currency"), trade.get("trade_date"))
+
+    def add_trade(self, trade: Dict[str, Any]):
+        """
+        Add or replace one open trade
+
+        Args:
+            trade: Trade record (see class docstring for required fields)
+        """
+        trade_id = trade["trade_id"]
+        quantity = float(trade["quantity"])
+        amount = float(trade["amount"])
+        with self._lock:
+            if trade_id in self._trades:
+                self.remove_trade(trade_id)
+            key = self._key_for(trade)
+            block = self._blocks.get(key)
+            if block is None:
+                block = self._blocks[key] = _Block()
+            block.quantity.insert(quantity, trade_id)
+            block.amount.insert(amount, trade_id)
+            self._trades[trade_id] = trade
+            self._keys[trade_id] = key
+
+    def add_trades(self, trades: Iterable[Dict[str, Any]]) -> int:
+        """
+        Bulk-load open trades, sorting each touched block once
+
+        A trade id repeated within the load keeps its last record. Every
+        record is validated before the index changes, so a bad trade
+        leaves the index as it was.
+
+        Args:
+            trades: Trade records
+
+        Returns:
+            Number of distinct trades added or replaced
+        """
+        with self._lock:
+            latest: Dict[str, Tuple[Dict[str, Any], BlockKey, float, float]] = {}
+            for trade in trades:
+                latest[trade["trade_id"]] = (
+                    trade, self._key_for(trade), float(trade["quantity"]), float(trade["amount"])
+                )
+
+            for trade_id in latest:
+                if trade_id in self._trades:
+                    self.remove_trade(trade_id)
+
+            pending: Dict[BlockKey, List[Tuple[str, float, float]]] = {}
+            for trade_id, (trade, key, quantity, amount) in latest.items():
+                self._trades[trade_id] = trade
+                self._keys[trade_id] = key
+                pending.setdefault(key, []).append((trade_id, quantity, amount))
+
+            for key, new_trades in pending.items():
+                block = self._blocks.get(key)
+                if block is None:
+                    block = self._blocks[key] = _Block()
+                quantities = list(zip(block.quantity.values, block.quantity.ids))
+                quantities.extend((quantity, trade_id) for trade_id, quantity, _ in new_trades)
+                block.quantity.rebuild(quantities)
+                amounts = list(zip(block.amount.values, block.amount.ids))
+                amounts.extend((amount, trade_id) for trade_id, _, amount in new_trades)
+                block.amount.rebuild(amounts)
+        return len(latest)
+
+    def remove_trade(self, trade_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Remove a trade from the pool (e.g. once its break is resolved)
+
+        Args:
+            trade_id: Trade to remove
+
+        Returns:
+            The removed trade, or None if it was not in the pool
+        """
+        with self._lock:
+            trade = self._trades.pop(trade_id, None)
+            if trade is None:
+                return None
+            key = self._keys.pop(trade_id)
+            block = self._blocks[key]
+            block.quantity.remove(float(trade["quantity"]), trade_id)
+            block.amount.remove(float(trade["amount"]), trade_id)
+            if not block.quantity.values:
+                del self._blocks[key]
+            return trade
+
+    def get(self, trade_id: str) -> Optional[Dict[str, Any]]:
+        """Trade by id, if it is in the pool"""
+        return self._trades.get(trade_id)
+
+    def __len__(self) -> int:
+        return len(self._trades)
+
+    def __contains__(self, trade_id: str) -> bool:
+        return trade_id in self._trades
+
+    def search(
+        self,
+        instrument: str,
+        currency: Optional[str] = None,
+        trade_date: Any = None,
+        quantity: Optional[float] = None,
+        amount: Optional[float] = None,
+        tolerance_pct: float = 0.10,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Open trades in one block whose quantity and/or amount are within tolerance
+
+        Args:
+            instrument: Instrument of the break
+            currency: Currency of the break
+            trade_date: Trade date of the break
+            quantity: Break quantity (ignored if None)
+            amount: Break amount (ignored if None)
+            tolerance_pct: Relative tolerance, as a fraction of the break value
+            limit: Maximum trades returned
+
+        Returns:
+            Matching trades, closest quantity (or amount) first
+        """
+        with self._lock:
+            block = self._blocks.get(self.block_key(instrument, currency, trade_date))
+            if block is None:
+                return []
+
+            ranges = []
+            if quantity is not None:
+                ranges.append((block.quantity, "quantity", float(quantity)))
+            if amount is not None:
+                ranges.append((block.amount, "amount", float(amount)))
+            if not ranges:
+                trade_ids = list(block.quantity.ids)
+            else:
+                # Range-query each column; scan the smaller hit list and
+                # check the other bound directly on the trades
+                hits = []
+                for column, field, target in ranges:
+                    margin = abs(target) * tolerance_pct
+                    hits.append((column.between(target - margin, target + margin), field, target))
+                hits.sort(key=lambda hit: len(hit[0]))
+                trade_ids = hits[0][0]
+                for _, field, target in hits[1:]:
+                    margin = abs(target) * tolerance_pct
+                    trade_ids = [
+                        trade_id for trade_id in trade_ids
+                        if abs(float(self._trades[trade_id][field]) - target) <= margin
+                    ]
+
+            trades = [self._trades[trade_id] for trade_id in trade_ids]
+
+        if ranges:
+            _, field, target = ranges[0]
+            trades.sort(key=lambda trade: abs(float(trade[field]) - target))
+        return trades[:limit] if limit is not None else trades
+
+
+# Pool of open trades searched by find_match_candidates
+open_trade_index = CandidateIndex()
@@ -1,17 +1,75 @@
 """
 MCP Tools for Data Enrichment Agent
 """
-import requests
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from shared.batching import MicroBatcher
+from shared.cache import MISSING, TTLCache, reference_data_cache
 from shared.config import settings
+from shared.http_client import http_client
+
+
+# (source, account) -> settlement positions / custodian holdings. Many breaks
+# in a batch share an account, so these payloads are coalesced and cached
+# briefly rather than refetched per break. Every caller gets its own copy.
+account_data_cache = TTLCache(
+    max_size=settings.account_cache_size,
+    ttl_seconds=settings.account_cache_ttl_seconds,
+    max_bytes=settings.account_cache_max_bytes,
+    name="account_data",
+    copy_values=True
+)
+
+# When the full instrument universe was last loaded (time.monotonic())
+_last_full_prewarm: Optional[float] = None
+
+
+def _bulk_fetch(api: str, path: str) -> Callable[[List[str]], Dict[str, Any]]:
+    """Bulk lookup against a POST ``{"ids": [...]}`` endpoint, for a MicroBatcher"""
+    def fetch_many(ids: List[str]) -> Dict[str, Any]:
+        response = http_client.post(api, f"{settings.mock_api_base_url}{path}", json={"ids": ids})
+        response.raise_for_status()
+        return response.json()["results"]
+    return fetch_many
+
+
+# Per-source batchers: lookups from concurrent breaks within a few
+# milliseconds of each other go out as one bulk call. The single-ID tools
+# only use them when settings.enrichment_batching_enabled is on; the bulk
+# lookups behind enrich_cases always do
+oms_batcher = MicroBatcher(_bulk_fetch("oms", "/api/oms/orders/bulk"), name="oms")
+trade_capture_batcher = MicroBatcher(
+    _bulk_fetch("trade_capture", "/api/trade-capture/trades/bulk"), name="trade_capture"
+)
+broker_batcher = MicroBatcher(_bulk_fetch("broker", "/api/broker/confirms/bulk"), name="broker")
+settlement_batcher = MicroBatcher(
+    _bulk_fetch("settlement", "/api/settlement/positions/bulk"), name="settlement"
+)
+custodian_batcher = MicroBatcher(
+    _bulk_fetch("custodian", "/api/custodian/holdings/bulk"), name="custodian"
+)
+reference_data_batcher = MicroBatcher(
+    _bulk_fetch("reference_data", "/api/reference-data/instruments/bulk"), name="reference_data"
+)
+
+
+def _batched(batcher: MicroBatcher, key: str) -> Dict[str, Any]:
+    data = batcher.get(key, timeout=http_client.timeout_seconds)
+    if data is None:
+        raise LookupError(f"{key} missing from bulk response")
+    return data
 
 
 def get_oms_data(order_id: str) -> Dict[str, Any]:
     """Fetch OMS order data"""
     try:
-        response = requests.get(
-            f"{settings.mock_api_base_url}/api/oms/orders/{order_id}",
-            timeout=settings.agent_timeout_seconds
+        if settings.enrichment_batching_enabled:
+            return _batched(oms_batcher, order_id)
+        response = http_client.get(
+            "oms",
+            f"{settings.mock_api_base_url}/api/oms/orders/{order_id}"
         )
         response.raise_for_status()
         return response.json()
@@ -22,9 +80,11 @@ def get_oms_data(order_id: str) -> Dict[str, Any]:
 def get_trade_capture(trade_id: str) -> Dict[str, Any]:
     """Fetch trade capture data"""
     try:
-        response = requests.get(
-            f"{settings.mock_api_base_url}/api/trade-capture/trades/{trade_id}",
-            timeout=settings.agent_timeout_seconds
+        if settings.enrichment_batching_enabled:
+            return _batched(trade_capture_batcher, trade_id)
+        response = http_client.get(
+            "trade_capture",
+            f"{settings.mock_api_base_url}/api/trade-capture/trades/{trade_id}"
         )
         response.raise_for_status()
         return response.json()
@@ -32,12 +92,26 @@ def get_trade_capture(trade_id: str) -> Dict[str, Any]:
         return {"error": f"Failed to fetch trade capture data: {str(e)}"}
 
 
+def _is_cacheable(data: Dict[str, Any]) -> bool:
+    return "error" not in data
+
+
 def get_settlement(account: str) -> Dict[str, Any]:
-    """Fetch settlement data"""
+    """Fetch settlement data (coalesced and cached per account)"""
+    return account_data_cache.get_or_load(
+        ("settlement", account),
+        lambda: _fetch_settlement(account),
+        should_cache=_is_cacheable
+    )
+
+
+def _fetch_settlement(account: str) -> Dict[str, Any]:
     try:
-        response = requests.get(
-            f"{settings.mock_api_base_url}/api/settlement/positions/{account}",
-            timeout=settings.agent_timeout_seconds
+        if settings.enrichment_batching_enabled:
+            return _batched(settlement_batcher, account)
+        response = http_client.get(
+            "settlement",
+            f"{settings.mock_api_base_url}/api/settlement/positions/{account}"
         )
         response.raise_for_status()
         return response.json()
@@ -46,11 +120,21 @@ def get_settlement(account: str) -> Dict[str, Any]:
 
 
 def get_custodian_data(account: str) -> Dict[str, Any]:
-    """Fetch custodian holdings"""
+    """Fetch custodian holdings (coalesced and cached per account)"""
+    return account_data_cache.get_or_load(
+        ("custodian", account),
+        lambda: _fetch_custodian_data(account),
+        should_cache=_is_cacheable
+    )
+
+
+def _fetch_custodian_data(account: str) -> Dict[str, Any]:
     try:
-        response = requests.get(
-            f"{settings.mock_api_base_url}/api/custodian/holdings/{account}",
-            timeout=settings.agent_timeout_seconds
+        if settings.enrichment_batching_enabled:
+            return _batched(custodian_batcher, account)
+        response = http_client.get(
+            "custodian",
+            f"{settings.mock_api_base_url}/api/custodian/holdings/{account}"
         )
         response.raise_for_status()
         return response.json()
@@ -59,11 +143,21 @@ def get_custodian_data(account: str) -> Dict[str, Any]:
 
 
 def get_reference_data(symbol: str) -> Dict[str, Any]:
-    """Fetch instrument reference data"""
+    """Fetch instrument reference data (cached per instrument for the TTL)"""
+    return reference_data_cache.get_or_load(
+        symbol,
+        lambda: _fetch_reference_data(symbol),
+        should_cache=_is_cacheable
+    )
+
+
+def _fetch_reference_data(symbol: str) -> Dict[str, Any]:
     try:
-        response = requests.get(
-            f"{settings.mock_api_base_url}/api/reference-data/instrument/{symbol}",
-            timeout=settings.agent_timeout_seconds
+        if settings.enrichment_batching_enabled:
+            return _batched(reference_data_batcher, symbol)
+        response = http_client.get(
+            "reference_data",
+            f"{settings.mock_api_base_url}/api/reference-data/instrument/{symbol}"
         )
         response.raise_for_status()
         return response.json()
@@ -71,12 +165,64 @@ def get_reference_data(symbol: str) -> Dict[str, Any]:
         return {"error": f"Failed to fetch reference data: {str(e)}"}
 
 
+def fetch_reference_data_bulk(symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch reference data for many instruments in one call
+    
+    Args:
+        symbols: Instruments to fetch (all known instruments if omitted)
+    
+    Returns:
+        Instrument -> reference data
+    """
+    params = {"symbols": ",".join(symbols)} if symbols else None
+    response = http_client.get(
+        "reference_data",
+        f"{settings.mock_api_base_url}/api/reference-data/instruments",
+        params=params
+    )
+    response.raise_for_status()
+    return {record["symbol"]: record for record in response.json().get("instruments", [])}
+
+
+def prewarm_reference_data(symbols: Optional[List[str]] = None) -> int:
+    """
+    Load reference data for many instruments into the shared cache
+    
+    Instruments already cached are not fetched again, and the full
+    instrument universe is loaded at most once per TTL window.
+    
+    Args:
+        symbols: Instruments to load (all known instruments if omitted)
+    
+    Returns:
+        Number of instruments loaded
+    """
+    global _last_full_prewarm
+    
+    if symbols is not None:
+        symbols = reference_data_cache.missing(symbols)
+        if not symbols:
+            return 0
+    elif (_last_full_prewarm is not None
+          and time.monotonic() - _last_full_prewarm < reference_data_cache.ttl_seconds):
+        return 0
+    
+    records = fetch_reference_data_bulk(symbols)
+    reference_data_cache.set_many(records)
+    if symbols is None:
+        _last_full_prewarm = time.monotonic()
+    return len(records)
+
+
 def get_broker_confirm(trade_id: str) -> Dict[str, Any]:
     """Fetch broker confirmation"""
     try:
-        response = requests.get(
-            f"{settings.mock_api_base_url}/api/broker/confirms/{trade_id}",
-            timeout=settings.agent_timeout_seconds
+        if settings.enrichment_batching_enabled:
+            return _batched(broker_batcher, trade_id)
+        response = http_client.get(
+            "broker",
+            f"{settings.mock_api_base_url}/api/broker/confirms/{trade_id}"
         )
         response.raise_for_status()
         return response.json()
@@ -84,38 +230,356 @@ def get_broker_confirm(trade_id: str) -> Dict[str, Any]:
         return {"error": f"Failed to fetch broker confirm: {str(e)}"}
 
 
+def _lookup_many(
+    batcher: MicroBatcher,
+    ids: List[str],
+    description: str,
+    cache: Optional[TTLCache] = None,
+    cache_key: Callable[[str], Any] = lambda item_id: item_id
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up many IDs with as few bulk calls as possible
+    
+    IDs already in ``cache`` are served from it and successful lookups are
+    stored back. Failures become per-ID error entries.
+    """
+    results = {}
+    to_fetch = []
+    for item_id in dict.fromkeys(ids):
+        value = cache.get(cache_key(item_id), MISSING) if cache is not None else MISSING
+        if value is MISSING:
+            to_fetch.append(item_id)
+        else:
+            results[item_id] = value
+    
+    if to_fetch:
+        try:
+            fetched = batcher.get_many(to_fetch, timeout=http_client.timeout_seconds)
+        except Exception as e:
+            fetched = {item_id: {"error": f"Failed to fetch {description}: {str(e)}"} for item_id in to_fetch}
+        for item_id, value in fetched.items():
+            results[item_id] = value if value is not None else {
+                "error": f"Failed to fetch {description}: {item_id} not found"
+            }
+        if cache is not None:
+            cache.set_many({
+                cache_key(item_id): results[item_id]
+                for item_id in to_fetch if _is_cacheable(results[item_id])
+            })
+    
+    return results
+
+
+def get_oms_data_bulk(order_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch OMS order data for many orders, keyed by order ID"""
+    return _lookup_many(oms_batcher, order_ids, "OMS data")
+
+
+def get_trade_capture_bulk(trade_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch trade capture data for many trades, keyed by trade ID"""
+    return _lookup_many(trade_capture_batcher, trade_ids, "trade capture data")
+
+
+def get_broker_confirm_bulk(trade_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch broker confirmations for many trades, keyed by trade ID"""
+    return _lookup_many(broker_batcher, trade_ids, "broker confirm")
+
+
+def get_settlement_bulk(accounts: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch settlement data for many accounts, keyed by account"""
+    return _lookup_many(
+        settlement_batcher, accounts, "settlement data",
+        cache=account_data_cache, cache_key=lambda account: ("settlement", account)
+    )
+
+
+def get_custodian_data_bulk(accounts: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch custodian holdings for many accounts, keyed by account"""
+    return _lookup_many(
+        custodian_batcher, accounts, "custodian data",
+        cache=account_data_cache, cache_key=lambda account: ("custodian", account)
+    )
+
+
+def get_reference_data_bulk(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch reference data for many instruments, keyed by symbol"""
+    return _lookup_many(reference_data_batcher, symbols, "reference data", cache=reference_data_cache)
+
+
+# Result key -> downstream API it is fetched from (see shared.downstream_limits).
+# Per-source pools, caps and enrichment_source_timeouts are keyed by the API
+SOURCE_APIS = {
+    "oms_data": "oms",
+    "trade_capture_data": "trade_capture",
+    "broker_confirm_data": "broker",
+    "settlement_data": "settlement",
+    "custodian_data": "custodian",
+    "reference_data": "reference_data"
+}
+
+
+class _SourceSaturated(Exception):
+    """Every thread of a source is held by a timed-out lookup"""
+
+
+class EnrichmentEngine:
+    """
+    Runs the independent source lookups for a break concurrently
+    
+    Lookups are fanned out over one small thread pool per source, so
+    enrichment takes roughly the slowest round trip instead of the sum of
+    all of them. Each source has its own deadline, measured from the start
+    of the fan-out; a source that misses it is reported as a timed-out
+    error entry while the other sources are still returned.
+    
+    Each source's pool has ``max_in_flight_per_source`` threads; lookups
+    beyond that queue. A lookup that times out while still queued is
+    cancelled, but one that is already running cannot be and keeps its
+    thread until the call returns. Once every thread of a source is held
+    by such an abandoned lookup, further lookups for it fail fast as
+    saturated instead of queueing behind them, and the other sources'
+    pools are unaffected.
+    """
+    
+    def __init__(self, max_in_flight_per_source: int = None, source_timeout_seconds: float = None):
+        """
+        Initialize enrichment engine
+        
+        Args:
+            max_in_flight_per_source: Lookups (threads) allowed per source at once
+            source_timeout_seconds: Default per-source deadline
+        
+        Raises:
+            ValueError: If ``settings.enrichment_source_timeouts`` names an
+                API that enrichment does not call
+        """
+        unknown = set(settings.enrichment_source_timeouts) - set(SOURCE_APIS.values())
+        if unknown:
+            raise ValueError(
+                f"enrichment_source_timeouts has unknown APIs {sorted(unknown)}; "
+                f"expected some of {sorted(SOURCE_APIS.values())}"
+            )
+        self.max_in_flight_per_source = max(
+            1, max_in_flight_per_source or settings.enrichment_max_in_flight_per_source
+        )
+        self.source_timeout_seconds = (
+            settings.enrichment_source_timeout_seconds
+            if source_timeout_seconds is None else source_timeout_seconds
+        )
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._abandoned: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def source_timeout(self, source: str) -> float:
+        """Deadline in seconds for one source (a downstream API name)"""
+        return settings.enrichment_source_timeouts.get(source, self.source_timeout_seconds)
+    
+    def in_flight(self, source: str) -> int:
+        """Lookups for a source that are queued or running"""
+        with self._lock:
+            return self._in_flight.get(source, 0)
+    
+    def abandoned(self, source: str) -> int:
+        """Timed-out lookups for a source that still hold a thread"""
+        with self._lock:
+            return self._abandoned.get(source, 0)
+    
+    def _submit(self, source: str, func: Callable[..., Any], arg: Any) -> Optional[Future]:
+        """Queue a lookup on the source's pool, or return None if the source is saturated"""
+        with self._lock:
+            if self._abandoned.get(source, 0) >= self.max_in_flight_per_source:
+                return None
+            self._in_flight[source] = self._in_flight.get(source, 0) + 1
+            pool = self._pools.get(source)
+            if pool is None:
+                pool = self._pools[source] = ThreadPoolExecutor(
+                    max_workers=self.max_in_flight_per_source,
+                    thread_name_prefix=f"enrichment-{source}"
+                )
+        
+        future = pool.submit(func, arg)
+        future.add_done_callback(lambda done: self._release(source, done))
+        return future
+    
+    def _release(self, source: str, future: Future):
+        with self._lock:
+            self._in_flight[source] -= 1
+            if getattr(future, "abandoned", False):
+                self._abandoned[source] -= 1
+    
+    def _abandon(self, source: str, future: Future):
+        """Give up on a lookup that missed its deadline"""
+        if future.cancel():
+            return
+        with self._lock:
+            if not future.done():
+                future.abandoned = True
+                self._abandoned[source] = self._abandoned.get(source, 0) + 1
+    
+    def _collect(self, source: str, future: Optional[Future], start: float) -> Any:
+        """
+        Wait for a lookup until the source's deadline
+        
+        Raises:
+            FutureTimeoutError: If the deadline passed (a queued lookup is
+                cancelled; a running one keeps its thread and counts as
+                abandoned until it returns)
+            Exception: Whatever the lookup raised
+        """
+        if future is None:
+            raise _SourceSaturated(
+                f"all {self.max_in_flight_per_source} {source} threads held by timed-out lookups"
+            )
+        remaining = max(0.0, start + self.source_timeout(source) - time.monotonic())
+        try:
+            return future.result(timeout=remaining)
+        except FutureTimeoutError:
+            self._abandon(source, future)
+            raise
+    
+    def _error(self, source: str, error: Exception) -> Dict[str, Any]:
+        if isinstance(error, FutureTimeoutError):
+            return {"error": f"Timed out after {self.source_timeout(source)}s", "timed_out": True}
+        if isinstance(error, _SourceSaturated):
+            return {"error": f"Source saturated: {str(error)}", "saturated": True}
+        return {"error": f"Lookup failed: {str(error)}"}
+    
+    def plan_lookups(self, break_data: Dict[str, Any]) -> List[Tuple[str, Callable[[str], Dict[str, Any]], str]]:
+        """
+        Lookups needed for a break, in the order they appear in the result
+        
+        Returns:
+            List of (result key, tool function, argument)
+        """
+        entities = break_data.get("entities", {})
+        lookups = []
+        
+        # OMS data
+        if entities.get("order_ids"):
+            lookups.append(("oms_data", get_oms_data, entities["order_ids"][0]))
+        
+        # Trade capture data and broker confirm
+        if entities.get("trade_ids"):
+            lookups.append(("trade_capture_data", get_trade_capture, entities["trade_ids"][0]))
+            lookups.append(("broker_confirm_data", get_broker_confirm, entities["trade_ids"][0]))
+        
+        # Settlement and custodian data
+        if entities.get("account"):
+            lookups.append(("settlement_data", get_settlement, entities["account"]))
+            lookups.append(("custodian_data", get_custodian_data, entities["account"]))
+        
+        # Reference data
+        if entities.get("instrument"):
+            lookups.append(("reference_data", get_reference_data, entities["instrument"]))
+        
+        return lookups
+    
+    def enrich(self, break_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch all sources for a break concurrently
+        
+        Args:
+            break_data: Break data to enrich
+        
+        Returns:
+            Enriched data from all sources (same shape as the sequential version)
+        """
+        lookups = self.plan_lookups(break_data)
+        if not lookups:
+            return {}
+        
+        start = time.monotonic()
+        futures = [(key, self._submit(SOURCE_APIS[key], func, arg)) for key, func, arg in lookups]
+        
+        enriched = {}
+        for key, future in futures:
+            try:
+                enriched[key] = self._collect(SOURCE_APIS[key], future, start)
+            except Exception as e:
+                enriched[key] = self._error(SOURCE_APIS[key], e)
+        
+        return enriched
+    
+    def enrich_many(self, breaks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enrich many breaks with one bulk lookup per source
+        
+        IDs are gathered across all breaks and each source is fetched with
+        its bulk endpoint (chunked by ``enrichment_batch_max_size``), with the
+        sources running concurrently under the same per-source deadlines and
+        in-flight caps as ``enrich``.
+        
+        Args:
+            breaks: Break data to enrich
+        
+        Returns:
+            Enriched data per break, in input order, each shaped like ``enrich``
+        """
+        bulk_lookups = {
+            "oms_data": get_oms_data_bulk,
+            "trade_capture_data": get_trade_capture_bulk,
+            "broker_confirm_data": get_broker_confirm_bulk,
+            "settlement_data": get_settlement_bulk,
+            "custodian_data": get_custodian_data_bulk,
+            "reference_data": get_reference_data_bulk
+        }
+        planned = [self.plan_lookups(break_data) for break_data in breaks]
+        ids: Dict[str, List[str]] = {}
+        for lookups in planned:
+            for key, _, arg in lookups:
+                ids.setdefault(key, []).append(arg)
+        
+        start = time.monotonic()
+        futures = {
+            key: self._submit(SOURCE_APIS[key], bulk_lookups[key], args) for key, args in ids.items()
+        }
+        
+        by_source: Dict[str, Dict[str, Any]] = {}
+        for key, future in futures.items():
+            try:
+                by_source[key] = self._collect(SOURCE_APIS[key], future, start)
+            except Exception as e:
+                error = self._error(SOURCE_APIS[key], e)
+                by_source[key] = {arg: error for arg in ids[key]}
+        
+        return [
+            {key: by_source[key][arg] for key, _, arg in lookups}
+            for lookups in planned
+        ]
+
+
+# Shared engine used by enrich_case
+enrichment_engine = EnrichmentEngine()
+
+
 def enrich_case(break_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Enrich break with all relevant data sources
     
+    Independent lookups run concurrently; a source that misses its deadline
+    is returned as an error entry alongside the others.
+    
     Args:
         break_data: Break data to enrich
     
     Returns:
         Enriched data from all sources
     """
-    enriched = {}
-    entities = break_data.get("entities", {})
-    
-    # Fetch OMS data
-    if entities.get("order_ids"):
-        enriched["oms_data"] = get_oms_data(entities["order_ids"][0])
-    
-    # Fetch trade capture data
-    if entities.get("trade_ids"):
-        enriched["trade_capture_data"] = get_trade_capture(entities["trade_ids"][0])
-        enriched["broker_confirm_data"] = get_broker_confirm(entities["trade_ids"][0])
-    
-    # Fetch settlement and custodian data
-    if entities.get("account"):
-        enriched["settlement_data"] = get_settlement(entities["account"])
-        enriched["custodian_data"] = get_custodian_data(entities["account"])
+    return enrichment_engine.enrich(break_data)
+
+
+def enrich_cases(breaks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Enrich many breaks using bulk lookups
     
-    # Fetch reference data
-    if entities.get("instrument"):
-        enriched["reference_data"] = get_reference_data(entities["instrument"])
+    Args:
+        breaks: Break data to enrich
     
-    return enriched
+    Returns:
+        Enriched data per break, in input order
+    """
+    return enrichment_engine.enrich_many(breaks)
 
 
 ENRICHMENT_TOOLS = {
@@ -144,6 +608,11 @@ ENRICHMENT_TOOLS = {
         "description": "Fetch instrument reference data",
         "parameters": {"symbol": {"type": "string"}}
     },
+    "prewarm_reference_data": {
+        "function": prewarm_reference_data,
+        "description": "Bulk-load instrument reference data into the shared cache",
+        "parameters": {"symbols": {"type": "array", "items": {"type": "string"}}}
+    },
     "get_broker_confirm": {
         "function": get_broker_confirm,
         "description": "Fetch broker confirmation",
@@ -153,5 +622,10 @@ ENRICHMENT_TOOLS = {
         "function": enrich_case,
         "description": "Enrich break with all relevant data",
         "parameters": {"break_data": {"type": "object"}}
+    },
+    "enrich_cases": {
+        "function": enrich_cases,
+        "description": "Enrich many breaks with one bulk lookup per data source",
+        "parameters": {"breaks": {"type": "array", "items": {"type": "object"}}}
     }
 }
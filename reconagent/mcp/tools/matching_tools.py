@@ -1,8 +1,14 @@
 """
 MCP Tools for Matching & Correlation Agent
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
+
+import numpy as np
+
 from shared.schemas import MatchCandidate
+from mcp.tools.aggregation_matcher import find_aggregation
+from mcp.tools.candidate_index import CandidateIndex, open_trade_index
+from shared.config import settings
 
 
 def calculate_similarity(data_a: Dict[str, Any], data_b: Dict[str, Any]) -> float:
@@ -53,10 +59,150 @@ def calculate_similarity(data_a: Dict[str, Any], data_b: Dict[str, Any]) -> floa
     return score / total_fields if total_fields > 0 else 0.0
 
 
+COMPARABLE_FIELDS = ["instrument", "quantity", "amount", "price", "currency"]
+CODED_FIELDS = ("instrument", "currency")
+
+# Score by number of tolerance bands (10%, 5%, 1%) a difference falls within
+TIER_SCORES = np.array([0.0, 0.4, 0.7, 1.0])
+
+# Below this many candidates, building a CandidateBlock costs more than
+# scoring pairs one at a time
+BATCH_SCORING_MIN_CANDIDATES = 64
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+class CandidateBlock:
+    """
+    Columnar candidate records for ``score_candidates``
+    
+    Instrument and currency are stored as integer codes into per-field
+    vocabularies; quantity, amount and price as float arrays (NaN where a
+    value does not parse). ``present`` marks, per field, which candidates
+    carry the key at all, since calculate_similarity counts a field only
+    when both records have it.
+    """
+    
+    def __init__(
+        self,
+        codes: Dict[str, np.ndarray],
+        vocabularies: Dict[str, Dict[Any, int]],
+        values: Dict[str, np.ndarray],
+        present: Dict[str, np.ndarray],
+        records: Optional[Sequence[Dict[str, Any]]] = None
+    ):
+        self.codes = codes
+        self.vocabularies = vocabularies
+        self.values = values
+        self.present = present
+        self.records = records
+    
+    @classmethod
+    def from_records(cls, records: Sequence[Dict[str, Any]]) -> "CandidateBlock":
+        """
+        Build a block from candidate dicts
+        
+        Args:
+            records: Candidate records (kept on the block as ``records``)
+        
+        Returns:
+            Columnar block
+        """
+        count = len(records)
+        codes, vocabularies, values, present = {}, {}, {}, {}
+        for field in COMPARABLE_FIELDS:
+            present[field] = np.fromiter((field in r for r in records), dtype=bool, count=count)
+            if field in CODED_FIELDS:
+                lookup: Dict[Any, int] = {}
+                codes[field] = np.fromiter(
+                    (lookup.setdefault(r.get(field), len(lookup)) for r in records),
+                    dtype=np.int32, count=count
+                )
+                vocabularies[field] = lookup
+            else:
+                values[field] = np.fromiter(
+                    (_as_float(r.get(field)) for r in records),
+                    dtype=np.float64, count=count
+                )
+        return cls(codes, vocabularies, values, present, records)
+    
+    def __len__(self) -> int:
+        return len(self.present["instrument"])
+
+
+def score_candidates(data_a: Dict[str, Any], block: CandidateBlock) -> np.ndarray:
+    """
+    Similarity of one record against every candidate in a block
+    
+    Vectorized ``calculate_similarity``: same fields, same 1%/5%/10% tiers.
+    
+    Args:
+        data_a: Record to score (e.g. a break leg)
+        block: Columnar candidates
+    
+    Returns:
+        Similarity scores (0.0 to 1.0), one per candidate
+    """
+    count = len(block)
+    score = np.zeros(count)
+    total_fields = np.zeros(count)
+    
+    # Fields are accumulated in calculate_similarity's order so the float
+    # sums agree exactly
+    for field in COMPARABLE_FIELDS:
+        if field not in data_a:
+            continue
+        present = block.present[field]
+        total_fields += present
+        
+        if field in CODED_FIELDS:
+            try:
+                code = block.vocabularies[field].get(data_a[field], -1)
+            except TypeError:
+                code = -1
+            score += present & (block.codes[field] == code)
+            continue
+        
+        val_a = _as_float(data_a[field])
+        val_b = block.values[field]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if val_a == 0:
+                score += val_b == 0
+            else:
+                diff_pct = np.abs(val_a - val_b) / np.maximum(abs(val_a), np.abs(val_b))
+                bands = (diff_pct < 0.01).astype(np.int8) + (diff_pct < 0.05) + (diff_pct < 0.10)
+                score += TIER_SCORES[bands]
+    
+    return np.divide(score, total_fields, out=np.zeros(count), where=total_fields > 0)
+
+
+def score_candidate_records(
+    data_a: Dict[str, Any],
+    candidates: Sequence[Dict[str, Any]]
+) -> List[float]:
+    """
+    Similarity of one record against a list of candidate dicts
+    
+    Args:
+        data_a: Record to score
+        candidates: Candidate records
+    
+    Returns:
+        Similarity scores, in candidate order
+    """
+    return score_candidates(data_a, CandidateBlock.from_records(candidates)).tolist()
+
+
 def find_match_candidates(
     break_data: Dict[str, Any],
     enriched_data: Dict[str, Any],
-    threshold: float = 0.7
+    threshold: float = 0.7,
+    candidate_index: Optional[CandidateIndex] = None
 ) -> List[Dict[str, Any]]:
     """
     Find potential matching records
@@ -65,6 +211,7 @@ def find_match_candidates(
         break_data: Break data
         enriched_data: Enriched data from various sources
         threshold: Minimum similarity threshold
+        candidate_index: Open-trade pool to search (defaults to open_trade_index)
     
     Returns:
         List of match candidates
@@ -115,15 +262,105 @@ def find_match_candidates(
                 "data": broker_data
             })
     
+    # Check the open-trade pool (bisect range query within the break's block)
+    index = open_trade_index if candidate_index is None else candidate_index
+    if len(index):
+        candidates.extend(_open_trade_candidates(break_data, index, threshold))
+    
     return sorted(candidates, key=lambda x: x["similarity_score"], reverse=True)
 
 
-def correlate_trades(candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _open_trade_candidates(
+    break_data: Dict[str, Any],
+    index: CandidateIndex,
+    threshold: float
+) -> List[Dict[str, Any]]:
+    """Score open trades in the break's (instrument, currency, trade date) block"""
+    instrument = (break_data.get("entities") or {}).get("instrument")
+    if not instrument:
+        return []
+    
+    candidates = []
+    seen = set()
+    for leg_name in ("system_a", "system_b"):
+        leg = break_data.get(leg_name) or {}
+        if leg.get("quantity") is None and leg.get("amount") is None:
+            continue
+        leg_data = {"instrument": instrument, **leg}
+        matches = index.search(
+            instrument,
+            currency=leg.get("currency"),
+            trade_date=leg.get("timestamp") or break_data.get("date"),
+            quantity=leg.get("quantity"),
+            amount=leg.get("amount")
+        )
+        if len(matches) >= BATCH_SCORING_MIN_CANDIDATES:
+            scores = score_candidates(leg_data, CandidateBlock.from_records(matches)).tolist()
+        else:
+            scores = [calculate_similarity(leg_data, trade) for trade in matches]
+        for trade, sim_score in zip(matches, scores):
+            trade_id = trade["trade_id"]
+            if trade_id in seen:
+                continue
+            if sim_score >= threshold:
+                seen.add(trade_id)
+                candidates.append({
+                    "candidate_id": trade_id,
+                    "source": "OPEN_TRADES",
+                    "match_type": "OPEN_TRADE_MATCH",
+                    "similarity_score": sim_score,
+                    "matched_fields": ["instrument", "currency", "quantity", "amount"],
+                    "data": trade
+                })
+    return candidates
+
+
+def add_open_trades(trades: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Add trades to the open-trade pool searched by find_match_candidates
+    
+    Args:
+        trades: Trade records (trade_id, instrument, currency, trade_date, quantity, amount)
+    
+    Returns:
+        Number added and pool size
+    """
+    added = open_trade_index.add_trades(trades)
+    return {"added": added, "open_trades": len(open_trade_index)}
+
+
+def remove_open_trades(trade_ids: List[str]) -> Dict[str, Any]:
+    """
+    Remove trades from the open-trade pool (e.g. once their breaks resolve)
+    
+    Args:
+        trade_ids: Trades to remove
+    
+    Returns:
+        Number removed and pool size
+    """
+    removed = sum(1 for trade_id in trade_ids if open_trade_index.remove_trade(trade_id) is not None)
+    return {"removed": removed, "open_trades": len(open_trade_index)}
+
+
+def correlate_trades(
+    candidates: List[Dict[str, Any]],
+    break_data: Optional[Dict[str, Any]] = None,
+    time_budget_ms: Optional[float] = None,
+    max_candidates: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Correlate multiple candidate matches to identify relationships
     
+    With ``break_data``, multiple candidates are also searched for the subset
+    whose quantities and amounts sum to the break (partial fills or
+    aggregated trades).
+    
     Args:
         candidates: List of match candidates
+        break_data: Break whose system_a (else system_b) quantity and amount are the target
+        time_budget_ms: Aggregation search budget (defaults to settings)
+        max_candidates: Aggregation candidate cap (defaults to settings)
     
     Returns:
         Correlation analysis
@@ -143,7 +380,7 @@ def correlate_trades(candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
     total_qty = sum(c.get("data", {}).get("quantity", 0) for c in candidates)
     avg_score = sum(c["similarity_score"] for c in candidates) / len(candidates)
     
-    return {
+    correlation = {
         "has_correlation": True,
         "correlation_type": "MULTIPLE_MATCHES",
         "num_candidates": len(candidates),
@@ -151,6 +388,30 @@ def correlate_trades(candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
         "total_quantity": total_qty,
         "possible_explanation": "Partial fills or aggregated trades"
     }
+    
+    target = _aggregation_target(break_data) if break_data else None
+    if target:
+        aggregation = find_aggregation(
+            candidates, target[0], target[1],
+            time_budget_ms=time_budget_ms, max_candidates=max_candidates
+        )
+        correlation["aggregation"] = aggregation
+        if aggregation["num_fills"] > 1 and abs(aggregation["residual_quantity"]) <= settings.default_quantity_tolerance:
+            correlation["correlation_type"] = "AGGREGATED_MATCH"
+            correlation["possible_explanation"] = (
+                f"{aggregation['num_fills']} fills aggregate to the break quantity"
+            )
+    
+    return correlation
+
+
+def _aggregation_target(break_data: Dict[str, Any]) -> Optional[tuple]:
+    """(quantity, amount) the break's fills should sum to, if known"""
+    for leg_name in ("system_a", "system_b"):
+        leg = break_data.get(leg_name) or {}
+        if leg.get("quantity"):
+            return leg["quantity"], leg.get("amount")
+    return None
 
 
 MATCHING_TOOLS = {
@@ -171,11 +432,36 @@ MATCHING_TOOLS = {
             "threshold": {"type": "number"}
         }
     },
+    "add_open_trades": {
+        "function": add_open_trades,
+        "description": "Add trades to the indexed open-trade pool",
+        "parameters": {
+            "trades": {"type": "array"}
+        }
+    },
+    "remove_open_trades": {
+        "function": remove_open_trades,
+        "description": "Remove resolved trades from the open-trade pool",
+        "parameters": {
+            "trade_ids": {"type": "array"}
+        }
+    },
+    "score_candidates": {
+        "function": score_candidate_records,
+        "description": "Score one record against many candidates in a single vectorized pass",
+        "parameters": {
+            "data_a": {"type": "object"},
+            "candidates": {"type": "array"}
+        }
+    },
     "correlate_trades": {
         "function": correlate_trades,
         "description": "Correlate multiple match candidates",
         "parameters": {
-            "candidates": {"type": "array"}
+            "candidates": {"type": "array"},
+            "break_data": {"type": "object"},
+            "time_budget_ms": {"type": "number"},
+            "max_candidates": {"type": "integer"}
         }
     }
 }
@@ -1,14 +1,35 @@
 """
 MCP Tools for Pattern & Root-Cause Intelligence Agent
 """
-import requests
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from shared.config import settings
+from shared.http_client import http_client
+from shared.pattern_store import pattern_store
+
+
+def _fetch_historical_patterns(break_type: str = None, limit: int = 10) -> List[Dict[str, Any]]:
+    params = {"limit": limit}
+    if break_type:
+        params["break_type"] = break_type
+    
+    response = http_client.get(
+        "historical",
+        f"{settings.mock_api_base_url}/api/historical/patterns",
+        params=params
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 def get_historical_patterns(break_type: str = None, limit: int = 10) -> List[Dict[str, Any]]:
     """
-    Fetch historical break patterns from mock API
+    Get historical break patterns
+    
+    Served from the local pattern store. The first request for a break type
+    fetches up to ``settings.pattern_store_seed_limit`` of its patterns from
+    the mock API and seeds the store with them, whatever ``limit`` that
+    request asked for; later requests stay local and include outcomes
+    logged since.
     
     Args:
         break_type: Optional filter by break type
@@ -17,26 +38,43 @@ def get_historical_patterns(break_type: str = None, limit: int = 10) -> List[Dic
     Returns:
         List of historical patterns
     """
-    params = {"limit": limit}
-    if break_type:
-        params["break_type"] = break_type
-    
     try:
-        response = requests.get(
-            f"{settings.mock_api_base_url}/api/historical/patterns",
-            params=params,
-            timeout=settings.agent_timeout_seconds
-        )
-        response.raise_for_status()
-        return response.json()
+        if not settings.pattern_store_enabled or not break_type:
+            return _fetch_historical_patterns(break_type, limit)
+        
+        if not pattern_store.is_seeded(break_type):
+            patterns = _fetch_historical_patterns(break_type, settings.pattern_store_seed_limit)
+            pattern_store.seed(break_type, patterns, source="historical_api")
+        return pattern_store.patterns(break_type, limit)
     except Exception as e:
         return {"error": f"Failed to fetch patterns: {str(e)}"}
 
 
+def _historical_prior(
+    break_type: Optional[str],
+    historical_patterns: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Most frequent root cause for the break type: store lookup, else scan of the given patterns"""
+    if settings.pattern_store_enabled and break_type:
+        prior = pattern_store.prior(break_type)
+        if prior is not None:
+            return prior
+    
+    if isinstance(historical_patterns, list) and historical_patterns:
+        matching_patterns = [
+            p for p in historical_patterns
+            if p.get("break_type") == break_type
+        ]
+        if matching_patterns:
+            most_common = max(matching_patterns, key=lambda x: x.get("frequency", 0))
+            return {"root_cause": most_common.get("root_cause"), "frequency": most_common.get("frequency", 0)}
+    return None
+
+
 def predict_root_cause(
     break_data: Dict[str, Any],
     rules_evaluation: Dict[str, Any],
-    historical_patterns: List[Dict[str, Any]]
+    historical_patterns: List[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Predict probable root cause based on patterns
@@ -44,7 +82,8 @@ def predict_root_cause(
     Args:
         break_data: Break data
         rules_evaluation: Rules evaluation results
-        historical_patterns: Historical patterns
+        historical_patterns: Historical patterns (used when the pattern store
+            has no history for the break type)
     
     Returns:
         Root cause prediction with confidence
@@ -87,18 +126,11 @@ def predict_root_cause(
         explanation.append("No clear pattern - possible data entry error")
     
     # Enhance with historical patterns
-    if isinstance(historical_patterns, list) and historical_patterns:
-        matching_patterns = [
-            p for p in historical_patterns
-            if p.get("break_type") == break_data.get("break_type")
-        ]
-        
-        if matching_patterns:
-            most_common = max(matching_patterns, key=lambda x: x.get("frequency", 0))
-            if most_common.get("frequency", 0) > 10:
-                probable_cause = most_common.get("root_cause", probable_cause)
-                confidence = min(0.95, confidence + 0.1)
-                explanation.append(f"Historical data supports this cause (seen {most_common['frequency']} times)")
+    prior = _historical_prior(break_data.get("break_type"), historical_patterns)
+    if prior and prior["frequency"] > 10:
+        probable_cause = prior.get("root_cause") or probable_cause
+        confidence = min(0.95, confidence + 0.1)
+        explanation.append(f"Historical data supports this cause (seen {prior['frequency']} times)")
     
     return {
         "probable_root_cause": probable_cause,
@@ -1,10 +1,27 @@
 """
 MCP Tools for Rules & Tolerance Agent
 """
-from typing import Dict, Any, List
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from mcp.tools.business_rules import RULE_NAMES, RuleSet, RuleSpec, business_rules
 from shared.config import settings
 
 
+# Bit of each rule in RulesBatch bitsets
+RULE_BITS = {name: np.uint8(1 << bit) for bit, name in enumerate(RULE_NAMES)}
+
+# Critical rules for evaluations that do not list their own
+CRITICAL_RULES = ["AMOUNT_TOLERANCE", "CURRENCY_MATCH"]
+
+# Leg field each tolerance rule compares (also its tolerance_checks key)
+TOLERANCE_FIELDS = {"AMOUNT_TOLERANCE": "amount", "QUANTITY_TOLERANCE": "quantity"}
+
+SECONDS_PER_DAY = 86400.0
+
+
 def check_tolerance(
     value_a: float,
     value_b: float,
@@ -55,74 +72,149 @@ def check_tolerance(
     }
 
 
-def apply_business_rules(break_data: Dict[str, Any], enriched_data: Dict[str, Any]) -> Dict[str, Any]:
+def _tolerances(spec: RuleSpec) -> Tuple[Optional[float], Optional[float]]:
+    """(tolerance_bps, tolerance_abs) for a tolerance rule; check_tolerance fills in the bps default"""
+    if spec.rule == "QUANTITY_TOLERANCE" and spec.tolerance_abs is None:
+        return spec.tolerance_bps, settings.default_quantity_tolerance
+    return spec.tolerance_bps, spec.tolerance_abs
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    """POSIX seconds for a datetime or ISO timestamp string"""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def check_timing_lag(timestamp_a: Any, timestamp_b: Any, max_lag_days: float) -> Dict[str, Any]:
     """
-    Apply business rules to evaluate break
+    Check if two booking timestamps are within an acceptable lag
     
     Args:
+        timestamp_a: First timestamp (datetime or ISO string)
+        timestamp_b: Second timestamp (datetime or ISO string)
+        max_lag_days: Largest acceptable lag in days
+    
+    Returns:
+        Lag check result (within tolerance when either timestamp is missing)
+    """
+    seconds_a, seconds_b = _timestamp(timestamp_a), _timestamp(timestamp_b)
+    if seconds_a is None or seconds_b is None:
+        return {
+            "within_tolerance": True,
+            "lag_days": None,
+            "max_lag_days": max_lag_days,
+            "reason": "Timestamps unavailable; lag not checked"
+        }
+    
+    lag_days = abs(seconds_a - seconds_b) / SECONDS_PER_DAY
+    within_tolerance = lag_days <= max_lag_days
+    if within_tolerance:
+        reason = f"Within lag tolerance: {lag_days:.2f} days <= {max_lag_days:.2f} days"
+    else:
+        reason = f"Exceeds lag tolerance: {lag_days:.2f} days > {max_lag_days:.2f} days"
+    return {
+        "within_tolerance": within_tolerance,
+        "lag_days": lag_days,
+        "max_lag_days": max_lag_days,
+        "reason": reason
+    }
+
+
+def evaluate_rule_set(rule_set: RuleSet, break_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Evaluate one compiled rule set against a break
+    
+    Args:
+        rule_set: Rules that apply to the break
         break_data: Break data
-        enriched_data: Enriched data
     
     Returns:
         Rules evaluation results
     """
-    system_a = break_data.get("system_a", {})
-    system_b = break_data.get("system_b", {})
+    system_a = break_data.get("system_a") or {}
+    system_b = break_data.get("system_b") or {}
     
     results = {
         "rules_applied": [],
         "passed_rules": [],
         "failed_rules": [],
         "within_tolerance": True,
-        "tolerance_checks": {}
+        "tolerance_checks": {},
+        "critical_rules": list(rule_set.critical_rules),
+        "rule_set": "/".join(rule_set.key)
     }
     
-    # Rule 1: Amount tolerance check
-    if system_a.get("amount") and system_b.get("amount"):
-        amt_check = check_tolerance(
-            system_a["amount"],
-            system_b["amount"],
-            tolerance_bps=settings.default_amount_tolerance_bps
-        )
-        results["tolerance_checks"]["amount"] = amt_check
-        results["rules_applied"].append("AMOUNT_TOLERANCE")
-        
-        if amt_check["within_tolerance"]:
-            results["passed_rules"].append("AMOUNT_TOLERANCE")
+    for spec in rule_set.rules:
+        rule = spec.rule
+        if rule in TOLERANCE_FIELDS:
+            # Amount / quantity tolerance, only when both legs carry the value
+            field = TOLERANCE_FIELDS[rule]
+            if not (system_a.get(field) and system_b.get(field)):
+                continue
+            tolerance_bps, tolerance_abs = _tolerances(spec)
+            check = check_tolerance(
+                system_a[field],
+                system_b[field],
+                tolerance_bps=tolerance_bps,
+                tolerance_abs=tolerance_abs
+            )
+            results["tolerance_checks"][field] = check
+            passed = check["within_tolerance"]
+        elif rule == "CURRENCY_MATCH":
+            if not (system_a.get("currency") and system_b.get("currency")):
+                continue
+            passed = system_a["currency"] == system_b["currency"]
         else:
-            results["failed_rules"].append("AMOUNT_TOLERANCE")
-            results["within_tolerance"] = False
-    
-    # Rule 2: Quantity tolerance check
-    if system_a.get("quantity") and system_b.get("quantity"):
-        qty_check = check_tolerance(
-            system_a["quantity"],
-            system_b["quantity"],
-            tolerance_abs=settings.default_quantity_tolerance
-        )
-        results["tolerance_checks"]["quantity"] = qty_check
-        results["rules_applied"].append("QUANTITY_TOLERANCE")
+            # TIMING_LAG: without max_lag_days any lag is accepted
+            passed = True
+            if spec.max_lag_days is not None:
+                check = check_timing_lag(system_a.get("timestamp"), system_b.get("timestamp"), spec.max_lag_days)
+                if check["lag_days"] is not None:
+                    results["tolerance_checks"]["timing"] = check
+                passed = check["within_tolerance"]
         
-        if qty_check["within_tolerance"]:
-            results["passed_rules"].append("QUANTITY_TOLERANCE")
+        results["rules_applied"].append(rule)
+        if passed:
+            results["passed_rules"].append(rule)
         else:
-            results["failed_rules"].append("QUANTITY_TOLERANCE")
+            results["failed_rules"].append(rule)
             results["within_tolerance"] = False
     
-    # Rule 3: Currency match
-    if system_a.get("currency") and system_b.get("currency"):
-        results["rules_applied"].append("CURRENCY_MATCH")
-        if system_a["currency"] == system_b["currency"]:
-            results["passed_rules"].append("CURRENCY_MATCH")
-        else:
-            results["failed_rules"].append("CURRENCY_MATCH")
-            results["within_tolerance"] = False
+    return results
+
+
+def _asset_class(enriched_data: Optional[Dict[str, Any]]) -> Optional[str]:
+    reference = (enriched_data or {}).get("reference_data") or {}
+    return reference.get("asset_class")
+
+
+def apply_business_rules(break_data: Dict[str, Any], enriched_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply business rules to evaluate break
     
-    # Rule 4: Timing check (T+1 lag acceptable)
-    results["rules_applied"].append("TIMING_LAG")
-    results["passed_rules"].append("TIMING_LAG")  # Default pass for now
+    The rules come from the business-rule file's decision table, by break
+    type, the instrument's asset class (from enriched reference data) and
+    counterparty.
     
-    return results
+    Args:
+        break_data: Break data
+        enriched_data: Enriched data
+    
+    Returns:
+        Rules evaluation results
+    """
+    rule_set = business_rules.rule_set(
+        break_data.get("break_type"),
+        _asset_class(enriched_data),
+        (break_data.get("entities") or {}).get("counterparty")
+    )
+    return evaluate_rule_set(rule_set, break_data)
 
 
 def validate_rules(rules_evaluation: Dict[str, Any]) -> bool:
@@ -135,12 +227,212 @@ def validate_rules(rules_evaluation: Dict[str, Any]) -> bool:
     Returns:
         True if all critical rules passed
     """
-    critical_rules = ["AMOUNT_TOLERANCE", "CURRENCY_MATCH"]
+    critical_rules = rules_evaluation.get("critical_rules", CRITICAL_RULES)
     failed_critical = [r for r in rules_evaluation.get("failed_rules", []) if r in critical_rules]
     
     return len(failed_critical) == 0
 
 
+def _rule_names(bits: int) -> List[str]:
+    return [name for bit, name in enumerate(RULE_NAMES) if bits >> bit & 1]
+
+
+def _difference_bps(value_a: np.ndarray, value_b: np.ndarray):
+    """Vectorized check_tolerance arithmetic: (diff, diff_bps)"""
+    diff = np.abs(value_a - value_b)
+    largest = np.maximum(np.abs(value_a), np.abs(value_b))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        diff_pct = np.where(largest > 0, (diff / largest) * 100, 0.0)
+    return diff, diff_pct * 100
+
+
+class RulesBatch:
+    """
+    Business-rule results for a batch of breaks, from ``apply_business_rules_many``
+    
+    ``applied``, ``passed`` and ``critical`` are per-break bitsets over
+    RULE_NAMES; ``rule_set_codes`` index the rule sets the breaks resolved
+    to. The breaks themselves are kept by reference so ``evaluation(idx)``
+    can build the full result, reason strings included, for just the breaks
+    that are surfaced.
+    """
+    
+    def __init__(
+        self,
+        breaks: Sequence[Dict[str, Any]],
+        applied: np.ndarray,
+        passed: np.ndarray,
+        critical: np.ndarray,
+        rule_set_codes: np.ndarray,
+        rule_sets: List[RuleSet]
+    ):
+        self.breaks = breaks
+        self.applied = applied
+        self.passed = passed
+        self.critical = critical
+        self.rule_set_codes = rule_set_codes
+        self.rule_sets = rule_sets
+    
+    def __len__(self) -> int:
+        return len(self.breaks)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for idx in range(len(self)):
+            yield self.evaluation(idx)
+    
+    @property
+    def break_id(self) -> List[Any]:
+        return [b.get("break_id") for b in self.breaks]
+    
+    @property
+    def failed(self) -> np.ndarray:
+        """Bitset of applied rules that failed"""
+        return self.applied & ~self.passed
+    
+    @property
+    def within_tolerance(self) -> np.ndarray:
+        """True where no applied rule failed"""
+        return self.failed == 0
+    
+    @property
+    def all_critical_rules_passed(self) -> np.ndarray:
+        """``validate_rules`` for every break"""
+        return (self.failed & self.critical) == 0
+    
+    def failed_rules(self, idx: int) -> List[str]:
+        """Names of the rules break ``idx`` failed"""
+        return _rule_names(int(self.applied[idx]) & ~int(self.passed[idx]))
+    
+    def evaluation(self, idx: int) -> Dict[str, Any]:
+        """
+        Materialize the apply_business_rules result for one break
+        
+        Args:
+            idx: Position of the break in the batch
+        
+        Returns:
+            Rules evaluation, identical to apply_business_rules for that break
+        """
+        return evaluate_rule_set(self.rule_sets[self.rule_set_codes[idx]], self.breaks[idx])
+
+
+def _column(legs: List[Dict[str, Any]], field: str) -> np.ndarray:
+    # Falsy values do not trigger a rule in evaluate_rule_set; NaN marks them
+    return np.fromiter((leg.get(field) or np.nan for leg in legs), dtype=np.float64, count=len(legs))
+
+
+def _timestamp_column(legs: List[Dict[str, Any]]) -> np.ndarray:
+    return np.fromiter(
+        (_timestamp(leg.get("timestamp")) or np.nan for leg in legs),
+        dtype=np.float64, count=len(legs)
+    )
+
+
+def apply_business_rules_many(
+    breaks: Sequence[Dict[str, Any]],
+    asset_classes: Optional[Sequence[Optional[str]]] = None
+) -> RulesBatch:
+    """
+    Apply the business-rule decision table to a batch of breaks with array operations
+    
+    Breaks are grouped by the rule set they resolve to and each rule of a
+    group is evaluated with one set of NumPy masks. The pass/fail outcome is
+    the same as ``apply_business_rules`` for every break; reason strings are
+    only built by ``RulesBatch.evaluation``.
+    
+    Args:
+        breaks: Normalized breaks
+        asset_classes: Asset class per break (e.g. from BreakProfileBatch);
+            DEFAULT rule sets are used where omitted
+    
+    Returns:
+        RulesBatch with applied/passed/critical bitsets per break
+    """
+    count = len(breaks)
+    
+    # Resolve each distinct (break_type, asset_class, counterparty) once
+    rule_sets: List[RuleSet] = []
+    set_codes: Dict[int, int] = {}
+    resolved: Dict[Tuple[Any, Any, Any], int] = {}
+    codes = np.empty(count, dtype=np.int32)
+    for idx, break_data in enumerate(breaks):
+        key = (
+            break_data.get("break_type"),
+            asset_classes[idx] if asset_classes is not None else None,
+            (break_data.get("entities") or {}).get("counterparty")
+        )
+        code = resolved.get(key)
+        if code is None:
+            rule_set = business_rules.rule_set(*key)
+            code = set_codes.setdefault(id(rule_set), len(rule_sets))
+            if code == len(rule_sets):
+                rule_sets.append(rule_set)
+            resolved[key] = code
+        codes[idx] = code
+    
+    legs_a = [b.get("system_a") or {} for b in breaks]
+    legs_b = [b.get("system_b") or {} for b in breaks]
+    values = {}
+    for field in TOLERANCE_FIELDS.values():
+        values[field] = (_column(legs_a, field), _column(legs_b, field))
+    
+    currencies: Dict[Any, int] = {None: -1}
+    def currency_codes(legs):
+        return np.fromiter(
+            (currencies.setdefault(leg.get("currency") or None, len(currencies)) for leg in legs),
+            dtype=np.int32, count=count
+        )
+    currency_a, currency_b = currency_codes(legs_a), currency_codes(legs_b)
+    
+    timestamps = None
+    if any(spec.rule == "TIMING_LAG" and spec.max_lag_days is not None
+           for rule_set in rule_sets for spec in rule_set.rules):
+        timestamps = (_timestamp_column(legs_a), _timestamp_column(legs_b))
+    
+    applied = np.zeros(count, dtype=np.uint8)
+    passed = np.zeros(count, dtype=np.uint8)
+    critical = np.array([rule_set.critical_mask for rule_set in rule_sets], dtype=np.uint8)[codes]
+    
+    for code, rule_set in enumerate(rule_sets):
+        rows = np.flatnonzero(codes == code) if len(rule_sets) > 1 else np.arange(count)
+        for spec in rule_set.rules:
+            bit = RULE_BITS[spec.rule]
+            if spec.rule in TOLERANCE_FIELDS:
+                value_a, value_b = values[TOLERANCE_FIELDS[spec.rule]]
+                value_a, value_b = value_a[rows], value_b[rows]
+                has_values = ~(np.isnan(value_a) | np.isnan(value_b))
+                diff, diff_bps = _difference_bps(value_a, value_b)
+                tolerance_bps, tolerance_abs = _tolerances(spec)
+                if tolerance_bps is None:
+                    tolerance_bps = settings.default_amount_tolerance_bps
+                ok = diff_bps <= tolerance_bps
+                if tolerance_abs is not None:
+                    ok |= diff <= tolerance_abs
+                applies, ok = has_values, has_values & ok
+            elif spec.rule == "CURRENCY_MATCH":
+                code_a, code_b = currency_a[rows], currency_b[rows]
+                applies = (code_a >= 0) & (code_b >= 0)
+                ok = applies & (code_a == code_b)
+            else:
+                applies = np.ones(len(rows), dtype=bool)
+                ok = applies
+                if spec.max_lag_days is not None:
+                    lag_days = np.abs(timestamps[0][rows] - timestamps[1][rows]) / SECONDS_PER_DAY
+                    # Missing timestamps (NaN) pass, as in check_timing_lag
+                    ok = ~(lag_days > spec.max_lag_days)
+            applied[rows[applies]] |= bit
+            passed[rows[ok]] |= bit
+    
+    return RulesBatch(
+        breaks=breaks,
+        applied=applied,
+        passed=passed,
+        critical=critical,
+        rule_set_codes=codes,
+        rule_sets=rule_sets
+    )
+
+
 RULES_TOOLS = {
     "check_tolerance": {
         "function": check_tolerance,
@@ -160,6 +452,23 @@ RULES_TOOLS = {
             "enriched_data": {"type": "object"}
         }
     },
+    "apply_business_rules_many": {
+        "function": apply_business_rules_many,
+        "description": "Apply business rules to a batch of breaks with vectorized checks",
+        "parameters": {
+            "breaks": {"type": "array"},
+            "asset_classes": {"type": "array"}
+        }
+    },
+    "check_timing_lag": {
+        "function": check_timing_lag,
+        "description": "Check if two booking timestamps are within an acceptable lag",
+        "parameters": {
+            "timestamp_a": {"type": "string"},
+            "timestamp_b": {"type": "string"},
+            "max_lag_days": {"type": "number"}
+        }
+    },
     "validate_rules": {
         "function": validate_rules,
         "description": "Validate if critical rules passed",
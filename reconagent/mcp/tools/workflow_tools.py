@@ -5,6 +5,9 @@ from datetime import datetime
 from typing import Dict, Any, List
 import uuid
 
+from shared.config import settings
+from shared.pattern_store import pattern_store
+
 
 # In-memory storage for demo (would be database in production)
 TICKETS = {}
@@ -80,16 +83,27 @@ def log_feedback(
     break_id: str,
     decision: Dict[str, Any],
     human_action: str = None,
-    human_notes: str = None
+    human_notes: str = None,
+    break_type: str = None,
+    root_cause: str = None,
+    amount: float = None
 ) -> Dict[str, Any]:
     """
     Log feedback for learning and improvement
     
+    With a break type and root cause, the outcome is also recorded in the
+    pattern store, updating the root-cause frequencies pattern intelligence
+    uses as priors. Pass a root cause only when a human confirmed it, so
+    the agent's own unconfirmed predictions do not reinforce themselves.
+    
     Args:
         break_id: Break identifier
         decision: Agent decision
         human_action: Human action taken (if any)
         human_notes: Human notes
+        break_type: Break type
+        root_cause: Root cause a human confirmed the break was resolved with
+        amount: Amount difference of the break
     
     Returns:
         Feedback record
@@ -106,6 +120,18 @@ def log_feedback(
     }
     
     FEEDBACK_LOG.append(feedback)
+    
+    if settings.pattern_store_enabled and break_type and root_cause:
+        pattern_store.record(
+            break_type,
+            root_cause,
+            break_id=break_id,
+            resolution=human_action or decision.get("action"),
+            amount=amount,
+            confirmed=feedback["agreement"]
+        )
+        feedback["root_cause"] = root_cause
+    
     return feedback
 
 
@@ -210,7 +236,10 @@ WORKFLOW_TOOLS = {
             "break_id": {"type": "string"},
             "decision": {"type": "object"},
             "human_action": {"type": "string"},
-            "human_notes": {"type": "string"}
+            "human_notes": {"type": "string"},
+            "break_type": {"type": "string"},
+            "root_cause": {"type": "string"},
+            "amount": {"type": "number"}
         }
     },
     "get_audit_trail": {
@@ -2,25 +2,50 @@
 Mock API Server for Reconciliation Data Sources
 FastAPI-based mock endpoints returning sample data
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from datetime import datetime, timedelta
+import asyncio
+import json
+import os
 import random
 from typing import List, Dict, Any
 
 app = FastAPI(title="Reconciliation Mock APIs", version="1.0.0")
 
+# Simulated downstream round-trip latency (ms), useful for benchmarks
+app.state.latency_ms = float(os.getenv("MOCK_API_LATENCY_MS", "0"))
+
+
+@app.middleware("http")
+async def simulate_latency(request: Request, call_next):
+    """Delay every response by the configured latency"""
+    if request.app.state.latency_ms > 0:
+        await asyncio.sleep(request.app.state.latency_ms / 1000)
+    return await call_next(request)
+
+
+class BulkLookupRequest(BaseModel):
+    """IDs for a bulk lookup; results come back keyed by ID"""
+    ids: List[str]
+
+
+def bulk_results(lookup, ids: List[str]) -> Dict[str, Any]:
+    return {"results": {item_id: lookup(item_id) for item_id in dict.fromkeys(ids)}}
+
 
 # Sample data generators
-def generate_break_id() -> str:
-    return f"BRK-2025-11-{random.randint(10000, 99999)}"
+def generate_break_id(rng: random.Random = None) -> str:
+    return f"BRK-2025-11-{(rng or random).randint(10000, 99999)}"
 
 
-def generate_trade_id() -> str:
-    return f"T{random.randint(100000, 999999)}"
+def generate_trade_id(rng: random.Random = None) -> str:
+    return f"T{(rng or random).randint(100000, 999999)}"
 
 
-def generate_order_id() -> str:
-    return f"O{random.randint(100000, 999999)}"
+def generate_order_id(rng: random.Random = None) -> str:
+    return f"O{(rng or random).randint(100000, 999999)}"
 
 
 INSTRUMENTS = ["AAPL", "GOOGL", "MSFT", "TSLA", "AMZN", "JPM", "BAC", "GS", "C"]
@@ -33,50 +58,113 @@ def root():
     return {"message": "Reconciliation Mock API Server", "version": "1.0.0"}
 
 
+BREAK_TYPES = ["TRADE_OMS_MISMATCH", "BROKER_VS_INTERNAL", "CASH_RECONCILIATION", "CUSTODIAN_MISMATCH"]
+
+
+def generate_break(break_type: str = None, rng: random.Random = None, break_id: str = None) -> Dict[str, Any]:
+    """Random break record; pass a seeded ``rng`` for a reproducible one"""
+    rng = rng or random
+    selected_type = break_type if break_type else rng.choice(BREAK_TYPES)
+    instrument = rng.choice(INSTRUMENTS)
+    qty = rng.randint(100, 10000)
+    price = rng.uniform(50, 500)
+    
+    return {
+        "break_id": break_id or generate_break_id(rng),
+        "break_type": selected_type,
+        "status": "NEW",
+        "system_a": {
+            "system_name": "OMS",
+            "quantity": qty,
+            "amount": qty * price,
+            "price": price,
+            "currency": "USD",
+            "timestamp": (datetime.now() - timedelta(hours=rng.randint(1, 24))).isoformat()
+        },
+        "system_b": {
+            "system_name": "Trade Capture",
+            "quantity": qty + rng.randint(-10, 10),
+            "amount": (qty + rng.randint(-10, 10)) * (price + rng.uniform(-0.5, 0.5)),
+            "price": price + rng.uniform(-0.5, 0.5),
+            "currency": "USD",
+            "timestamp": (datetime.now() - timedelta(hours=rng.randint(1, 24))).isoformat()
+        },
+        "entities": {
+            "instrument": instrument,
+            "account": rng.choice(ACCOUNTS),
+            "broker": rng.choice(BROKERS),
+            "trade_ids": [generate_trade_id(rng)],
+            "order_ids": [generate_order_id(rng)]
+        },
+        "date": datetime.now().isoformat(),
+        "source": "Reconciliation Engine"
+    }
+
+
+def backlog_break(index: int, break_type: str = None) -> Dict[str, Any]:
+    """Break at ``index`` of the mock backlog (same record on every request)"""
+    return generate_break(break_type, random.Random(index), break_id=f"BRK-BACKLOG-{index:09d}")
+
+
+def parse_cursor(cursor: str = None) -> int:
+    if not cursor:
+        return 0
+    try:
+        offset = int(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+    return offset
+
+
 @app.get("/api/breaks")
 def get_breaks(limit: int = 10, break_type: str = None) -> List[Dict[str, Any]]:
     """Get list of reconciliation breaks"""
-    breaks = []
-    break_types = ["TRADE_OMS_MISMATCH", "BROKER_VS_INTERNAL", "CASH_RECONCILIATION", "CUSTODIAN_MISMATCH"]
+    return [generate_break(break_type) for _ in range(limit)]
+
+
+# Paged and streaming routes must be declared before /api/breaks/{break_id}
+
+@app.get("/api/breaks/page")
+def get_breaks_page(
+    limit: int = 1000,
+    page_size: int = 100,
+    cursor: str = None,
+    break_type: str = None
+) -> Dict[str, Any]:
+    """
+    Page through a backlog of ``limit`` breaks
     
-    for i in range(limit):
-        selected_type = break_type if break_type else random.choice(break_types)
-        instrument = random.choice(INSTRUMENTS)
-        qty = random.randint(100, 10000)
-        price = random.uniform(50, 500)
-        
-        breaks.append({
-            "break_id": generate_break_id(),
-            "break_type": selected_type,
-            "status": "NEW",
-            "system_a": {
-                "system_name": "OMS",
-                "quantity": qty,
-                "amount": qty * price,
-                "price": price,
-                "currency": "USD",
-                "timestamp": (datetime.now() - timedelta(hours=random.randint(1, 24))).isoformat()
-            },
-            "system_b": {
-                "system_name": "Trade Capture",
-                "quantity": qty + random.randint(-10, 10),
-                "amount": (qty + random.randint(-10, 10)) * (price + random.uniform(-0.5, 0.5)),
-                "price": price + random.uniform(-0.5, 0.5),
-                "currency": "USD",
-                "timestamp": (datetime.now() - timedelta(hours=random.randint(1, 24))).isoformat()
-            },
-            "entities": {
-                "instrument": instrument,
-                "account": random.choice(ACCOUNTS),
-                "broker": random.choice(BROKERS),
-                "trade_ids": [generate_trade_id()],
-                "order_ids": [generate_order_id()]
-            },
-            "date": datetime.now().isoformat(),
-            "source": "Reconciliation Engine"
-        })
+    Pass the returned ``next_cursor`` to get the following page; it is None
+    after the last page.
+    """
+    offset = parse_cursor(cursor)
+    end = min(limit, offset + max(1, page_size))
+    return {
+        "breaks": [backlog_break(index, break_type) for index in range(offset, end)],
+        "next_cursor": str(end) if end < limit else None
+    }
+
+
+@app.get("/api/breaks/stream")
+def stream_breaks(limit: int = 1000, cursor: str = None, break_type: str = None):
+    """Stream a backlog of ``limit`` breaks as NDJSON (one break per line)"""
+    offset = parse_cursor(cursor)
     
-    return breaks
+    def lines():
+        # Send a few hundred lines per chunk; one chunk per break would
+        # cost a threadpool hop per line
+        chunk = []
+        for index in range(offset, limit):
+            chunk.append(json.dumps(backlog_break(index, break_type)))
+            if len(chunk) >= 256:
+                yield "\n".join(chunk) + "\n"
+                chunk = []
+        if chunk:
+            yield "\n".join(chunk) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @app.get("/api/breaks/{break_id}")
@@ -136,6 +224,12 @@ def get_oms_order(order_id: str) -> Dict[str, Any]:
     }
 
 
+@app.post("/api/oms/orders/bulk")
+def get_oms_orders_bulk(request: BulkLookupRequest) -> Dict[str, Any]:
+    """Get OMS order details for many order IDs"""
+    return bulk_results(get_oms_order, request.ids)
+
+
 @app.get("/api/trade-capture/trades/{trade_id}")
 def get_trade_capture(trade_id: str) -> Dict[str, Any]:
     """Get trade capture details"""
@@ -158,6 +252,12 @@ def get_trade_capture(trade_id: str) -> Dict[str, Any]:
     }
 
 
+@app.post("/api/trade-capture/trades/bulk")
+def get_trade_capture_bulk(request: BulkLookupRequest) -> Dict[str, Any]:
+    """Get trade capture details for many trade IDs"""
+    return bulk_results(get_trade_capture, request.ids)
+
+
 @app.get("/api/settlement/positions/{account}")
 def get_settlement_data(account: str) -> Dict[str, Any]:
     """Get settlement position data"""
@@ -179,6 +279,12 @@ def get_settlement_data(account: str) -> Dict[str, Any]:
     }
 
 
+@app.post("/api/settlement/positions/bulk")
+def get_settlement_data_bulk(request: BulkLookupRequest) -> Dict[str, Any]:
+    """Get settlement position data for many accounts"""
+    return bulk_results(get_settlement_data, request.ids)
+
+
 @app.get("/api/custodian/holdings/{account}")
 def get_custodian_holdings(account: str) -> Dict[str, Any]:
     """Get custodian holdings data"""
@@ -200,6 +306,36 @@ def get_custodian_holdings(account: str) -> Dict[str, Any]:
     }
 
 
+@app.post("/api/custodian/holdings/bulk")
+def get_custodian_holdings_bulk(request: BulkLookupRequest) -> Dict[str, Any]:
+    """Get custodian holdings data for many accounts"""
+    return bulk_results(get_custodian_holdings, request.ids)
+
+
+def reference_asset_class(symbol: str) -> str:
+    """Asset class of a mock instrument"""
+    if len(symbol) == 6 and symbol.isalpha() and symbol[:3] in ("USD", "EUR", "GBP", "JPY", "CHF"):
+        return "FX"
+    if symbol.endswith(("OPT", "CALL", "PUT", "FUT")):
+        return "DERIVATIVE"
+    if symbol.endswith(".SW"):
+        return "STRUCTURED_PRODUCT"
+    return "EQUITY"
+
+
+@app.get("/api/reference-data/instruments")
+def get_reference_data_bulk(symbols: str = None) -> Dict[str, Any]:
+    """Get reference data for many instruments (comma-separated, default all)"""
+    requested = [s for s in symbols.split(",") if s] if symbols else INSTRUMENTS
+    return {"instruments": [get_reference_data(symbol) for symbol in requested]}
+
+
+@app.post("/api/reference-data/instruments/bulk")
+def post_reference_data_bulk(request: BulkLookupRequest) -> Dict[str, Any]:
+    """Get reference data for many instruments, keyed by symbol"""
+    return bulk_results(get_reference_data, request.ids)
+
+
 @app.get("/api/reference-data/instrument/{symbol}")
 def get_reference_data(symbol: str) -> Dict[str, Any]:
     """Get instrument reference data"""
@@ -208,7 +344,7 @@ def get_reference_data(symbol: str) -> Dict[str, Any]:
         "isin": f"US{random.randint(100000000, 999999999)}",
         "cusip": f"{random.randint(100000000, 999999999)}",
         "name": f"{symbol} Inc.",
-        "asset_class": "EQUITY",
+        "asset_class": reference_asset_class(symbol),
         "exchange": "NASDAQ",
         "currency": "USD",
         "country": "US",
@@ -241,6 +377,12 @@ def get_broker_confirm(trade_id: str) -> Dict[str, Any]:
     }
 
 
+@app.post("/api/broker/confirms/bulk")
+def get_broker_confirms_bulk(request: BulkLookupRequest) -> Dict[str, Any]:
+    """Get broker confirmation data for many trade IDs"""
+    return bulk_results(get_broker_confirm, request.ids)
+
+
 @app.get("/api/historical/patterns")
 def get_historical_patterns(break_type: str = None, limit: int = 10) -> List[Dict[str, Any]]:
     """Get historical break patterns"""
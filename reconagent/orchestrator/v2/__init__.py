@@ -9,15 +9,23 @@ This version supports:
 """
 
 from .dynamic_orchestrator import DynamicReconciliationOrchestrator
-from .break_classifier import BreakClassifier, BreakProfile
+from .break_classifier import BreakClassifier, BreakProfile, BreakProfileBatch
 from .policy_engine import PolicyEngine, ExecutionPlan
 from .dag_executor import DAGExecutor
+from .execution_backend import ExecutionBackend
+from .execution_context import ExecutionContext
+from .batch_engine import BatchEngine, BatchSummary
 
 __all__ = [
     'DynamicReconciliationOrchestrator',
     'BreakClassifier',
     'BreakProfile',
+    'BreakProfileBatch',
     'PolicyEngine',
     'ExecutionPlan',
-    'DAGExecutor'
+    'DAGExecutor',
+    'ExecutionBackend',
+    'ExecutionContext',
+    'BatchEngine',
+    'BatchSummary'
 ]
@@ -0,0 +1,260 @@
+"""
+Batch Engine - Processes many breaks concurrently with bounded fan-out
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Any, AsyncIterator, Iterable, Iterator, Union, AsyncIterable
+
+from shared.config import settings
+
+
+# Sentinel marking the end of a queue
+_DONE = object()
+
+
+class _SourceFailed:
+    """Carries an exception raised by the source of ``iterate_in_thread``"""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+async def iterate_in_thread(items: Iterable[Any], max_buffered: int = 64) -> AsyncIterator[Any]:
+    """
+    Consume a blocking iterable (e.g. a streaming HTTP download) off the event loop
+
+    A worker thread pulls items and hands each one to the event loop as
+    soon as it arrives, through a queue bounded at ``max_buffered`` items,
+    so the event loop never waits on I/O. When the consumer stops early
+    the worker stops pulling and closes the source (releasing e.g. an HTTP
+    connection) as soon as its current read returns.
+
+    Args:
+        items: Sync iterable whose iteration may block
+        max_buffered: Items pulled ahead of the consumer at most
+
+    Yields:
+        Items in order
+    """
+    loop = asyncio.get_running_loop()
+    ready: asyncio.Queue = asyncio.Queue()
+    slots = threading.Semaphore(max(1, max_buffered))
+    stopped = threading.Event()
+
+    def hand_over(item):
+        try:
+            loop.call_soon_threadsafe(ready.put_nowait, item)
+        except RuntimeError:
+            # Event loop already closed; nobody is listening
+            pass
+
+    def pump():
+        iterator: Iterator[Any] = iter(items)
+        try:
+            for item in iterator:
+                slots.acquire()
+                if stopped.is_set():
+                    break
+                hand_over(item)
+        except Exception as e:
+            hand_over(_SourceFailed(e))
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+            hand_over(_DONE)
+
+    loop.run_in_executor(None, pump)
+    try:
+        while True:
+            item = await ready.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _SourceFailed):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        stopped.set()
+        # Wake the worker if it is waiting for a free slot
+        slots.release()
+
+
+class BatchSummary:
+    """
+    Summary statistics for a batch, updated incrementally as results arrive
+    """
+
+    def __init__(self):
+        self.breaks_processed = 0
+        self.errors = 0
+        self.total_agents_planned = 0
+        self.total_agents_invoked = 0
+        self.total_agents_skipped = 0
+        self.total_duration_ms = 0.0
+        self.early_exits = 0
+        self.decisions: Dict[str, int] = {}
+        self.started_at = time.time()
+
+    def add(self, result: Dict[str, Any]):
+        """Fold one break result into the summary"""
+        if "error" in result:
+            self.errors += 1
+            return
+
+        self.breaks_processed += 1
+        self.total_agents_planned += result['execution_plan']['agents_planned']
+        self.total_agents_invoked += result['execution_plan']['agents_invoked']
+        self.total_agents_skipped += result['execution_plan']['agents_skipped']
+        self.total_duration_ms += result['performance']['total_duration_ms']
+
+        if result['performance']['early_exit']:
+            self.early_exits += 1
+
+        action = (result.get('decision') or {}).get('action', 'UNKNOWN')
+        self.decisions[action] = self.decisions.get(action, 0) + 1
+
+    @property
+    def efficiency_percent(self) -> float:
+        if not self.total_agents_planned:
+            return 0.0
+        return round(self.total_agents_invoked / self.total_agents_planned * 100, 1)
+
+    @property
+    def avg_duration_ms(self) -> float:
+        if not self.breaks_processed:
+            return 0.0
+        return round(self.total_duration_ms / self.breaks_processed, 1)
+
+    @property
+    def wall_clock_ms(self) -> float:
+        return (time.time() - self.started_at) * 1000
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summary in the shape returned by process_multiple_breaks_async"""
+        return {
+            "total_agents_planned": self.total_agents_planned,
+            "total_agents_invoked": self.total_agents_invoked,
+            "total_agents_skipped": self.total_agents_skipped,
+            "efficiency_percent": self.efficiency_percent,
+            "early_exits": self.early_exits,
+            "total_duration_ms": self.total_duration_ms,
+            "avg_duration_ms": self.avg_duration_ms,
+            "decisions": dict(self.decisions),
+            "errors": self.errors,
+            "wall_clock_ms": round(self.wall_clock_ms, 1)
+        }
+
+
+class BatchEngine:
+    """
+    Runs breaks through a DynamicReconciliationOrchestrator concurrently
+
+    At most ``max_concurrency`` breaks are in flight at once, and calls to
+    each downstream API are capped by the process-wide downstream limiter
+    (configured once at startup, see shared.downstream_limits).
+    Results are streamed in completion order while the summary is kept
+    up to date.
+    """
+
+    def __init__(
+        self,
+        orchestrator: Any,
+        max_concurrency: int = None
+    ):
+        """
+        Initialize batch engine
+
+        Args:
+            orchestrator: DynamicReconciliationOrchestrator used for each break
+            max_concurrency: Maximum breaks processed at the same time
+        """
+        self.orchestrator = orchestrator
+        self.max_concurrency = max(1, max_concurrency or settings.batch_max_concurrency)
+        self.summary = BatchSummary()
+
+    async def stream(
+        self,
+        breaks: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process breaks concurrently and yield each result as it finishes
+
+        Args:
+            breaks: Raw breaks (sync or async iterable); consumed lazily
+
+        Yields:
+            Result of ``process_break_async`` for each break
+        """
+        self.summary = BatchSummary()
+        pending: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        finished: asyncio.Queue = asyncio.Queue()
+
+        async def produce():
+            try:
+                if hasattr(breaks, '__aiter__'):
+                    async for break_data in breaks:
+                        await pending.put(break_data)
+                else:
+                    for break_data in breaks:
+                        await pending.put(break_data)
+            finally:
+                # Release the source (e.g. an HTTP stream) if the batch stops early
+                aclose = getattr(breaks, 'aclose', None)
+                if aclose is not None:
+                    await aclose()
+                for _ in range(self.max_concurrency):
+                    await pending.put(_DONE)
+
+        async def work():
+            while True:
+                break_data = await pending.get()
+                if break_data is _DONE:
+                    break
+                try:
+                    result = await self.orchestrator.process_break_async(raw_break=break_data)
+                except Exception as e:
+                    result = {
+                        "error": f"Failed to process break: {str(e)}",
+                        "break_id": break_data.get('break_id')
+                    }
+                await finished.put(result)
+            await finished.put(_DONE)
+
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(work()) for _ in range(self.max_concurrency)]
+        active_workers = self.max_concurrency
+
+        try:
+            while active_workers:
+                result = await finished.get()
+                if result is _DONE:
+                    active_workers -= 1
+                    continue
+                self.summary.add(result)
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(
+        self,
+        breaks: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Process all breaks and collect the results
+
+        Args:
+            breaks: Raw breaks (sync or async iterable)
+
+        Returns:
+            Results in completion order plus the batch summary
+        """
+        results = [result async for result in self.stream(breaks)]
+        return {
+            "breaks_processed": self.summary.breaks_processed,
+            "results": results,
+            "summary": self.summary.as_dict()
+        }
@@ -1,8 +1,97 @@
 """
 Break Classifier - Analyzes incoming breaks and creates profiles for routing
 """
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Mapping, Sequence, Union
+
+import numpy as np
+
 from .schemas import BreakProfile, RiskTier, Materiality, Urgency
+from shared.cache import TTLCache, reference_data_cache
+
+
+# Enum members by integer code, as stored in BreakProfileBatch
+RISK_TIERS = list(RiskTier)
+MATERIALITIES = list(Materiality)
+URGENCIES = list(Urgency)
+
+
+def _factorize(values: Sequence[Any]):
+    """Distinct values in first-seen order, and each value's index into them"""
+    lookup: Dict[Any, int] = {}
+    codes = np.fromiter(
+        (lookup.setdefault(value, len(lookup)) for value in values),
+        dtype=np.int32, count=len(values)
+    )
+    return list(lookup), codes
+
+
+class BreakProfileBatch:
+    """
+    Columnar break profiles produced by ``BreakClassifier.classify_many``
+    
+    Enumerations are stored as small integer codes indexing RISK_TIERS,
+    MATERIALITIES and URGENCIES; asset classes index ``asset_classes``.
+    Individual BreakProfile objects are only built on access.
+    """
+    
+    def __init__(
+        self,
+        break_id: np.ndarray,
+        break_type: np.ndarray,
+        asset_class: np.ndarray,
+        asset_classes: List[str],
+        exposure: np.ndarray,
+        risk_tier: np.ndarray,
+        materiality: np.ndarray,
+        urgency: np.ndarray,
+        requires_matching: np.ndarray,
+        requires_pattern_analysis: np.ndarray,
+        requires_compliance_check: np.ndarray,
+        source_a: np.ndarray,
+        source_b: np.ndarray
+    ):
+        self.break_id = break_id
+        self.break_type = break_type
+        self.asset_class = asset_class
+        self.asset_classes = asset_classes
+        self.exposure = exposure
+        self.risk_tier = risk_tier
+        self.materiality = materiality
+        self.urgency = urgency
+        self.requires_matching = requires_matching
+        self.requires_pattern_analysis = requires_pattern_analysis
+        self.requires_compliance_check = requires_compliance_check
+        self.source_a = source_a
+        self.source_b = source_b
+    
+    def __len__(self) -> int:
+        return len(self.break_id)
+    
+    def __iter__(self) -> Iterator[BreakProfile]:
+        for idx in range(len(self)):
+            yield self.profile(idx)
+    
+    def profile(self, idx: int) -> BreakProfile:
+        """Materialize the BreakProfile for one break"""
+        source_systems = [
+            source for source in (self.source_a[idx], self.source_b[idx])
+            if source != 'UNKNOWN'
+        ]
+        return BreakProfile(
+            break_id=self.break_id[idx],
+            break_type=self.break_type[idx],
+            asset_class=self.asset_classes[self.asset_class[idx]],
+            exposure=float(self.exposure[idx]),
+            risk_tier=RISK_TIERS[self.risk_tier[idx]],
+            source_systems=source_systems,
+            materiality=MATERIALITIES[self.materiality[idx]],
+            urgency=URGENCIES[self.urgency[idx]],
+            requires_enrichment=True,
+            requires_matching=bool(self.requires_matching[idx]),
+            requires_pattern_analysis=bool(self.requires_pattern_analysis[idx]),
+            requires_compliance_check=bool(self.requires_compliance_check[idx]),
+            classification_confidence=1.0
+        )
 
 
 class BreakClassifier:
@@ -10,7 +99,16 @@ class BreakClassifier:
     Classifies breaks and creates profiles for dynamic routing
     """
     
-    def __init__(self):
+    def __init__(self, reference_cache: TTLCache = None):
+        """
+        Initialize classifier
+        
+        Args:
+            reference_cache: Instrument -> reference data cache consulted for
+                asset classes (defaults to the cache shared with enrichment)
+        """
+        self.reference_cache = reference_data_cache if reference_cache is None else reference_cache
+        
         # Thresholds for classification
         self.low_risk_threshold = 5000
         self.medium_risk_threshold = 50000
@@ -52,12 +150,12 @@ class BreakClassifier:
         # Calculate exposure
         exposure = self._calculate_exposure(break_data)
         
-        # Determine risk tier
-        risk_tier = self._determine_risk_tier(exposure, break_type, break_data)
-        
         # Determine asset class
         asset_class = self._determine_asset_class(break_data)
         
+        # Determine risk tier
+        risk_tier = self._determine_risk_tier(exposure, break_type, break_data, asset_class)
+        
         # Extract source systems
         source_systems = self._extract_source_systems(break_data)
         
@@ -90,6 +188,106 @@ class BreakClassifier:
             classification_confidence=1.0
         )
     
+    def classify_many(
+        self,
+        breaks: Union[Sequence[Dict[str, Any]], Mapping[str, Sequence[Any]]]
+    ) -> BreakProfileBatch:
+        """
+        Classify a batch of breaks with vectorized operations
+        
+        Produces the same profiles as ``classify`` for every break.
+        
+        Args:
+            breaks: List of raw break dicts, or a columnar mapping with
+                ``break_id``, ``break_type``, ``amount_a``, ``amount_b`` and
+                ``instrument`` columns (``source_a``/``source_b`` optional)
+        
+        Returns:
+            BreakProfileBatch
+        """
+        columns = breaks if isinstance(breaks, Mapping) else self._to_columns(breaks)
+        size = len(columns['break_id'])
+        
+        break_id = np.asarray(columns['break_id'], dtype=object)
+        break_type = np.asarray(columns['break_type'], dtype=object)
+        instruments = columns['instrument']
+        amount_a = np.abs(np.asarray(columns['amount_a'], dtype=np.float64))
+        amount_b = np.abs(np.asarray(columns['amount_b'], dtype=np.float64))
+        exposure = np.abs(amount_a - amount_b)
+        
+        # Per-type and per-instrument rules are evaluated once per distinct
+        # value and broadcast back to the batch
+        type_values, type_codes = _factorize(columns['break_type'])
+        critical_type = np.array([t in ('REGULATORY_DATA', 'LIFECYCLE_EVENT') for t in type_values], dtype=bool)
+        matching_type = np.array([self._requires_matching(t) for t in type_values], dtype=bool)
+        pattern_type = np.array([t in self.pattern_required_types for t in type_values], dtype=bool)
+        compliance_type = np.array([self._requires_compliance_check(t) for t in type_values], dtype=bool)
+        
+        instrument_values, instrument_codes = _factorize(instruments)
+        asset_classes: List[str] = []
+        asset_class_lookup = np.empty(len(instrument_values), dtype=np.int16)
+        for idx, instrument in enumerate(instrument_values):
+            asset_class = self._determine_asset_class({'entities': {'instrument': instrument}})
+            if asset_class not in asset_classes:
+                asset_classes.append(asset_class)
+            asset_class_lookup[idx] = asset_classes.index(asset_class)
+        asset_class = asset_class_lookup[instrument_codes]
+        complex_class = np.array([a in self.complex_asset_classes for a in asset_classes], dtype=bool)
+        complex_asset = complex_class[asset_class]
+        
+        # Risk tier: amount bands, elevated one step for complex assets up to
+        # HIGH, and always CRITICAL for critical break types
+        thresholds = np.array([self.low_risk_threshold, self.medium_risk_threshold, self.high_risk_threshold], dtype=np.float64)
+        risk_tier = np.searchsorted(thresholds, exposure, side='right').astype(np.int8)
+        risk_tier += (complex_asset & (risk_tier <= 1)).astype(np.int8)
+        risk_tier[critical_type[type_codes]] = RISK_TIERS.index(RiskTier.CRITICAL)
+        
+        materiality = np.searchsorted(thresholds[:2], exposure, side='right').astype(np.int8)
+        
+        # CRITICAL -> CRITICAL, HIGH -> HIGH, otherwise NORMAL
+        urgency = np.maximum(risk_tier - 1, 0).astype(np.int8)
+        
+        requires_pattern_analysis = (
+            pattern_type[type_codes]
+            | (risk_tier >= RISK_TIERS.index(RiskTier.HIGH))
+            | (exposure > self.medium_risk_threshold)
+        )
+        
+        unknown = np.full(size, 'UNKNOWN', dtype=object)
+        source_a = np.asarray(columns['source_a'], dtype=object) if 'source_a' in columns else unknown
+        source_b = np.asarray(columns['source_b'], dtype=object) if 'source_b' in columns else unknown
+        
+        return BreakProfileBatch(
+            break_id=break_id,
+            break_type=break_type,
+            asset_class=asset_class,
+            asset_classes=asset_classes,
+            exposure=exposure,
+            risk_tier=risk_tier,
+            materiality=materiality,
+            urgency=urgency,
+            requires_matching=matching_type[type_codes],
+            requires_pattern_analysis=requires_pattern_analysis,
+            requires_compliance_check=compliance_type[type_codes],
+            source_a=source_a,
+            source_b=source_b
+        )
+    
+    def _to_columns(self, breaks: Sequence[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """Extract the columns classify_many needs from raw break dicts"""
+        empty = {}
+        system_a = [b.get('system_a', empty) for b in breaks]
+        system_b = [b.get('system_b', empty) for b in breaks]
+        return {
+            'break_id': [b.get('break_id', 'UNKNOWN') for b in breaks],
+            'break_type': [b.get('break_type', 'UNKNOWN') for b in breaks],
+            'amount_a': [float(s.get('amount', 0)) for s in system_a],
+            'amount_b': [float(s.get('amount', 0)) for s in system_b],
+            'instrument': [b.get('entities', empty).get('instrument', '') for b in breaks],
+            'source_a': [s.get('source', 'UNKNOWN') if 'system_a' in b else 'UNKNOWN' for b, s in zip(breaks, system_a)],
+            'source_b': [s.get('source', 'UNKNOWN') if 'system_b' in b else 'UNKNOWN' for b, s in zip(breaks, system_b)],
+        }
+    
     def _calculate_exposure(self, break_data: Dict[str, Any]) -> float:
         """Calculate the exposure/amount at risk"""
         system_a = break_data.get('system_a', {})
@@ -107,7 +305,8 @@ class BreakClassifier:
         self, 
         exposure: float, 
         break_type: str, 
-        break_data: Dict[str, Any]
+        break_data: Dict[str, Any],
+        asset_class: str = None
     ) -> RiskTier:
         """Determine risk tier based on exposure and type"""
         # Critical types always high risk
@@ -125,7 +324,8 @@ class BreakClassifier:
             risk_tier = RiskTier.CRITICAL
         
         # Elevate risk for complex asset classes
-        asset_class = self._determine_asset_class(break_data)
+        if asset_class is None:
+            asset_class = self._determine_asset_class(break_data)
         if asset_class in self.complex_asset_classes:
             if risk_tier == RiskTier.LOW:
                 risk_tier = RiskTier.MEDIUM
@@ -139,7 +339,13 @@ class BreakClassifier:
         entities = break_data.get('entities', {})
         instrument = entities.get('instrument', '')
         
-        # Simple heuristics - in production, use reference data
+        # Reference data already cached (pre-warmed at startup or fetched
+        # by enrichment); classification never waits on the network
+        reference = self.reference_cache.get(instrument) if instrument else None
+        if reference and reference.get('asset_class'):
+            return reference['asset_class']
+        
+        # Fall back to symbol heuristics
         if instrument.startswith(('FX', 'USD', 'EUR', 'GBP')):
             return 'FX'
         elif instrument.endswith(('OPT', 'CALL', 'PUT')):
@@ -0,0 +1,259 @@
+"""
+Checkpoint Conditions - Compiles decision checkpoint conditions into predicates
+
+Conditions are small boolean expressions over named facts derived from
+agent results, e.g. ``within_tolerance and confidence > 0.85`` or
+``root_cause == 'timing_lag'``:
+
+    expr       := or_expr
+    or_expr    := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | comparison
+    comparison := operand (("<" | "<=" | ">" | ">=" | "==" | "!=") operand)?
+    operand    := fact | number | string | "true" | "false" | "always" | "(" expr ")"
+    string     := "'" chars "'" | '"' chars '"'     (no escapes)
+
+Each condition is parsed once (when the policy loads) into a closure;
+evaluating it is a handful of function calls against a CheckpointFacts view.
+"""
+import functools
+import operator
+import re
+from typing import Dict, Any, Callable, List, Tuple, FrozenSet
+
+from shared.config import settings
+
+
+class ConditionError(ValueError):
+    """Raised when a checkpoint condition cannot be parsed"""
+
+
+def _result(results: Dict[str, Any], agent: str, key: str) -> Dict[str, Any]:
+    return (results.get(agent) or {}).get(key) or {}
+
+
+def _rules(results: Dict[str, Any]) -> Dict[str, Any]:
+    return _result(results, 'RULES_TOLERANCE', 'rules_evaluation')
+
+
+def _insights(results: Dict[str, Any]) -> Dict[str, Any]:
+    return _result(results, 'PATTERN_INTELLIGENCE', 'ml_insights')
+
+
+def _match_score(results: Dict[str, Any]) -> float:
+    candidates = (results.get('MATCHING_CORRELATION') or {}).get('match_candidates') or []
+    return max((c.get('similarity_score', 0) for c in candidates), default=0.0)
+
+
+def _within_extended_tolerance(results: Dict[str, Any]) -> bool:
+    rules = _rules(results)
+    if rules.get('within_tolerance'):
+        return True
+    amount_check = rules.get('tolerance_checks', {}).get('amount')
+    if not amount_check:
+        return False
+    return amount_check.get('difference_bps', float('inf')) <= settings.extended_amount_tolerance_bps
+
+
+# Fact name -> resolver over agent results (keyed by agent name)
+FACTS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    'within_tolerance': lambda r: bool(_rules(r).get('within_tolerance', False)),
+    'within_rounding_tolerance': lambda r: bool(_rules(r).get('within_tolerance', False)),
+    'within_extended_tolerance': _within_extended_tolerance,
+    'confidence': lambda r: float(_insights(r).get('confidence', 0) or 0),
+    'root_cause': lambda r: _insights(r).get('probable_root_cause', 'unknown'),
+    'timing_lag_identified': lambda r: _insights(r).get('probable_root_cause') == 'timing_lag',
+    'broker_fee_issue': lambda r: _insights(r).get('probable_root_cause') == 'fee_mismatch',
+    'pricing_source_diff': lambda r: _insights(r).get('probable_root_cause') in (
+        'pricing_source_difference', 'fx_conversion'
+    ),
+    'match_score': _match_score,
+    'match_found': lambda r: _match_score(r) >= 0.9,
+}
+
+
+class CheckpointFacts:
+    """
+    Read-only view of agent results used to evaluate conditions
+
+    Facts are resolved on first access and memoised, so all checkpoints
+    evaluated against the same view share the work.
+    """
+
+    __slots__ = ('_results', '_values')
+
+    def __init__(self, results: Dict[str, Any]):
+        self._results = results
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            value = self._values[name] = FACTS[name](self._results)
+            return value
+
+
+class CompiledCondition:
+    """A parsed condition; call it with a CheckpointFacts view"""
+
+    __slots__ = ('source', 'facts', '_predicate')
+
+    def __init__(self, source: str, facts: FrozenSet[str], predicate: Callable[[CheckpointFacts], Any]):
+        self.source = source
+        self.facts = facts
+        self._predicate = predicate
+
+    def __call__(self, facts: CheckpointFacts) -> bool:
+        return bool(self._predicate(facts))
+
+    def __repr__(self) -> str:
+        return f"CompiledCondition({self.source!r})"
+
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:(\d+(?:\.\d*)?|\.\d+)|'([^']*)'|\"([^\"]*)\"|([A-Za-z_]\w*)|(<=|>=|==|!=|<|>|\(|\)))"
+)
+
+_COMPARISONS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+_KEYWORDS = {'and', 'or', 'not', 'true', 'false', 'always'}
+
+
+def _tokenize(source: str) -> List[Tuple[str, Any]]:
+    tokens = []
+    position = 0
+    source = source.rstrip()
+    while position < len(source):
+        match = _TOKEN_RE.match(source, position)
+        if not match:
+            raise ConditionError(f"Unexpected character {source[position:].strip()[:1]!r} in condition {source!r}")
+        number, single_quoted, double_quoted, name, symbol = match.groups()
+        if number is not None:
+            tokens.append(('number', float(number)))
+        elif single_quoted is not None or double_quoted is not None:
+            tokens.append(('string', single_quoted if single_quoted is not None else double_quoted))
+        elif name is not None:
+            lowered = name.lower()
+            tokens.append(('keyword', lowered) if lowered in _KEYWORDS else ('name', name))
+        else:
+            tokens.append(('symbol', symbol))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing closures"""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.tokens = _tokenize(source)
+        self.position = 0
+        self.facts = set()
+
+    def _peek(self) -> Tuple[str, Any]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return ('end', None)
+
+    def _accept(self, kind: str, value: Any = None) -> bool:
+        token_kind, token_value = self._peek()
+        if token_kind == kind and (value is None or token_value == value):
+            self.position += 1
+            return True
+        return False
+
+    def _error(self, message: str) -> ConditionError:
+        return ConditionError(f"{message} in condition {self.source!r}")
+
+    def parse(self) -> Callable[[CheckpointFacts], Any]:
+        if not self.tokens:
+            raise self._error("Empty expression")
+        node = self._or()
+        if self._peek()[0] != 'end':
+            raise self._error(f"Unexpected token {self._peek()[1]!r}")
+        return node
+
+    def _or(self):
+        terms = [self._and()]
+        while self._accept('keyword', 'or'):
+            terms.append(self._and())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda facts: any(term(facts) for term in terms)
+
+    def _and(self):
+        terms = [self._not()]
+        while self._accept('keyword', 'and'):
+            terms.append(self._not())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda facts: all(term(facts) for term in terms)
+
+    def _not(self):
+        if self._accept('keyword', 'not'):
+            operand = self._not()
+            return lambda facts: not operand(facts)
+        return self._comparison()
+
+    def _comparison(self):
+        left = self._operand()
+        kind, value = self._peek()
+        if kind == 'symbol' and value in _COMPARISONS:
+            self.position += 1
+            compare = _COMPARISONS[value]
+            right = self._operand()
+            return lambda facts: compare(left(facts), right(facts))
+        return left
+
+    def _operand(self):
+        kind, value = self._peek()
+        self.position += 1
+
+        if kind in ('number', 'string'):
+            return lambda facts: value
+        if kind == 'keyword' and value in ('true', 'always'):
+            return lambda facts: True
+        if kind == 'keyword' and value == 'false':
+            return lambda facts: False
+        if kind == 'name':
+            if value not in FACTS:
+                raise self._error(f"Unknown fact {value!r}")
+            self.facts.add(value)
+            return lambda facts: facts[value]
+        if kind == 'symbol' and value == '(':
+            node = self._or()
+            if not self._accept('symbol', ')'):
+                raise self._error("Missing ')'")
+            return node
+
+        raise self._error("Unexpected end of expression" if kind == 'end' else f"Unexpected token {value!r}")
+
+
+@functools.lru_cache(maxsize=512)
+def compile_condition(source: str) -> CompiledCondition:
+    """
+    Compile a checkpoint condition
+
+    Compiled conditions are cached by source text, so conditions validated
+    when the policy loads are not parsed again at execution time.
+
+    Args:
+        source: Condition expression
+
+    Returns:
+        CompiledCondition
+
+    Raises:
+        ConditionError: If the expression is malformed or uses an unknown fact
+    """
+    parser = _Parser(source)
+    predicate = parser.parse()
+    return CompiledCondition(source, frozenset(parser.facts), predicate)
@@ -2,32 +2,94 @@
 DAG Executor - Executes agents in parallel based on dependency graph
 """
 import asyncio
+import functools
 import time
 from datetime import datetime
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Callable, Tuple
 from .schemas import (
     ExecutionPlan, AgentNode, NodeExecution, 
     ExecutionGraph, DecisionCheckpoint
 )
+from .execution_backend import ExecutionBackend
+from .execution_context import ExecutionContext
+from .checkpoint_conditions import CheckpointFacts, ConditionError, compile_condition
+from .speculation import EarlyExitStats
+from .resilience import (
+    RetryPolicy, LatencyTracker, run_with_deadline, run_hedged
+)
+from shared.config import settings
+
+
+# Agents whose results each agent's inputs are built from (see
+# DAGExecutor._resolve_agent_call). Policy dependencies follow parallel
+# groups and are often stricter than this.
+AGENT_DATA_DEPENDENCIES = {
+    'BREAK_INGESTION': (),
+    'DATA_ENRICHMENT': (),
+    'MATCHING_CORRELATION': ('DATA_ENRICHMENT',),
+    'RULES_TOLERANCE': ('DATA_ENRICHMENT',),
+    'PATTERN_INTELLIGENCE': ('RULES_TOLERANCE',),
+    'DECISIONING': (
+        'DATA_ENRICHMENT', 'MATCHING_CORRELATION', 'RULES_TOLERANCE', 'PATTERN_INTELLIGENCE'
+    ),
+}
 
 
 class DAGExecutor:
     """
     Executes agents according to a DAG plan with parallel execution
+    
+    The executor holds only configuration (agents, limits, backend). All
+    per-break state lives in an ExecutionContext created for each run, so
+    one executor can execute many breaks concurrently.
     """
     
-    def __init__(self, agents: Dict[str, Any], max_parallel: int = 3):
+    def __init__(
+        self, 
+        agents: Dict[str, Any], 
+        max_parallel: int = 3,
+        backend: ExecutionBackend = None,
+        retry_policy: RetryPolicy = None,
+        latency_tracker: LatencyTracker = None,
+        hedging_enabled: bool = None,
+        speculative: bool = None,
+        early_exit_stats: EarlyExitStats = None,
+        node_budget_seconds: float = None
+    ):
         """
         Initialize DAG executor
         
         Args:
             agents: Dictionary of agent instances (name -> agent object)
-            max_parallel: Maximum number of parallel executions
+            max_parallel: Upper bound on parallel executions across any plan
+            backend: Execution backend used to run agent methods
+            retry_policy: Retry/backoff policy for failed or timed-out attempts
+            latency_tracker: Per-agent latency window used for hedging
+            hedging_enabled: Hedge read-only agents past their p95 latency
+            speculative: Start read-only agents once their input data is ready,
+                before the checkpoints gating them resolve
+            early_exit_stats: Early-exit history deciding when to speculate
+            node_budget_seconds: Total time a node may take across all of
+                its attempts and backoffs (capped at settings.agent_timeout_seconds)
         """
         self.agents = agents
         self.max_parallel = max_parallel
-        self.results = {}
-        self.executions = []
+        self.backend = backend or ExecutionBackend()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.latency_tracker = latency_tracker or LatencyTracker()
+        self.hedging_enabled = (
+            settings.hedging_enabled if hedging_enabled is None else hedging_enabled
+        )
+        self.hedge_agents = frozenset(settings.hedge_agents)
+        self.speculative = (
+            settings.speculative_execution_enabled if speculative is None else speculative
+        )
+        self.speculative_agents = frozenset(settings.speculative_agents)
+        self.early_exit_stats = early_exit_stats or EarlyExitStats()
+        self.node_budget_seconds = min(
+            settings.agent_timeout_seconds,
+            node_budget_seconds or settings.agent_timeout_seconds
+        )
     
     async def execute(
         self, 
@@ -37,6 +99,17 @@ class DAGExecutor:
         """
         Execute the execution plan
         
+        Nodes are launched as soon as all of their dependencies have finished,
+        bounded by a semaphore of ``plan.max_parallel``. Decision checkpoints
+        are evaluated after every node completion, so a slow agent never holds
+        back nodes whose dependencies are already met.
+        
+        In speculative mode, read-only agents whose input data is available
+        are also started into spare parallel slots before their policy
+        dependencies finish, unless this break profile usually exits early.
+        Speculative agents still running when a checkpoint fires are
+        cancelled and reported as wasted work.
+        
         Args:
             plan: Execution plan to execute
             break_data: Break data to process
@@ -44,9 +117,15 @@ class DAGExecutor:
         Returns:
             ExecutionGraph with all execution results
         """
-        start_time = time.time()
-        completed = set()
-        skipped = set()
+        context = ExecutionContext(plan, break_data)
+        completed = context.completed
+        skipped = context.skipped
+        running: Dict[asyncio.Task, AgentNode] = {}
+        parallel_limit = max(1, min(plan.max_parallel, self.max_parallel))
+        semaphore = asyncio.Semaphore(parallel_limit)
+        break_type = plan.break_profile.break_type
+        risk_tier = plan.break_profile.risk_tier.value
+        speculate = self.speculative and self.early_exit_stats.should_speculate(break_type, risk_tier)
         
         print(f"\n{'='*80}")
         print(f"[Dynamic Orchestrator v2] Starting execution")
@@ -56,102 +135,142 @@ class DAGExecutor:
         print(f"Plan: {len(plan.nodes)} agents planned")
         print(f"{'='*80}\n")
         
-        # Execute nodes according to DAG
-        while len(completed) + len(skipped) < len(plan.nodes):
-            # Get nodes ready to execute
-            ready_nodes = self._get_ready_nodes(plan, completed, skipped)
-            
-            if not ready_nodes:
-                # No more nodes can execute - check if we're stuck
-                if len(completed) + len(skipped) < len(plan.nodes):
-                    remaining = [n for n in plan.nodes if n.node_id not in completed and n.node_id not in skipped]
-                    print(f"⚠️  Warning: Workflow stuck. Remaining nodes: {[n.agent_name for n in remaining]}")
-                break
+        def launch(node: AgentNode):
+            task = asyncio.create_task(
+                self._execute_bounded(semaphore, node, context)
+            )
+            running[task] = node
+        
+        def launch_ready_nodes():
+            ready_nodes = self._get_ready_nodes(context)
+            if ready_nodes:
+                print(f"\n[Schedule] Launching {len(ready_nodes)} agent(s): {[n.agent_name for n in ready_nodes]}")
+            for node in ready_nodes:
+                launch(node)
             
-            # Limit parallel execution
-            batch = ready_nodes[:self.max_parallel]
+            if not speculate:
+                return
             
-            # Execute batch in parallel
-            print(f"\n[Stage] Executing {len(batch)} agent(s) in parallel: {[n.agent_name for n in batch]}")
-            results = await self._execute_parallel(batch, break_data)
+            self._confirm_speculative_nodes(context)
+            spare_slots = parallel_limit - len(running)
+            in_flight = {node.node_id for node in running.values()}
+            speculative_nodes = self._get_speculative_nodes(
+                plan, context, in_flight
+            )[:max(0, spare_slots)]
+            if speculative_nodes:
+                print(f"[Speculate] Launching {len(speculative_nodes)} agent(s) early: {[n.agent_name for n in speculative_nodes]}")
+            for node in speculative_nodes:
+                context.speculative_launches[node.node_id] = time.time()
+                context.readiness.mark_launched(node.node_id)
+                launch(node)
+        
+        # Execute nodes according to DAG, launching each node once its
+        # dependencies finish
+        launch_ready_nodes()
+        
+        while running:
+            done, _ = await asyncio.wait(
+                running.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
             
-            # Update completed and results
-            for node in batch:
-                execution = results[node.node_id]
-                self.executions.append(execution)
+            for task in done:
+                node = running.pop(task)
+                execution = self._collect_execution(task, node)
+                if node.node_id in context.speculative_launches:
+                    execution.speculative = True
+                    context.speculative_finished[node.node_id] = time.time()
+                context.record(execution)
                 
                 if execution.status == "COMPLETED":
-                    completed.add(node.node_id)
-                    self.results[node.agent_name] = execution.result
                     print(f"  ✓ {node.agent_name} completed in {execution.duration_ms:.0f}ms")
                 elif execution.status == "FAILED":
-                    completed.add(node.node_id)  # Mark as completed to continue
                     print(f"  ✗ {node.agent_name} failed: {execution.error}")
                 elif execution.status == "SKIPPED":
-                    skipped.add(node.node_id)
                     print(f"  ⊘ {node.agent_name} skipped: {execution.skip_reason}")
-            
-            # Check decision checkpoints
-            if plan.early_exit_enabled:
-                can_exit, decision = self._check_decision_checkpoints(
-                    plan, completed, self.results
+                
+                # Check decision checkpoints after each node completes
+                if not plan.early_exit_enabled:
+                    continue
+                
+                can_exit, decision = self._check_decision_checkpoints(context)
+                if not can_exit:
+                    continue
+                
+                print(f"\n[Early Exit] Decision reached: {decision.get('action')}")
+                print(f"  Reason: {decision.get('explanation', 'Checkpoint condition met')}")
+                
+                # Cancel agents still in flight and mark remaining nodes as skipped
+                for pending_task in running:
+                    pending_task.cancel()
+                if running:
+                    await asyncio.gather(*running.keys(), return_exceptions=True)
+                cancelled_at = time.time()
+                for cancelled in running.values():
+                    if cancelled.node_id in context.speculative_launches:
+                        context.speculative_finished[cancelled.node_id] = cancelled_at
+                running.clear()
+                
+                for remaining in plan.nodes:
+                    if remaining.node_id not in completed and remaining.node_id not in skipped:
+                        context.record(NodeExecution(
+                            node_id=remaining.node_id,
+                            agent_name=remaining.agent_name,
+                            status="SKIPPED",
+                            skip_reason="Early decision reached",
+                            speculative=remaining.node_id in context.speculative_launches
+                        ))
+                
+                total_time = context.elapsed_ms
+                self.early_exit_stats.record(break_type, risk_tier, True)
+                graph = ExecutionGraph(
+                    break_id=plan.break_profile.break_id,
+                    plan_id=plan.plan_id,
+                    executions=context.executions,
+                    decision=decision,
+                    early_exit=True,
+                    early_exit_reason="Decision checkpoint met",
+                    total_duration_ms=total_time,
+                    agents_invoked=len(completed),
+                    agents_skipped=len(skipped),
+                    completed_at=datetime.now(),
+                    **self._speculation_report(context)
                 )
-                if can_exit:
-                    print(f"\n[Early Exit] Decision reached: {decision.get('action')}")
-                    print(f"  Reason: {decision.get('explanation', 'Checkpoint condition met')}")
-                    
-                    # Mark remaining nodes as skipped
-                    for node in plan.nodes:
-                        if node.node_id not in completed and node.node_id not in skipped:
-                            execution = NodeExecution(
-                                node_id=node.node_id,
-                                agent_name=node.agent_name,
-                                status="SKIPPED",
-                                skip_reason="Early decision reached"
-                            )
-                            self.executions.append(execution)
-                            skipped.add(node.node_id)
-                    
-                    # Create execution graph and return
-                    total_time = (time.time() - start_time) * 1000
-                    graph = ExecutionGraph(
-                        break_id=plan.break_profile.break_id,
-                        plan_id=plan.plan_id,
-                        executions=self.executions,
-                        decision=decision,
-                        early_exit=True,
-                        early_exit_reason="Decision checkpoint met",
-                        total_duration_ms=total_time,
-                        agents_invoked=len(completed),
-                        agents_skipped=len(skipped),
-                        completed_at=datetime.now()
-                    )
-                    
-                    print(f"\n{'='*80}")
-                    print(f"[Dynamic Orchestrator v2] Execution complete (early exit)")
-                    print(f"Agents invoked: {len(completed)}/{len(plan.nodes)}")
-                    print(f"Agents skipped: {len(skipped)}")
-                    print(f"Total time: {total_time:.0f}ms")
-                    print(f"{'='*80}\n")
-                    
-                    return graph
+                
+                print(f"\n{'='*80}")
+                print(f"[Dynamic Orchestrator v2] Execution complete (early exit)")
+                print(f"Agents invoked: {len(completed)}/{len(plan.nodes)}")
+                print(f"Agents skipped: {len(skipped)}")
+                print(f"Total time: {total_time:.0f}ms")
+                self._print_speculation(graph)
+                print(f"{'='*80}\n")
+                
+                return graph
+            
+            launch_ready_nodes()
+        
+        if not context.finished:
+            # No more nodes can execute - workflow is stuck
+            remaining = [n for n in plan.nodes if n.node_id not in completed and n.node_id not in skipped]
+            print(f"⚠️  Warning: Workflow stuck. Remaining nodes: {[n.agent_name for n in remaining]}")
         
         # Make final decision if not already made
-        final_decision = self._make_final_decision(plan, self.results)
+        final_decision = self._make_final_decision(plan, context.results)
         
-        total_time = (time.time() - start_time) * 1000
+        total_time = context.elapsed_ms
+        self.early_exit_stats.record(break_type, risk_tier, False)
         
         # Create execution graph
         graph = ExecutionGraph(
             break_id=plan.break_profile.break_id,
             plan_id=plan.plan_id,
-            executions=self.executions,
+            executions=context.executions,
             decision=final_decision,
             early_exit=False,
             total_duration_ms=total_time,
             agents_invoked=len(completed),
             agents_skipped=len(skipped),
-            completed_at=datetime.now()
+            completed_at=datetime.now(),
+            **self._speculation_report(context)
         )
         
         print(f"\n{'='*80}")
@@ -160,75 +279,132 @@ class DAGExecutor:
         print(f"Agents skipped: {len(skipped)}")
         print(f"Total time: {total_time:.0f}ms")
         print(f"Decision: {final_decision.get('action')}")
+        self._print_speculation(graph)
         print(f"{'='*80}\n")
         
         return graph
     
-    def _get_ready_nodes(
-        self, 
-        plan: ExecutionPlan, 
-        completed: Set[str],
-        skipped: Set[str]
+    def _get_ready_nodes(self, context: ExecutionContext) -> List[AgentNode]:
+        """Get nodes whose dependencies have all finished and that are not yet running"""
+        return context.readiness.take_ready()
+    
+    def _get_speculative_nodes(
+        self,
+        plan: ExecutionPlan,
+        context: ExecutionContext,
+        excluded: Set[str]
     ) -> List[AgentNode]:
-        """Get nodes whose dependencies are all completed"""
-        ready = []
+        """
+        Get nodes that can start before their policy dependencies finish
+        
+        A node qualifies when its agent is read-only (``speculative_agents``)
+        and every agent its inputs are built from has already produced a
+        result or is not part of the plan.
+        """
+        planned_agents = {node.agent_name for node in plan.nodes}
+        candidates = []
         for node in plan.nodes:
-            # Skip if already processed
-            if node.node_id in completed or node.node_id in skipped:
+            if (node.node_id in context.completed or node.node_id in context.skipped
+                    or node.node_id in excluded):
+                continue
+            if node.agent_name not in self.speculative_agents:
                 continue
             
-            # Check if all dependencies are met
-            deps_met = all(
-                dep in completed or dep in skipped 
-                for dep in node.depends_on
-            )
-            
-            if deps_met:
-                ready.append(node)
+            data_deps = AGENT_DATA_DEPENDENCIES.get(node.agent_name)
+            if data_deps is None:
+                continue
+            if all(dep in context.results or dep not in planned_agents for dep in data_deps):
+                candidates.append(node)
         
-        return ready
+        return candidates
     
-    async def _execute_parallel(
-        self, 
-        nodes: List[AgentNode], 
-        break_data: Dict[str, Any]
-    ) -> Dict[str, NodeExecution]:
-        """Execute multiple nodes in parallel"""
-        tasks = []
-        for node in nodes:
-            task = self._execute_node(node, break_data)
-            tasks.append(task)
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Map results back to nodes
-        execution_map = {}
-        for node, result in zip(nodes, results):
-            if isinstance(result, Exception):
-                # Handle exception
-                execution = NodeExecution(
-                    node_id=node.node_id,
-                    agent_name=node.agent_name,
-                    status="FAILED",
-                    error=str(result),
-                    started_at=datetime.now(),
-                    completed_at=datetime.now()
-                )
+    def _confirm_speculative_nodes(self, context: ExecutionContext):
+        """Note when speculative nodes' policy dependencies finish"""
+        for node_id in context.speculative_launches:
+            if (node_id not in context.speculative_confirmed
+                    and context.readiness.dependencies_finished(node_id)):
+                context.speculative_confirmed[node_id] = time.time()
+    
+    def _speculation_report(self, context: ExecutionContext) -> Dict[str, Any]:
+        """
+        Summarize speculative work for the execution graph
+        
+        Work done before a node's policy dependencies finished is latency
+        saved; speculative nodes whose dependencies never finished (the
+        run exited early) count as wasted for as long as they ran.
+        """
+        now = time.time()
+        wasted = saved = 0.0
+        for node_id, launched_at in context.speculative_launches.items():
+            finished_at = context.speculative_finished.get(node_id, now)
+            confirmed_at = context.speculative_confirmed.get(node_id)
+            if confirmed_at is None:
+                wasted += finished_at - launched_at
             else:
-                execution = result
-            
-            execution_map[node.node_id] = execution
+                saved += min(finished_at, confirmed_at) - launched_at
+        
+        return {
+            "speculative_nodes": list(context.speculative_launches),
+            "speculative_wasted_ms": wasted * 1000,
+            "speculative_saved_ms": saved * 1000
+        }
+    
+    def _print_speculation(self, graph: ExecutionGraph):
+        if graph.speculative_nodes:
+            print(
+                f"Speculative: {len(graph.speculative_nodes)} agent(s), "
+                f"saved {graph.speculative_saved_ms:.0f}ms, wasted {graph.speculative_wasted_ms:.0f}ms"
+            )
+    
+    async def _execute_bounded(
+        self,
+        semaphore: asyncio.Semaphore,
+        node: AgentNode,
+        context: ExecutionContext
+    ) -> NodeExecution:
+        """Execute a single node once a parallel slot is available"""
+        async with semaphore:
+            return await self._execute_node(node, context)
+    
+    def _collect_execution(
+        self,
+        task: asyncio.Task,
+        node: AgentNode
+    ) -> NodeExecution:
+        """Map a finished node task back to its execution record"""
+        exception = task.exception()
+        if exception is None:
+            return task.result()
         
-        return execution_map
+        # Handle exception
+        return NodeExecution(
+            node_id=node.node_id,
+            agent_name=node.agent_name,
+            status="FAILED",
+            error=str(exception),
+            started_at=datetime.now(),
+            completed_at=datetime.now()
+        )
     
     async def _execute_node(
         self, 
         node: AgentNode, 
-        break_data: Dict[str, Any]
+        context: ExecutionContext
     ) -> NodeExecution:
-        """Execute a single node"""
+        """
+        Execute a single node
+        
+        Every attempt is bounded by ``node.timeout_seconds`` and the whole
+        node, backoffs included, by ``node_budget_seconds``; each attempt's
+        deadline shrinks to the budget left. Attempts that raise or time out
+        are retried with jittered exponential backoff, except timeouts of
+        blocking calls: their worker thread cannot be cancelled, so a retry
+        would only take a second thread. Read-only agents get a hedged
+        second attempt once the first runs past the agent's p95 latency.
+        """
         start_time = time.time()
         started_at = datetime.now()
+        deadline = time.monotonic() + self.node_budget_seconds
         
         try:
             # Get agent
@@ -236,84 +412,161 @@ class DAGExecutor:
             if not agent:
                 raise ValueError(f"Agent not found: {node.agent_name}")
             
-            # Execute agent based on type
-            if node.agent_name == 'BREAK_INGESTION':
-                result = agent.ingest_break(raw_break=break_data)
-            elif node.agent_name == 'DATA_ENRICHMENT':
-                result = agent.enrich_break(break_data)
-            elif node.agent_name == 'MATCHING_CORRELATION':
-                enriched = self.results.get('DATA_ENRICHMENT', {})
-                result = agent.find_matches(break_data, enriched.get('enriched_data', {}))
-            elif node.agent_name == 'RULES_TOLERANCE':
-                enriched = self.results.get('DATA_ENRICHMENT', {})
-                result = agent.evaluate_rules(break_data, enriched.get('enriched_data', {}))
-            elif node.agent_name == 'PATTERN_INTELLIGENCE':
-                rules = self.results.get('RULES_TOLERANCE', {})
-                result = agent.analyze_patterns(break_data, rules.get('rules_evaluation', {}))
-            elif node.agent_name == 'DECISIONING':
-                result = agent.make_decision(
-                    break_data,
-                    self.results.get('DATA_ENRICHMENT', {}),
-                    self.results.get('MATCHING_CORRELATION', {}),
-                    self.results.get('RULES_TOLERANCE', {}),
-                    self.results.get('PATTERN_INTELLIGENCE', {})
-                )
-            elif node.agent_name == 'WORKFLOW_FEEDBACK':
-                decision = self.results.get('DECISIONING', {})
-                result = agent.create_workflow(break_data, decision.get('decision', {}), self.results)
-            else:
-                raise ValueError(f"Unknown agent type: {node.agent_name}")
-            
-            duration_ms = (time.time() - start_time) * 1000
-            
-            return NodeExecution(
-                node_id=node.node_id,
-                agent_name=node.agent_name,
-                status="COMPLETED",
-                started_at=started_at,
-                completed_at=datetime.now(),
-                duration_ms=duration_ms,
-                result=result
-            )
-        
+            # Resolve agent method; it is dispatched through the backend so
+            # blocking agents run off the event loop
+            func, args = self._resolve_agent_call(agent, node, context)
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
             return NodeExecution(
                 node_id=node.node_id,
                 agent_name=node.agent_name,
                 status="FAILED",
                 started_at=started_at,
                 completed_at=datetime.now(),
-                duration_ms=duration_ms,
+                duration_ms=(time.time() - start_time) * 1000,
                 error=str(e)
             )
+        
+        def make_call():
+            return self.backend.run(node.agent_name, func, *args)
+        
+        retry_timeouts = not self.backend.runs_in_thread(func)
+        attempt_errors = []
+        attempts = 0
+        timeouts = 0
+        hedged = False
+        max_attempts = self.retry_policy.max_retries + 1
+        
+        for attempt in range(max_attempts):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                attempt_errors.append(f"Node budget of {self.node_budget_seconds:g}s exhausted")
+                break
+            timeout_seconds = min(node.timeout_seconds, remaining)
+            
+            attempts += 1
+            attempt_start = time.time()
+            try:
+                result, attempt_hedged = await self._run_attempt(node, make_call, timeout_seconds)
+            except asyncio.TimeoutError:
+                timeouts += 1
+                attempt_errors.append(
+                    f"Attempt {attempt + 1} timed out after {round(timeout_seconds, 2):g}s"
+                )
+                if not retry_timeouts:
+                    break
+            except Exception as e:
+                attempt_errors.append(f"Attempt {attempt + 1} failed: {str(e)}")
+            else:
+                hedged = hedged or attempt_hedged
+                self.latency_tracker.record(
+                    node.agent_name, (time.time() - attempt_start) * 1000
+                )
+                return NodeExecution(
+                    node_id=node.node_id,
+                    agent_name=node.agent_name,
+                    status="COMPLETED",
+                    started_at=started_at,
+                    completed_at=datetime.now(),
+                    duration_ms=(time.time() - start_time) * 1000,
+                    result=result,
+                    attempts=attempts,
+                    timeouts=timeouts,
+                    hedged=hedged,
+                    attempt_errors=attempt_errors
+                )
+            
+            if attempt + 1 < max_attempts:
+                backoff = self.retry_policy.backoff(attempt)
+                await asyncio.sleep(max(0.0, min(backoff, deadline - time.monotonic())))
+        
+        return NodeExecution(
+            node_id=node.node_id,
+            agent_name=node.agent_name,
+            status="FAILED",
+            started_at=started_at,
+            completed_at=datetime.now(),
+            duration_ms=(time.time() - start_time) * 1000,
+            error=attempt_errors[-1],
+            attempts=attempts,
+            timeouts=timeouts,
+            hedged=hedged,
+            attempt_errors=attempt_errors
+        )
+    
+    async def _run_attempt(
+        self,
+        node: AgentNode,
+        make_call: Callable[[], Any],
+        timeout_seconds: float
+    ) -> Tuple[Any, bool]:
+        """
+        Run one attempt under its deadline
+        
+        Returns:
+            (result, hedged)
+        """
+        if self.hedging_enabled and node.agent_name in self.hedge_agents:
+            p95_ms = self.latency_tracker.percentile(node.agent_name)
+            if p95_ms is not None:
+                return await run_hedged(make_call, p95_ms / 1000, timeout_seconds)
+        
+        return await run_with_deadline(make_call, timeout_seconds), False
+    
+    def _resolve_agent_call(
+        self,
+        agent: Any,
+        node: AgentNode,
+        context: ExecutionContext
+    ) -> Tuple[Callable[..., Any], tuple]:
+        """Resolve the agent method and arguments for a node"""
+        break_data = context.break_data
+        results = context.results
+        
+        if node.agent_name == 'BREAK_INGESTION':
+            return functools.partial(agent.ingest_break, raw_break=break_data), ()
+        elif node.agent_name == 'DATA_ENRICHMENT':
+            return agent.enrich_break, (break_data,)
+        elif node.agent_name == 'MATCHING_CORRELATION':
+            enriched = results.get('DATA_ENRICHMENT', {})
+            return agent.find_matches, (break_data, enriched.get('enriched_data', {}))
+        elif node.agent_name == 'RULES_TOLERANCE':
+            enriched = results.get('DATA_ENRICHMENT', {})
+            return agent.evaluate_rules, (break_data, enriched.get('enriched_data', {}))
+        elif node.agent_name == 'PATTERN_INTELLIGENCE':
+            rules = results.get('RULES_TOLERANCE', {})
+            return agent.analyze_patterns, (break_data, rules.get('rules_evaluation', {}))
+        elif node.agent_name == 'DECISIONING':
+            return agent.make_decision, (
+                break_data,
+                results.get('DATA_ENRICHMENT', {}),
+                results.get('MATCHING_CORRELATION', {}),
+                results.get('RULES_TOLERANCE', {}),
+                results.get('PATTERN_INTELLIGENCE', {})
+            )
+        elif node.agent_name == 'WORKFLOW_FEEDBACK':
+            decision = results.get('DECISIONING', {})
+            return agent.create_workflow, (break_data, decision.get('decision', {}), results)
+        
+        raise ValueError(f"Unknown agent type: {node.agent_name}")
     
     def _check_decision_checkpoints(
         self, 
-        plan: ExecutionPlan, 
-        completed: Set[str],
-        results: Dict[str, Any]
+        context: ExecutionContext
     ) -> tuple[bool, Dict[str, Any]]:
         """
         Check if any decision checkpoint is met
         
+        Only checkpoints whose nodes have all completed are evaluated.
+        
         Returns:
             (can_exit, decision)
         """
-        for checkpoint in plan.decision_checkpoints:
-            # Check if required nodes are completed
-            required_nodes = [
-                node for node in plan.nodes 
-                if node.agent_name in checkpoint.after_nodes
-            ]
-            required_ids = [node.node_id for node in required_nodes]
-            
-            if not all(node_id in completed for node_id in required_ids):
-                continue
-            
+        facts = CheckpointFacts(context.results)
+        
+        for checkpoint in context.readiness.satisfied_checkpoints:
             # Evaluate checkpoint condition
             can_decide = self._evaluate_checkpoint_condition(
-                checkpoint, results
+                checkpoint, facts
             )
             
             if can_decide:
@@ -332,44 +585,14 @@ class DAGExecutor:
     def _evaluate_checkpoint_condition(
         self, 
         checkpoint: DecisionCheckpoint,
-        results: Dict[str, Any]
+        facts: CheckpointFacts
     ) -> bool:
         """Evaluate if checkpoint condition is met"""
-        condition = checkpoint.condition
-        
-        # Simple condition evaluation
-        if condition == "always":
-            return True
-        
-        # Check rules tolerance
-        if "within_tolerance" in condition:
-            rules_result = results.get('RULES_TOLERANCE', {})
-            rules_eval = rules_result.get('rules_evaluation', {})
-            if rules_eval.get('within_tolerance'):
-                # Check confidence if specified
-                if "confidence" in condition:
-                    ml_insights = results.get('PATTERN_INTELLIGENCE', {}).get('ml_insights', {})
-                    confidence = ml_insights.get('confidence', 0)
-                    return confidence >= checkpoint.confidence_threshold
-                return True
-        
-        # Check matching
-        if "match_found" in condition:
-            matching_result = results.get('MATCHING_CORRELATION', {})
-            match_candidates = matching_result.get('match_candidates', [])
-            if match_candidates:
-                # Check if best match is above threshold
-                best_match = max(match_candidates, key=lambda x: x.get('similarity_score', 0))
-                return best_match.get('similarity_score', 0) >= 0.9
-        
-        # Check rounding tolerance
-        if "within_rounding_tolerance" in condition:
-            rules_result = results.get('RULES_TOLERANCE', {})
-            rules_eval = rules_result.get('rules_evaluation', {})
-            return rules_eval.get('within_tolerance', False)
-        
-        # Default: condition not met
-        return False
+        try:
+            return compile_condition(checkpoint.condition)(facts)
+        except ConditionError as e:
+            print(f"  ⚠ Checkpoint {checkpoint.checkpoint_id} ignored: {str(e)}")
+            return False
     
     def _make_final_decision(
         self, 
@@ -4,7 +4,7 @@ Non-linear, policy-driven orchestration with parallel execution
 """
 import asyncio
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, Optional
 from datetime import datetime
 
 from agents.break_ingestion_agent import BreakIngestionAgent
@@ -18,7 +18,10 @@ from agents.workflow_feedback_agent import WorkflowFeedbackAgent
 from .break_classifier import BreakClassifier
 from .policy_engine import PolicyEngine
 from .dag_executor import DAGExecutor
+from .execution_backend import ExecutionBackend
+from .batch_engine import BatchEngine, iterate_in_thread
 from .schemas import ExecutionGraph
+from mcp.tools.enrichment_tools import prewarm_reference_data
 
 
 class DynamicReconciliationOrchestrator:
@@ -33,22 +36,29 @@ class DynamicReconciliationOrchestrator:
     - Selective agent invocation
     """
     
-    def __init__(self, policy_file: str = None):
+    def __init__(self, policy_file: str = None, agents: Dict[str, Any] = None):
         """
         Initialize dynamic orchestrator
         
+        The orchestrator keeps no per-break state, so ``process_break_async``
+        may be awaited for many breaks concurrently on one instance.
+        
         Args:
             policy_file: Path to YAML policy file (optional)
+            agents: Pre-built agent instances keyed by name (optional)
         """
         # Initialize components
         self.classifier = BreakClassifier()
         self.policy_engine = PolicyEngine(policy_file)
         
         # Initialize all agents
-        self.agents = self._initialize_agents()
+        self.agents = agents if agents is not None else self._initialize_agents()
         
-        # Create DAG executor
-        self.dag_executor = DAGExecutor(self.agents, max_parallel=3)
+        # Create DAG executor; blocking agent calls run on per-agent thread pools
+        self.execution_backend = ExecutionBackend()
+        self.dag_executor = DAGExecutor(
+            self.agents, max_parallel=3, backend=self.execution_backend
+        )
         
         print("[Dynamic Orchestrator v2] Initialized")
         print(f"  - Break Classifier: ✓")
@@ -56,6 +66,21 @@ class DynamicReconciliationOrchestrator:
         print(f"  - {len(self.agents)} Agents: ✓")
         print(f"  - DAG Executor: ✓\n")
     
+    def prewarm_reference_data(self):
+        """
+        Bulk-load the instrument reference data shared by the classifier and enrichment
+        
+        Makes a network call, so it is an explicit startup step (gated by
+        ``settings.reference_prewarm_on_startup`` in the apps) rather than
+        part of construction. Failures only cost cache misses later.
+        """
+        try:
+            loaded = prewarm_reference_data()
+            if loaded:
+                print(f"  - Reference data pre-warmed: {loaded} instruments")
+        except Exception as e:
+            print(f"  ⚠ Reference data pre-warm failed: {str(e)}")
+    
     def _initialize_agents(self) -> Dict[str, Any]:
         """Initialize all available agents"""
         agents = {}
@@ -156,6 +181,8 @@ class DynamicReconciliationOrchestrator:
                 "agents_invoked": execution_graph.agents_invoked,
                 "agents_skipped": execution_graph.agents_skipped,
                 "early_exit": execution_graph.early_exit,
+                "speculative_saved_ms": execution_graph.speculative_saved_ms,
+                "speculative_wasted_ms": execution_graph.speculative_wasted_ms,
                 "efficiency": f"{(execution_graph.agents_invoked / len(execution_plan.nodes) * 100):.0f}%"
             }
         }
@@ -395,13 +422,18 @@ class DynamicReconciliationOrchestrator:
     
     async def process_multiple_breaks_async(
         self, 
-        limit: int = 5
+        limit: int = 5,
+        max_concurrency: int = None
     ) -> Dict[str, Any]:
         """
         Process multiple breaks asynchronously
         
+        Breaks are processed concurrently by a BatchEngine, bounded by
+        ``max_concurrency`` and the process-wide per-downstream-API limits.
+        
         Args:
             limit: Number of breaks to process
+            max_concurrency: Maximum breaks in flight (defaults to settings)
         
         Returns:
             Results for all breaks
@@ -410,83 +442,102 @@ class DynamicReconciliationOrchestrator:
         
         # Fetch breaks
         breaks_response = get_breaks(limit=limit)
-        breaks = breaks_response.get('breaks', [])
+        breaks = breaks_response if isinstance(breaks_response, list) else []
         
         if not breaks:
             return {
                 "error": "No breaks available",
+                "details": breaks_response,
                 "count": 0
             }
         
+        engine = BatchEngine(self, max_concurrency=max_concurrency)
+        
         print(f"\n{'='*80}")
-        print(f"[Dynamic Orchestrator v2] Processing {len(breaks)} breaks")
+        print(f"[Dynamic Orchestrator v2] Processing {len(breaks)} breaks "
+              f"(up to {engine.max_concurrency} concurrently)")
         print(f"{'='*80}\n")
         
-        # Process each break
+        # Process breaks concurrently, collecting results as they finish
         results = []
-        for idx, break_data in enumerate(breaks, 1):
+        async for result in engine.stream(breaks):
+            results.append(result)
             print(f"\n{'─'*80}")
-            print(f"Processing break {idx}/{len(breaks)}: {break_data.get('break_id')}")
+            print(f"Finished break {len(results)}/{len(breaks)}: {result.get('break_id')}")
             print(f"{'─'*80}")
-            
-            result = await self.process_break_async(raw_break=break_data)
-            results.append(result)
         
-        # Summary statistics
-        total_agents_planned = sum(r['execution_plan']['agents_planned'] for r in results)
-        total_agents_invoked = sum(r['execution_plan']['agents_invoked'] for r in results)
-        total_agents_skipped = sum(r['execution_plan']['agents_skipped'] for r in results)
-        total_time = sum(r['performance']['total_duration_ms'] for r in results)
-        
-        early_exits = sum(1 for r in results if r['performance']['early_exit'])
-        
-        decisions = {}
-        for r in results:
-            action = r['decision'].get('action', 'UNKNOWN')
-            decisions[action] = decisions.get(action, 0) + 1
+        summary = engine.summary.as_dict()
         
         print(f"\n{'='*80}")
         print(f"[Dynamic Orchestrator v2] Batch Processing Complete")
         print(f"{'='*80}")
-        print(f"Breaks Processed: {len(results)}")
-        print(f"Total Agents Planned: {total_agents_planned}")
-        print(f"Total Agents Invoked: {total_agents_invoked}")
-        print(f"Total Agents Skipped: {total_agents_skipped}")
-        print(f"Efficiency: {(total_agents_invoked / total_agents_planned * 100):.0f}%")
-        print(f"Early Exits: {early_exits}/{len(results)}")
-        print(f"Total Time: {total_time:.0f}ms")
-        print(f"Average Time per Break: {total_time / len(results):.0f}ms")
+        print(f"Breaks Processed: {engine.summary.breaks_processed}")
+        print(f"Errors: {summary['errors']}")
+        print(f"Total Agents Planned: {summary['total_agents_planned']}")
+        print(f"Total Agents Invoked: {summary['total_agents_invoked']}")
+        print(f"Total Agents Skipped: {summary['total_agents_skipped']}")
+        print(f"Efficiency: {summary['efficiency_percent']:.0f}%")
+        print(f"Early Exits: {summary['early_exits']}/{len(results)}")
+        print(f"Total Time: {summary['total_duration_ms']:.0f}ms")
+        print(f"Average Time per Break: {summary['avg_duration_ms']:.0f}ms")
+        print(f"Wall Clock: {summary['wall_clock_ms']:.0f}ms")
         print(f"\nDecisions:")
-        for action, count in decisions.items():
+        for action, count in summary['decisions'].items():
             print(f"  - {action}: {count}")
         print(f"{'='*80}\n")
         
         return {
-            "breaks_processed": len(results),
+            "breaks_processed": engine.summary.breaks_processed,
             "results": results,
-            "summary": {
-                "total_agents_planned": total_agents_planned,
-                "total_agents_invoked": total_agents_invoked,
-                "total_agents_skipped": total_agents_skipped,
-                "efficiency_percent": round((total_agents_invoked / total_agents_planned * 100), 1),
-                "early_exits": early_exits,
-                "total_duration_ms": total_time,
-                "avg_duration_ms": round(total_time / len(results), 1),
-                "decisions": decisions
-            }
+            "summary": summary
         }
     
-    def process_multiple_breaks(self, limit: int = 5) -> Dict[str, Any]:
+    async def stream_breaks_async(
+        self,
+        limit: int = 1000,
+        break_type: str = None,
+        max_concurrency: int = None,
+        engine: BatchEngine = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream breaks from the API through the orchestrator
+        
+        Breaks are read from the NDJSON stream as they arrive and results
+        are yielded as soon as each break finishes; nothing is accumulated,
+        so memory stays flat however large the backlog is.
+        
+        Args:
+            limit: Number of breaks to stream
+            break_type: Optional filter by break type
+            max_concurrency: Maximum breaks in flight (defaults to settings)
+            engine: BatchEngine to run on (e.g. to read its summary afterwards)
+        
+        Yields:
+            Result of ``process_break_async`` for each break, in completion order
+        """
+        from mcp.tools.break_tools import stream_breaks
+        
+        engine = engine or BatchEngine(self, max_concurrency=max_concurrency)
+        breaks = iterate_in_thread(stream_breaks(limit=limit, break_type=break_type))
+        async for result in engine.stream(breaks):
+            yield result
+    
+    def process_multiple_breaks(
+        self, 
+        limit: int = 5, 
+        max_concurrency: int = None
+    ) -> Dict[str, Any]:
         """
         Process multiple breaks (synchronous wrapper)
         
         Args:
             limit: Number of breaks to process
+            max_concurrency: Maximum breaks in flight (defaults to settings)
         
         Returns:
             Results for all breaks
         """
-        return asyncio.run(self.process_multiple_breaks_async(limit))
+        return asyncio.run(self.process_multiple_breaks_async(limit, max_concurrency))
     
     def get_policy_info(self) -> Dict[str, Any]:
         """Get information about loaded policies"""
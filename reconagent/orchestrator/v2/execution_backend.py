@@ -0,0 +1,105 @@
+"""
+Execution Backend - Dispatches agent calls without blocking the event loop
+"""
+import asyncio
+import functools
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from shared.config import settings
+
+
+class ExecutionBackend:
+    """
+    Runs agent methods on behalf of the DAG executor
+
+    Native coroutine functions are awaited directly on the event loop.
+    Blocking callables (the agents' ``requests``-based tool calls) are
+    dispatched to a bounded thread pool per agent, so independent agents
+    in the same stage genuinely run concurrently.
+    """
+
+    def __init__(
+        self,
+        default_pool_size: int = None,
+        agent_pool_sizes: Dict[str, int] = None
+    ):
+        """
+        Initialize execution backend
+
+        Args:
+            default_pool_size: Worker threads per agent pool
+            agent_pool_sizes: Per-agent overrides (agent name -> worker threads)
+        """
+        self.default_pool_size = default_pool_size or settings.agent_thread_pool_size
+        self.agent_pool_sizes = {
+            name.upper(): size
+            for name, size in (agent_pool_sizes or settings.agent_thread_pool_sizes).items()
+        }
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def pool_size(self, agent_name: str) -> int:
+        """Get the configured worker count for an agent"""
+        return max(1, self.agent_pool_sizes.get(agent_name.upper(), self.default_pool_size))
+
+    def get_pool(self, agent_name: str) -> ThreadPoolExecutor:
+        """Get (or lazily create) the thread pool for an agent"""
+        key = agent_name.upper()
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = ThreadPoolExecutor(
+                        max_workers=self.pool_size(key),
+                        thread_name_prefix=f"agent-{key.lower()}"
+                    )
+                    self._pools[key] = pool
+        return pool
+
+    def runs_in_thread(self, func: Callable[..., Any]) -> bool:
+        """
+        True if ``func`` is dispatched to a thread pool
+
+        Such calls cannot be cancelled: abandoning one on timeout leaves its
+        worker thread busy until the call returns.
+        """
+        return not inspect.iscoroutinefunction(func)
+
+    async def run(
+        self,
+        agent_name: str,
+        func: Callable[..., Any],
+        *args,
+        **kwargs
+    ) -> Any:
+        """
+        Run an agent method
+
+        Args:
+            agent_name: Agent the call belongs to (selects the thread pool)
+            func: Agent method to invoke
+            *args, **kwargs: Arguments for the method
+
+        Returns:
+            The method's result
+        """
+        if not self.runs_in_thread(func):
+            return await func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.get_pool(agent_name),
+            functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self, wait: bool = True):
+        """Shut down all agent thread pools"""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=wait)
@@ -0,0 +1,64 @@
+"""
+Execution Context - Per-run state for a single execution of a plan
+"""
+import time
+from typing import Dict, Any, List, Set
+from .schemas import ExecutionPlan, NodeExecution
+from .readiness import PlanIndex, ReadinessTracker
+
+
+class ExecutionContext:
+    """
+    Holds everything that changes while one break is executed
+
+    The DAG executor itself keeps no per-break state; each call to
+    ``DAGExecutor.execute`` gets a fresh context, so a single executor
+    can run many breaks concurrently without results leaking between them.
+    """
+
+    def __init__(self, plan: ExecutionPlan, break_data: Dict[str, Any]):
+        """
+        Initialize execution context
+
+        Args:
+            plan: Execution plan being executed
+            break_data: Break data being processed
+        """
+        self.plan = plan
+        self.break_data = break_data
+        self.results: Dict[str, Any] = {}
+        self.executions: List[NodeExecution] = []
+        self.completed: Set[str] = set()
+        self.skipped: Set[str] = set()
+        self.readiness = ReadinessTracker(PlanIndex.for_plan(plan))
+        self.start_time = time.time()
+        
+        # Speculative nodes: node_id -> launch / finish / dependencies-met time
+        self.speculative_launches: Dict[str, float] = {}
+        self.speculative_finished: Dict[str, float] = {}
+        self.speculative_confirmed: Dict[str, float] = {}
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the run started"""
+        return (time.time() - self.start_time) * 1000
+
+    @property
+    def finished(self) -> bool:
+        """Whether every node has completed or been skipped"""
+        return len(self.completed) + len(self.skipped) >= len(self.plan.nodes)
+
+    def record(self, execution: NodeExecution):
+        """Record a node execution and update completion state"""
+        self.executions.append(execution)
+
+        if execution.status == "COMPLETED":
+            self.completed.add(execution.node_id)
+            self.results[execution.agent_name] = execution.result
+            self.readiness.mark_finished(execution.node_id)
+        elif execution.status == "FAILED":
+            self.completed.add(execution.node_id)  # Mark as completed to continue
+            self.readiness.mark_finished(execution.node_id)
+        elif execution.status == "SKIPPED":
+            self.skipped.add(execution.node_id)
+            self.readiness.mark_finished(execution.node_id, completed=False)
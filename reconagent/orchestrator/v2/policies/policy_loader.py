@@ -3,76 +3,291 @@ Policy loader - Loads and validates routing policies from YAML
 """
 import yaml
 import os
-from typing import Dict, Any
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+from pydantic import ValidationError
+
+from ..checkpoint_conditions import ConditionError, compile_condition
+from ..schemas import RiskTier, RoutingPolicy
+from shared.config import settings
+
+
+class PolicyLoadError(ValueError):
+    """Raised when a policy file cannot be parsed or validated"""
+
+
+# Ultimate fallback - minimal policy used when neither the break type nor
+# DEFAULT has a policy for the risk tier
+FALLBACK_POLICY = RoutingPolicy(
+    policy_id="FALLBACK",
+    break_type="DEFAULT",
+    risk_tier=RiskTier.MEDIUM,
+    mandatory_agents=['BREAK_INGESTION', 'DATA_ENRICHMENT', 'DECISIONING'],
+    optional_agents=[],
+    parallel_groups=[['DATA_ENRICHMENT'], ['DECISIONING']],
+    decision_checkpoints=[],
+    max_parallel=2,
+    early_exit_enabled=False
+)
+
+
+class PolicySnapshot:
+    """
+    One loaded version of the policy file
+
+    Snapshots are never modified after they are built; reloading swaps in a
+    new snapshot with a single attribute assignment, so readers need no lock.
+    """
+
+    __slots__ = ('version', 'mtime', 'table', 'risk_tiers')
+
+    def __init__(
+        self,
+        version: int,
+        mtime: Optional[int],
+        table: Dict[Tuple[str, str], RoutingPolicy]
+    ):
+        self.version = version
+        self.mtime = mtime
+        self.table = table
+        self.risk_tiers: Dict[str, List[str]] = {}
+        for break_type, risk_tier in table:
+            self.risk_tiers.setdefault(break_type, []).append(risk_tier)
+
 
 class PolicyLoader:
     """
     Loads routing policies from YAML files
+
+    Policies are validated into RoutingPolicy models when the file loads
+    and kept in a flat (break_type, risk_tier) table. Changes to the file
+    are picked up by polling its mtime, either from ``reload_if_changed``
+    or from a background watcher thread; an invalid file is rejected and
+    the previous policies stay in force.
     """
-    
-    def __init__(self, policy_file: str = None):
+
+    def __init__(self, policy_file: str = None, watch: bool = None):
+        """
+        Initialize policy loader
+
+        Args:
+            policy_file: Path to the YAML policy file
+            watch: Start a background thread that reloads the file when it
+                changes (defaults to ``settings.policy_watch_enabled``)
+
+        Raises:
+            PolicyLoadError: If the policy file is malformed or invalid
+        """
         if policy_file is None:
             # Default to routing_policies.yaml in same directory
             current_dir = Path(__file__).parent
             policy_file = current_dir / "routing_policies.yaml"
-        
+
         self.policy_file = policy_file
-        self.policies = self._load_policies()
-    
-    def _load_policies(self) -> Dict[str, Any]:
-        """Load policies from YAML file"""
+        self._reload_lock = threading.Lock()
+        self._rejected_mtime = None
+        self._last_check = time.monotonic()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+
         try:
-            with open(self.policy_file, 'r') as f:
-                data = yaml.safe_load(f)
-                return data.get('policies', {})
+            self._snapshot = self._load_snapshot(version=1)
         except FileNotFoundError:
             print(f"Warning: Policy file not found: {self.policy_file}")
-            return {}
+            self._snapshot = PolicySnapshot(1, None, {})
+
+        if settings.policy_watch_enabled if watch is None else watch:
+            self.start_watching()
+
+    @property
+    def version(self) -> int:
+        """Version of the policies currently in force"""
+        return self._snapshot.version
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.policy_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load_snapshot(self, version: int) -> PolicySnapshot:
+        """
+        Parse and validate the policy file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            PolicyLoadError: If the file is malformed or any policy is invalid
+        """
+        mtime = self._file_mtime()
+        try:
+            with open(self.policy_file, 'r') as f:
+                data = yaml.safe_load(f) or {}
         except yaml.YAMLError as e:
-            print(f"Error parsing policy file: {e}")
-            return {}
-    
-    def get_policy(self, break_type: str, risk_tier: str) -> Dict[str, Any]:
+            raise PolicyLoadError(f"Error parsing policy file {self.policy_file}: {e}")
+
+        if not isinstance(data, dict):
+            raise PolicyLoadError(
+                f"Invalid policy file {self.policy_file}: expected a mapping, got {type(data).__name__}"
+            )
+        policies = data.get('policies') or {}
+        if not isinstance(policies, dict):
+            raise PolicyLoadError(
+                f"Invalid policy file {self.policy_file}: policies must be a mapping, "
+                f"got {type(policies).__name__}"
+            )
+
+        table = {}
+        errors = []
+        for break_type, tiers in policies.items():
+            if not isinstance(tiers or {}, dict):
+                errors.append(f"{break_type}: risk tiers must be a mapping, got {type(tiers).__name__}")
+                continue
+            for risk_tier, config in (tiers or {}).items():
+                try:
+                    table[(break_type, risk_tier)] = self._compile_policy(break_type, risk_tier, config)
+                except (ValidationError, TypeError, ValueError) as e:
+                    errors.append(f"{break_type}/{risk_tier}: {e}")
+
+        if errors:
+            raise PolicyLoadError(
+                f"Invalid policies in {self.policy_file}:\n" + "\n".join(errors)
+            )
+
+        return PolicySnapshot(version, mtime, table)
+
+    def _compile_policy(self, break_type: str, risk_tier: str, config: Dict[str, Any]) -> RoutingPolicy:
+        """
+        Validate one policy and compile its checkpoint conditions
+
+        Raises:
+            TypeError: If the policy or a checkpoint is not a mapping
+            ValueError: If a checkpoint condition does not compile
+            ValidationError: If the policy does not match RoutingPolicy
+        """
+        if not isinstance(config, dict):
+            raise TypeError(f"policy must be a mapping, got {type(config).__name__}")
+
+        checkpoints = config.get('decision_checkpoints') or []
+        if not isinstance(checkpoints, list):
+            raise TypeError(f"decision_checkpoints must be a list, got {type(checkpoints).__name__}")
+        for index, checkpoint in enumerate(checkpoints):
+            if not isinstance(checkpoint, dict):
+                raise TypeError(f"checkpoint {index} must be a mapping, got {type(checkpoint).__name__}")
+            condition = checkpoint.get('condition', 'always')
+            if not isinstance(condition, str):
+                raise TypeError(f"checkpoint {index} condition must be a string, got {type(condition).__name__}")
+            try:
+                compile_condition(condition)
+            except ConditionError as e:
+                raise ValueError(f"checkpoint {index}: {e}")
+
+        return RoutingPolicy(
+            policy_id=f"{break_type}_{risk_tier}",
+            break_type=break_type,
+            risk_tier=risk_tier,
+            **config
+        )
+
+    def reload(self) -> bool:
+        """
+        Reload and validate the policy file, swapping it in if valid
+
+        Returns:
+            True if new policies are now in force
+        """
+        with self._reload_lock:
+            current = self._snapshot
+            try:
+                snapshot = self._load_snapshot(version=current.version + 1)
+            except Exception as e:
+                # Whatever is wrong with the file, keep the policies in force
+                # and do not re-read it until it changes again
+                self._rejected_mtime = self._file_mtime()
+                print(f"Error reloading policies, keeping version {current.version}: {e}")
+                return False
+
+            self._snapshot = snapshot
+            self._rejected_mtime = None
+            print(f"Reloaded policy file {self.policy_file} (version {snapshot.version})")
+            return True
+
+    def _reload_if_modified(self) -> bool:
+        mtime = self._file_mtime()
+        if mtime is None or mtime == self._snapshot.mtime or mtime == self._rejected_mtime:
+            return False
+        return self.reload()
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the policy file if it changed on disk
+
+        The file is stat'ed at most once per ``settings.policy_reload_check_seconds``.
+
+        Returns:
+            True if the policies were reloaded
+        """
+        now = time.monotonic()
+        if now - self._last_check < settings.policy_reload_check_seconds:
+            return False
+        self._last_check = now
+        return self._reload_if_modified()
+
+    def start_watching(self, interval_seconds: float = None):
+        """
+        Poll the policy file in a background thread and reload it on change
+
+        Args:
+            interval_seconds: Poll interval (defaults to ``settings.policy_reload_check_seconds``)
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+
+        interval = settings.policy_reload_check_seconds if interval_seconds is None else interval_seconds
+        self._stop_watching.clear()
+
+        def watch():
+            while not self._stop_watching.wait(interval):
+                try:
+                    self._reload_if_modified()
+                except Exception as e:
+                    print(f"Error watching policy file: {e}")
+
+        self._watcher = threading.Thread(target=watch, name="policy-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        """Stop the background watcher thread"""
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def get_policy(self, break_type: str, risk_tier: str) -> RoutingPolicy:
         """
         Get policy for a specific break type and risk tier
-        
+
         Args:
             break_type: Type of break (e.g., 'TRADE_OMS_MISMATCH')
             risk_tier: Risk tier (e.g., 'LOW', 'MEDIUM', 'HIGH')
-        
+
         Returns:
-            Policy dictionary or default policy
+            Policy for the break type, else the DEFAULT policy for the tier,
+            else a minimal fallback policy
         """
-        # Try to get specific policy
-        if break_type in self.policies:
-            type_policies = self.policies[break_type]
-            if risk_tier in type_policies:
-                return type_policies[risk_tier]
-        
-        # Fall back to DEFAULT policy
-        if 'DEFAULT' in self.policies:
-            default_policies = self.policies['DEFAULT']
-            if risk_tier in default_policies:
-                return default_policies[risk_tier]
-        
-        # Ultimate fallback - minimal policy
-        return {
-            'mandatory_agents': ['BREAK_INGESTION', 'DATA_ENRICHMENT', 'DECISIONING'],
-            'optional_agents': [],
-            'parallel_groups': [['DATA_ENRICHMENT'], ['DECISIONING']],
-            'decision_checkpoints': [],
-            'max_parallel': 2,
-            'early_exit_enabled': False
-        }
-    
+        table = self._snapshot.table
+        return (
+            table.get((break_type, risk_tier))
+            or table.get(('DEFAULT', risk_tier))
+            or FALLBACK_POLICY
+        )
+
     def list_break_types(self) -> list:
         """List all break types with policies"""
-        return list(self.policies.keys())
-    
+        return list(self._snapshot.risk_tiers.keys())
+
     def list_risk_tiers(self, break_type: str) -> list:
         """List risk tiers for a specific break type"""
-        if break_type in self.policies:
-            return list(self.policies[break_type].keys())
-        return []
+        return list(self._snapshot.risk_tiers.get(break_type, []))
@@ -1,23 +1,76 @@
 """
 Policy Engine - Translates break profiles into execution plans
 """
+import threading
 import uuid
-from typing import Dict, Any, List
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Tuple
 from .schemas import (
     BreakProfile, ExecutionPlan, AgentNode, 
-    DecisionCheckpoint, RiskTier
+    DecisionCheckpoint, RiskTier, RoutingPolicy
 )
 from .policies.policy_loader import PolicyLoader
+from .readiness import PlanIndex
+from shared.config import settings
+
+
+class PlanTemplate:
+    """
+    Immutable, break-independent part of an execution plan
+    
+    Nodes and checkpoints are frozen models shared by every plan
+    instantiated from the template, together with their scheduling index.
+    """
+    
+    __slots__ = ('nodes', 'decision_checkpoints', 'max_parallel',
+                 'early_exit_enabled', 'policy_version', 'index')
+    
+    def __init__(self, plan: ExecutionPlan):
+        self.nodes = tuple(plan.nodes)
+        self.decision_checkpoints = tuple(plan.decision_checkpoints)
+        self.max_parallel = plan.max_parallel
+        self.early_exit_enabled = plan.early_exit_enabled
+        self.policy_version = plan.policy_version
+        self.index = PlanIndex.for_plan(plan)
+    
+    def instantiate(self, break_profile: BreakProfile) -> ExecutionPlan:
+        """Create a plan for one break without re-validating the template"""
+        plan = ExecutionPlan.model_construct(
+            plan_id=f"PLAN-{uuid.uuid4().hex[:8]}",
+            break_profile=break_profile,
+            nodes=list(self.nodes),
+            decision_checkpoints=list(self.decision_checkpoints),
+            max_parallel=self.max_parallel,
+            early_exit_enabled=self.early_exit_enabled,
+            policy_version=self.policy_version,
+            created_at=datetime.now()
+        )
+        plan._index = self.index
+        return plan
 
 
 class PolicyEngine:
     """
     Policy engine that generates execution plans based on break profiles
+    
+    Plans depend only on the break's plan signature (break type, risk tier
+    and routing hints), so they are built once per signature and cached as
+    PlanTemplates. The cache is cleared whenever the policy file changes.
     """
     
-    def __init__(self, policy_file: str = None):
+    def __init__(self, policy_file: str = None, plan_cache_size: int = None):
         self.policy_loader = PolicyLoader(policy_file)
         
+        # LRU cache of plan templates keyed on plan signature
+        self.plan_cache_size = settings.plan_cache_size if plan_cache_size is None else plan_cache_size
+        self._plan_cache: "OrderedDict[Tuple, PlanTemplate]" = OrderedDict()
+        self._plan_cache_version = self.policy_loader.version
+        self._plan_cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_invalidations = 0
+        
         # Agent name mapping (policy name -> actual agent class)
         self.agent_mapping = {
             'BREAK_INGESTION': 'break_ingestion',
@@ -29,6 +82,16 @@ class PolicyEngine:
             'WORKFLOW_FEEDBACK': 'workflow_feedback'
         }
     
+    @staticmethod
+    def plan_signature(break_profile: BreakProfile) -> Tuple:
+        """Everything about a break profile that the plan depends on"""
+        return (
+            break_profile.break_type,
+            break_profile.risk_tier.value,
+            break_profile.requires_matching,
+            break_profile.requires_pattern_analysis
+        )
+    
     def create_execution_plan(self, break_profile: BreakProfile) -> ExecutionPlan:
         """
         Create an execution plan based on break profile
@@ -39,6 +102,52 @@ class PolicyEngine:
         Returns:
             ExecutionPlan with nodes and dependencies
         """
+        self.policy_loader.reload_if_changed()
+        key = self.plan_signature(break_profile)
+        
+        with self._plan_cache_lock:
+            if self._plan_cache_version != self.policy_loader.version:
+                self._plan_cache.clear()
+                self._plan_cache_version = self.policy_loader.version
+                self._cache_invalidations += 1
+            
+            template = self._plan_cache.get(key)
+            if template is not None:
+                self._plan_cache.move_to_end(key)
+                self._cache_hits += 1
+                return template.instantiate(break_profile)
+            self._cache_misses += 1
+            version = self._plan_cache_version
+        
+        template = PlanTemplate(self._build_execution_plan(break_profile))
+        
+        with self._plan_cache_lock:
+            if self.plan_cache_size > 0 and version == self._plan_cache_version:
+                self._plan_cache[key] = template
+                self._plan_cache.move_to_end(key)
+                while len(self._plan_cache) > self.plan_cache_size:
+                    self._plan_cache.popitem(last=False)
+        
+        return template.instantiate(break_profile)
+    
+    def cache_info(self) -> Dict[str, int]:
+        """Plan cache statistics"""
+        with self._plan_cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "invalidations": self._cache_invalidations,
+                "size": len(self._plan_cache),
+                "max_size": self.plan_cache_size
+            }
+    
+    def clear_plan_cache(self):
+        """Drop all cached plan templates"""
+        with self._plan_cache_lock:
+            self._plan_cache.clear()
+    
+    def _build_execution_plan(self, break_profile: BreakProfile) -> ExecutionPlan:
+        """Build a validated execution plan from the current policy"""
         # Get policy for this break type and risk tier
         policy = self.policy_loader.get_policy(
             break_profile.break_type,
@@ -57,8 +166,8 @@ class PolicyEngine:
             break_profile=break_profile,
             nodes=nodes,
             decision_checkpoints=checkpoints,
-            max_parallel=policy.get('max_parallel', 3),
-            early_exit_enabled=policy.get('early_exit_enabled', True),
+            max_parallel=policy.max_parallel,
+            early_exit_enabled=policy.early_exit_enabled,
             policy_version="2.0.0"
         )
         
@@ -66,23 +175,24 @@ class PolicyEngine:
     
     def _build_nodes(
         self, 
-        policy: Dict[str, Any], 
+        policy: RoutingPolicy, 
         break_profile: BreakProfile
     ) -> List[AgentNode]:
         """
         Build agent nodes from policy
         
         Args:
-            policy: Policy dictionary
+            policy: Routing policy
             break_profile: Break profile for conditional logic
         
         Returns:
             List of AgentNode objects
         """
         nodes = []
-        mandatory_agents = policy.get('mandatory_agents', [])
-        optional_agents = policy.get('optional_agents', [])
-        parallel_groups = policy.get('parallel_groups', [])
+        mandatory_agents = policy.mandatory_agents
+        optional_agents = policy.optional_agents
+        parallel_groups = policy.parallel_groups
+        node_timeouts = policy.node_timeouts
         
         # Track which agents have been added
         added_agents = set()
@@ -113,7 +223,8 @@ class PolicyEngine:
                     agent_name=agent_name,
                     depends_on=previous_group_agents.copy() if group_idx > 0 else [],
                     can_run_parallel=len(group) > 1,
-                    is_mandatory=is_mandatory
+                    is_mandatory=is_mandatory,
+                    timeout_seconds=node_timeouts.get(agent_name, settings.node_timeout_seconds)
                 )
                 
                 nodes.append(node)
@@ -147,18 +258,18 @@ class PolicyEngine:
         # Default: include all optional agents
         return True
     
-    def _build_checkpoints(self, policy: Dict[str, Any]) -> List[DecisionCheckpoint]:
+    def _build_checkpoints(self, policy: RoutingPolicy) -> List[DecisionCheckpoint]:
         """
         Build decision checkpoints from policy
         
         Args:
-            policy: Policy dictionary
+            policy: Routing policy
         
         Returns:
             List of DecisionCheckpoint objects
         """
         checkpoints = []
-        checkpoint_configs = policy.get('decision_checkpoints', [])
+        checkpoint_configs = policy.decision_checkpoints
         
         for idx, config in enumerate(checkpoint_configs):
             checkpoint = DecisionCheckpoint(
@@ -183,10 +294,8 @@ class PolicyEngine:
         Returns:
             List of node IDs that this node depends on
         """
-        for node in plan.nodes:
-            if node.node_id == node_id:
-                return node.depends_on
-        return []
+        node = PlanIndex.for_plan(plan).nodes.get(node_id)
+        return node.depends_on if node else []
     
     def get_next_agents(self, plan: ExecutionPlan, completed: set) -> List[AgentNode]:
         """
@@ -199,16 +308,4 @@ class PolicyEngine:
         Returns:
             List of AgentNode objects ready to execute
         """
-        ready = []
-        for node in plan.nodes:
-            # Skip if already completed
-            if node.node_id in completed:
-                continue
-            
-            # Check if all dependencies are met
-            deps_met = all(dep in completed for dep in node.depends_on)
-            
-            if deps_met:
-                ready.append(node)
-        
-        return ready
+        return PlanIndex.for_plan(plan).ready_after(completed)
@@ -0,0 +1,151 @@
+"""
+Readiness - Precomputed scheduling index for execution plans
+
+PlanIndex is built once per ExecutionPlan and holds everything about the
+DAG that does not change while it runs: dependency counts, reverse
+adjacency and which nodes each decision checkpoint waits for.
+ReadinessTracker updates readiness incrementally as nodes finish, so
+finding the next nodes to launch costs O(out-degree) per completion
+instead of a rescan of every node and dependency.
+"""
+import heapq
+from typing import Dict, List, Set, FrozenSet, Tuple
+
+from .schemas import AgentNode, DecisionCheckpoint, ExecutionPlan
+
+
+class PlanIndex:
+    """
+    Static scheduling index for one ExecutionPlan
+    """
+
+    def __init__(self, plan: ExecutionPlan):
+        """
+        Build the index
+
+        Args:
+            plan: Execution plan to index
+        """
+        self.nodes: Dict[str, AgentNode] = {node.node_id: node for node in plan.nodes}
+        self.position: Dict[str, int] = {node.node_id: idx for idx, node in enumerate(plan.nodes)}
+        self.in_degree: Dict[str, int] = {}
+        self.dependents: Dict[str, List[str]] = {node_id: [] for node_id in self.nodes}
+        self.agent_nodes: Dict[str, List[str]] = {}
+
+        for node in plan.nodes:
+            # Dependencies outside the plan are counted but never finish,
+            # matching the scan-based scheduler (the node is never ready)
+            deps = set(node.depends_on)
+            self.in_degree[node.node_id] = len(deps)
+            for dep in deps:
+                self.dependents.setdefault(dep, []).append(node.node_id)
+            self.agent_nodes.setdefault(node.agent_name, []).append(node.node_id)
+
+        self.roots: List[str] = [node.node_id for node in plan.nodes if not self.in_degree[node.node_id]]
+
+        # Checkpoint -> node ids it waits for, and the reverse
+        self.checkpoints: List[DecisionCheckpoint] = list(plan.decision_checkpoints)
+        self.checkpoint_nodes: List[FrozenSet[str]] = []
+        self.node_checkpoints: Dict[str, List[int]] = {}
+        for cp_idx, checkpoint in enumerate(self.checkpoints):
+            required = frozenset(
+                node_id
+                for agent_name in checkpoint.after_nodes
+                for node_id in self.agent_nodes.get(agent_name, ())
+            )
+            self.checkpoint_nodes.append(required)
+            for node_id in required:
+                self.node_checkpoints.setdefault(node_id, []).append(cp_idx)
+
+    @classmethod
+    def for_plan(cls, plan: ExecutionPlan) -> "PlanIndex":
+        """Index for ``plan``, built on first use and kept on the plan"""
+        index = plan._index
+        if index is None:
+            index = plan._index = cls(plan)
+        return index
+
+    def ready_after(self, completed: Set[str]) -> List[AgentNode]:
+        """
+        Nodes not in ``completed`` whose dependencies are all in ``completed``
+
+        Only the roots and the dependents of completed nodes are examined.
+        """
+        candidates = set(self.roots)
+        for node_id in completed:
+            candidates.update(self.dependents.get(node_id, ()))
+
+        ready = [
+            node_id for node_id in candidates
+            if node_id not in completed
+            and all(dep in completed for dep in self.nodes[node_id].depends_on)
+        ]
+        ready.sort(key=self.position.__getitem__)
+        return [self.nodes[node_id] for node_id in ready]
+
+
+class ReadinessTracker:
+    """
+    Per-run readiness state over a PlanIndex
+    """
+
+    def __init__(self, index: PlanIndex):
+        self.index = index
+        self._remaining = dict(index.in_degree)
+        self._checkpoint_remaining = [len(required) for required in index.checkpoint_nodes]
+        self._ready: List[Tuple[int, str]] = [(index.position[n], n) for n in index.roots]
+        heapq.heapify(self._ready)
+        self._launched: Set[str] = set()
+        self._finished: Set[str] = set()
+        self._satisfied: List[int] = [
+            cp_idx for cp_idx, remaining in enumerate(self._checkpoint_remaining) if not remaining
+        ]
+
+    def mark_launched(self, node_id: str):
+        """Record that a node was started, even if it was not ready yet"""
+        self._launched.add(node_id)
+
+    def mark_finished(self, node_id: str, completed: bool = True):
+        """
+        Record that a node finished and release its dependents
+
+        Args:
+            node_id: Finished node
+            completed: False for skipped nodes, which unblock dependents but
+                do not count towards decision checkpoints
+        """
+        if node_id in self._finished:
+            return
+        self._finished.add(node_id)
+
+        for dependent in self.index.dependents.get(node_id, ()):
+            self._remaining[dependent] -= 1
+            if not self._remaining[dependent]:
+                heapq.heappush(self._ready, (self.index.position[dependent], dependent))
+
+        if completed:
+            for cp_idx in self.index.node_checkpoints.get(node_id, ()):
+                self._checkpoint_remaining[cp_idx] -= 1
+                if not self._checkpoint_remaining[cp_idx]:
+                    self._satisfied.append(cp_idx)
+
+    def take_ready(self) -> List[AgentNode]:
+        """Pop nodes that became ready and were not launched yet, in plan order"""
+        ready = []
+        while self._ready:
+            _, node_id = heapq.heappop(self._ready)
+            if node_id in self._launched or node_id in self._finished:
+                continue
+            self._launched.add(node_id)
+            ready.append(self.index.nodes[node_id])
+        return ready
+
+    def dependencies_finished(self, node_id: str) -> bool:
+        """Whether every dependency of a node has finished"""
+        return not self._remaining[node_id]
+
+    @property
+    def satisfied_checkpoints(self) -> List[DecisionCheckpoint]:
+        """Checkpoints whose nodes have all completed, in plan order"""
+        self._satisfied.sort()
+        return [self.index.checkpoints[cp_idx] for cp_idx in self._satisfied]
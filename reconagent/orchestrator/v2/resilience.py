@@ -0,0 +1,142 @@
+"""
+Resilience helpers for node execution - deadlines, retries and hedging
+"""
+import asyncio
+import random
+import threading
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from shared.config import settings
+
+
+class RetryPolicy:
+    """
+    Retry policy with jittered exponential backoff ("full jitter")
+    """
+
+    def __init__(
+        self,
+        max_retries: int = None,
+        base_delay_seconds: float = None,
+        max_delay_seconds: float = None
+    ):
+        self.max_retries = settings.max_retries if max_retries is None else max_retries
+        self.base_delay_seconds = (
+            settings.retry_backoff_base_seconds if base_delay_seconds is None else base_delay_seconds
+        )
+        self.max_delay_seconds = (
+            settings.retry_backoff_max_seconds if max_delay_seconds is None else max_delay_seconds
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay before the retry following ``attempt`` (0-based)
+
+        Returns:
+            Seconds to sleep, drawn uniformly from [0, min(max, base * 2^attempt)]
+        """
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+class LatencyTracker:
+    """
+    Rolling window of successful attempt latencies per agent
+
+    Used to decide when a slow first attempt deserves a hedged second one.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent_name: str, duration_ms: float):
+        """Record a successful attempt latency"""
+        with self._lock:
+            samples = self._samples.get(agent_name)
+            if samples is None:
+                samples = self._samples[agent_name] = deque(maxlen=self.window)
+            samples.append(duration_ms)
+
+    def percentile(self, agent_name: str, pct: float = 95.0) -> Optional[float]:
+        """
+        Latency percentile for an agent in milliseconds
+
+        Returns:
+            The percentile, or None until ``min_samples`` latencies are recorded
+        """
+        with self._lock:
+            samples = list(self._samples.get(agent_name, ()))
+        if len(samples) < self.min_samples:
+            return None
+        samples.sort()
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+
+
+async def run_with_deadline(
+    make_call: Callable[[], Awaitable[Any]],
+    timeout_seconds: float
+) -> Any:
+    """Run one attempt, raising asyncio.TimeoutError past the deadline"""
+    return await asyncio.wait_for(make_call(), timeout=timeout_seconds)
+
+
+async def run_hedged(
+    make_call: Callable[[], Awaitable[Any]],
+    hedge_after_seconds: float,
+    timeout_seconds: float
+) -> Tuple[Any, bool]:
+    """
+    Run an attempt and, if it is still running after ``hedge_after_seconds``,
+    start a second identical attempt; the first to succeed wins
+
+    Only use for idempotent, read-only calls.
+
+    Args:
+        make_call: Factory returning a fresh awaitable for each attempt
+        hedge_after_seconds: Delay before the hedged attempt is launched
+        timeout_seconds: Deadline for the whole hedged attempt
+
+    Returns:
+        (result, hedged) where ``hedged`` says whether a second attempt ran
+
+    Raises:
+        asyncio.TimeoutError if neither attempt finished before the deadline,
+        otherwise the error of the last attempt to fail
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    tasks = [asyncio.ensure_future(make_call())]
+    hedged = False
+
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=min(hedge_after_seconds, timeout_seconds))
+        if not done and loop.time() < deadline:
+            tasks.append(asyncio.ensure_future(make_call()))
+            hedged = True
+
+        pending = set(tasks)
+        last_error: Optional[BaseException] = None
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result(), hedged
+                last_error = task.exception()
+
+        if pending or last_error is None:
+            raise asyncio.TimeoutError()
+        raise last_error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -1,7 +1,7 @@
 """
 Schemas for Dynamic Orchestration v2
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
@@ -56,20 +56,26 @@ class BreakProfile(BaseModel):
 class AgentNode(BaseModel):
     """
     Represents an agent in the execution graph
+    
+    Frozen: nodes are shared between plans built from the same template.
     """
+    model_config = ConfigDict(frozen=True)
+    
     node_id: str
     agent_name: str
     depends_on: List[str] = Field(default_factory=list)
     can_run_parallel: bool = True
     is_mandatory: bool = True
     skip_conditions: List[str] = Field(default_factory=list)
-    timeout_seconds: int = 30
+    timeout_seconds: float = 30
 
 
 class DecisionCheckpoint(BaseModel):
     """
     Decision checkpoint in the execution plan
     """
+    model_config = ConfigDict(frozen=True)
+    
     checkpoint_id: str
     after_nodes: List[str]
     condition: str
@@ -89,6 +95,9 @@ class ExecutionPlan(BaseModel):
     early_exit_enabled: bool = True
     policy_version: str = "2.0.0"
     created_at: datetime = Field(default_factory=datetime.now)
+    
+    # Scheduling index (readiness.PlanIndex), built on first use
+    _index: Any = PrivateAttr(default=None)
 
 
 class NodeExecution(BaseModel):
@@ -104,6 +113,11 @@ class NodeExecution(BaseModel):
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     skip_reason: Optional[str] = None
+    attempts: int = 0
+    timeouts: int = 0
+    hedged: bool = False
+    attempt_errors: List[str] = Field(default_factory=list)
+    speculative: bool = False
 
 
 class ExecutionGraph(BaseModel):
@@ -119,6 +133,9 @@ class ExecutionGraph(BaseModel):
     total_duration_ms: float = 0.0
     agents_invoked: int = 0
     agents_skipped: int = 0
+    speculative_nodes: List[str] = Field(default_factory=list)
+    speculative_wasted_ms: float = 0.0
+    speculative_saved_ms: float = 0.0
     created_at: datetime = Field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
 
@@ -126,7 +143,11 @@ class ExecutionGraph(BaseModel):
 class RoutingPolicy(BaseModel):
     """
     Routing policy for a specific break type/risk combination
+    
+    Frozen: loaded policies are shared by all readers until the next reload.
     """
+    model_config = ConfigDict(frozen=True)
+    
     policy_id: str
     break_type: str
     risk_tier: RiskTier
@@ -134,5 +155,6 @@ class RoutingPolicy(BaseModel):
     optional_agents: List[str] = Field(default_factory=list)
     parallel_groups: List[List[str]] = Field(default_factory=list)
     decision_checkpoints: List[Dict[str, Any]] = Field(default_factory=list)
-    max_parallel: int = 3
+    max_parallel: int = Field(3, ge=1)
     early_exit_enabled: bool = True
+    node_timeouts: Dict[str, float] = Field(default_factory=dict)
@@ -0,0 +1,63 @@
+"""
+Speculation - Early-exit history used to decide when to run agents speculatively
+"""
+import threading
+from typing import Dict, Optional, Tuple
+
+from shared.config import settings
+
+
+class EarlyExitStats:
+    """
+    Running early-exit rate per (break_type, risk_tier)
+
+    Speculating only pays off when a checkpoint usually does *not* fire;
+    profiles that mostly exit early would just waste the speculative work.
+    """
+
+    def __init__(self, max_early_exit_rate: float = None, min_samples: int = None):
+        """
+        Initialize early-exit statistics
+
+        Args:
+            max_early_exit_rate: Highest early-exit rate at which we still speculate
+            min_samples: Runs needed before the observed rate is trusted
+        """
+        self.max_early_exit_rate = (
+            settings.speculation_max_early_exit_rate
+            if max_early_exit_rate is None else max_early_exit_rate
+        )
+        self.min_samples = settings.speculation_min_samples if min_samples is None else min_samples
+        self._counts: Dict[Tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def record(self, break_type: str, risk_tier: str, early_exit: bool):
+        """Record the outcome of one run"""
+        with self._lock:
+            counts = self._counts.setdefault((break_type, risk_tier), [0, 0])
+            counts[0] += 1
+            if early_exit:
+                counts[1] += 1
+
+    def early_exit_rate(self, break_type: str, risk_tier: str) -> Optional[float]:
+        """
+        Observed early-exit rate
+
+        Returns:
+            Rate in [0, 1], or None until ``min_samples`` runs are recorded
+        """
+        with self._lock:
+            runs, exits = self._counts.get((break_type, risk_tier), (0, 0))
+        if runs < self.min_samples:
+            return None
+        return exits / runs
+
+    def should_speculate(self, break_type: str, risk_tier: str) -> bool:
+        """
+        Whether downstream agents should start before checkpoints resolve
+
+        Profiles without enough history are speculated on, since p50 latency
+        matters more than the occasional wasted call.
+        """
+        rate = self.early_exit_rate(break_type, risk_tier)
+        return rate is None or rate <= self.max_early_exit_rate
@@ -43,7 +43,9 @@ class WorkflowAgent(ADKAgent):
                     "break_id": {"type": "string", "description": "Break ID"},
                     "decision": {"type": "object", "description": "Agent decision"},
                     "human_action": {"type": "string", "description": "Human action"},
-                    "human_notes": {"type": "string", "description": "Human notes"}
+                    "human_notes": {"type": "string", "description": "Human notes"},
+                    "break_type": {"type": "string", "description": "Break type"},
+                    "root_cause": {"type": "string", "description": "Confirmed root cause"}
                 }
             ),
             ADKTool(
@@ -0,0 +1,122 @@
+"""
+Micro-batching of per-key lookups into bulk downstream calls
+"""
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+
+from shared.config import settings
+
+
+class MicroBatcher:
+    """
+    Collects lookups from concurrent callers into bulk calls
+
+    The first caller to add a key to an empty batch becomes its leader: it
+    waits up to ``max_wait_seconds`` (or until ``max_batch_size`` keys are
+    queued), takes the batch and calls ``fetch_many`` once per
+    ``max_batch_size`` keys. Other callers just wait for their keys'
+    results, so no background thread is needed. Keys requested again while
+    queued share the same pending result.
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        max_wait_seconds: float = None,
+        max_batch_size: int = None,
+        name: str = "batch"
+    ):
+        """
+        Initialize batcher
+
+        Args:
+            fetch_many: Bulk lookup, keys -> {key: value}; keys it leaves out
+                resolve to None
+            max_wait_seconds: How long a batch stays open for more keys
+            max_batch_size: Most keys sent in one bulk call
+            name: Name used in stats output
+        """
+        self.fetch_many = fetch_many
+        self.max_wait_seconds = (
+            settings.enrichment_batch_window_ms / 1000
+            if max_wait_seconds is None else max_wait_seconds
+        )
+        self.max_batch_size = max_batch_size or settings.enrichment_batch_max_size
+        self.name = name
+        self._cond = threading.Condition()
+        self._pending: Dict[Hashable, Future] = {}
+        self.calls = 0
+        self.keys = 0
+
+    def _enqueue(self, keys: Iterable[Hashable]):
+        with self._cond:
+            leader = not self._pending
+            futures = {}
+            for key in keys:
+                future = self._pending.get(key)
+                if future is None:
+                    future = self._pending[key] = Future()
+                futures[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._cond.notify_all()
+        return futures, leader
+
+    def _lead(self):
+        deadline = time.monotonic() + self.max_wait_seconds
+        with self._cond:
+            while len(self._pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch, self._pending = self._pending, {}
+
+        keys = list(batch)
+        for start in range(0, len(keys), self.max_batch_size):
+            self._flush(keys[start:start + self.max_batch_size], batch)
+
+    def _flush(self, keys: List[Hashable], batch: Dict[Hashable, Future]):
+        self.calls += 1
+        self.keys += len(keys)
+        try:
+            results = self.fetch_many(keys)
+        except Exception as e:
+            for key in keys:
+                batch[key].set_exception(e)
+            return
+        for key in keys:
+            batch[key].set_result(results.get(key))
+
+    def get_many(self, keys: Iterable[Hashable], timeout: float = None) -> Dict[Hashable, Any]:
+        """
+        Look up several keys through the current batch
+
+        Args:
+            keys: Keys to look up
+            timeout: Longest time to wait for the results
+
+        Returns:
+            Key -> value (None for keys the bulk call did not return)
+
+        Raises:
+            Exception: Whatever ``fetch_many`` raised for the batch
+        """
+        futures, leader = self._enqueue(keys)
+        if leader and futures:
+            self._lead()
+        return {key: future.result(timeout) for key, future in futures.items()}
+
+    def get(self, key: Hashable, timeout: float = None) -> Any:
+        """Look up one key through the current batch"""
+        return self.get_many([key], timeout)[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Batcher statistics"""
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "keys": self.keys,
+            "avg_batch_size": self.keys / self.calls if self.calls else 0.0
+        }
@@ -0,0 +1,274 @@
+"""
+Bounded, TTL-based in-process caches shared by agents and tools
+"""
+import copy
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from shared.config import settings
+
+
+# Marker for "not in cache" (None is a valid cached value)
+MISSING = object()
+
+
+def approx_size(value: Any) -> int:
+    """Rough deep size in bytes of JSON-like data (dicts, lists, scalars)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(approx_size(k) + approx_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(approx_size(v) for v in value)
+    return size
+
+
+class _Call:
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one in-flight call
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait and receive the same result (or exception). Nothing is kept
+    once the call finishes.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run ``func`` for ``key`` unless a call for it is already in flight
+
+        Args:
+            key: Call key
+            func: Called without arguments by the first caller only
+
+        Returns:
+            Result of the (shared) call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = func()
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire ``ttl_seconds`` after insertion
+
+    ``get_or_load`` goes through a SingleFlight, so a value is fetched at
+    most once per TTL window even when many threads miss on it together.
+    With ``max_bytes`` set, least recently used entries are also evicted to
+    keep the estimated size of the cached values under the budget. With
+    ``copy_values`` set, values are deep-copied on the way in and out, so
+    callers that mutate what they get back cannot corrupt the shared entry.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        name: str = "cache",
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = approx_size,
+        copy_values: bool = False
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_size: Maximum number of entries (least recently used evicted first)
+            ttl_seconds: Lifetime of each entry
+            name: Name used in stats output
+            max_bytes: Optional bound on the total estimated size of cached values
+            sizeof: Size estimate for one value, used when ``max_bytes`` is set
+            copy_values: Hand out and store deep copies of values
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.copy_values = copy_values
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def _lookup(self, key: Hashable, now: float) -> Any:
+        # Caller holds self._lock
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value, size = entry
+        if expires_at <= now:
+            del self._entries[key]
+            self._bytes -= size
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value for ``key``, or ``default`` if missing or expired"""
+        with self._lock:
+            value = self._lookup(key, time.monotonic())
+            if value is MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return self._copy(value)
+
+    def _copy(self, value: Any) -> Any:
+        return copy.deepcopy(value) if self.copy_values else value
+
+    def set(self, key: Hashable, value: Any):
+        """Insert or replace an entry"""
+        self.set_many({key: value})
+
+    def set_many(self, items: Dict[Hashable, Any]):
+        """Insert or replace several entries"""
+        expires_at = time.monotonic() + self.ttl_seconds
+        if self.copy_values:
+            items = {key: copy.deepcopy(value) for key, value in items.items()}
+        sizes = {
+            key: self.sizeof(value) if self.max_bytes is not None else 0
+            for key, value in items.items()
+        }
+        with self._lock:
+            for key, value in items.items():
+                old = self._entries.pop(key, None)
+                if old is not None:
+                    self._bytes -= old[2]
+                if self.max_bytes is not None and sizes[key] > self.max_bytes:
+                    # Would evict everything else and still not fit
+                    continue
+                self._entries[key] = (expires_at, value, sizes[key])
+                self._bytes += sizes[key]
+            while self._entries and (
+                len(self._entries) > self.max_size
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                _, (_, _, size) = self._entries.popitem(last=False)
+                self._bytes -= size
+                self.evictions += 1
+
+    def missing(self, keys: Iterable[Hashable]) -> list:
+        """Keys (deduplicated, in order) that are not cached or have expired"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                key for key in dict.fromkeys(keys)
+                if self._lookup(key, now) is MISSING
+            ]
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        should_cache: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Cached value for ``key``, loading it once if missing
+
+        Args:
+            key: Cache key
+            loader: Called without arguments to produce the value
+            should_cache: Predicate deciding whether a loaded value is stored
+                (e.g. to avoid caching error responses)
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = self.get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        def load():
+            # A previous flight may have stored it since our miss
+            with self._lock:
+                value = self._lookup(key, time.monotonic())
+            if value is not MISSING:
+                return value
+
+            value = loader()
+            with self._lock:
+                self.loads += 1
+            if should_cache is None or should_cache(value):
+                self.set(key, value)
+            return value
+
+        # Coalesced callers all receive the leader's value
+        return self._copy(self._flight.do(key, load))
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "loads": self.loads,
+                "coalesced": self._flight.coalesced,
+                "evictions": self.evictions
+            }
+
+
+# Instrument -> reference data, shared by the break classifier and the
+# enrichment tools; every caller gets its own copy of a record
+reference_data_cache = TTLCache(
+    max_size=settings.reference_cache_size,
+    ttl_seconds=settings.reference_cache_ttl_seconds,
+    name="reference_data",
+    copy_values=True
+)
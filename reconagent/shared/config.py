@@ -1,8 +1,10 @@
 """
 Configuration settings for the Reconciliation Agent System
 """
+from pathlib import Path
+
 from pydantic_settings import BaseSettings
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 class Settings(BaseSettings):
@@ -25,13 +27,86 @@ class Settings(BaseSettings):
     mcp_server_port: int = 8001
     
     # Agent Settings
+    # agent_timeout_seconds is also the total budget of a DAG node across
+    # all of its attempts; node_timeout_seconds bounds a single attempt
     agent_timeout_seconds: int = 30
     max_retries: int = 3
+    node_timeout_seconds: float = 10.0
+    retry_backoff_base_seconds: float = 0.1
+    retry_backoff_max_seconds: float = 2.0
+    hedging_enabled: bool = False
+    hedge_agents: List[str] = ["DATA_ENRICHMENT", "PATTERN_INTELLIGENCE"]
+    speculative_execution_enabled: bool = False
+    speculative_agents: List[str] = ["MATCHING_CORRELATION", "RULES_TOLERANCE", "PATTERN_INTELLIGENCE"]
+    speculation_max_early_exit_rate: float = 0.5
+    speculation_min_samples: int = 20
+    agent_thread_pool_size: int = 8
+    agent_thread_pool_sizes: Dict[str, int] = {}
+    
+    # Routing Policies
+    plan_cache_size: int = 256
+    policy_reload_check_seconds: float = 1.0
+    policy_watch_enabled: bool = False
+    
+    # Reference Data Cache
+    reference_cache_size: int = 50000
+    reference_cache_ttl_seconds: float = 3600.0
+    # Read by the apps, which call prewarm_reference_data() after startup
+    reference_prewarm_on_startup: bool = True
+    
+    # HTTP Client
+    http_pool_hosts: int = 10
+    http_pool_maxsize_per_host: int = 32
+    http_keepalive_expiry_seconds: float = 30.0
+    # Async client only; needs the optional h2 package (httpx[http2])
+    http2_enabled: bool = False
+    
+    # Account Data Cache (settlement positions, custodian holdings)
+    account_cache_size: int = 10000
+    account_cache_ttl_seconds: float = 30.0
+    account_cache_max_bytes: int = 64 * 1024 * 1024
+    
+    # Enrichment
+    # Lookup threads per source; lookups beyond this queue, and a source
+    # fails fast only once every thread is held by a timed-out lookup
+    enrichment_max_in_flight_per_source: int = 32
+    enrichment_source_timeout_seconds: float = 5.0
+    # Per-API overrides keyed by downstream API name ("oms", "trade_capture",
+    # "broker", "settlement", "custodian", "reference_data")
+    enrichment_source_timeouts: Dict[str, float] = {}
+    # Merge single-ID lookups from concurrent breaks into bulk requests.
+    # Off by default: every lookup then waits for the batch window.
+    # enrich_cases always uses the bulk endpoints.
+    enrichment_batching_enabled: bool = False
+    enrichment_batch_window_ms: float = 2.0
+    enrichment_batch_max_size: int = 500
+    
+    # Break Ingestion
+    break_page_size: int = 500
+    compact_break_records: bool = False
+    
+    # Aggregation Matching (N:M partial fills)
+    aggregation_time_budget_ms: float = 50.0
+    aggregation_max_candidates: int = 200
+    aggregation_exact_max_candidates: int = 24
+    aggregation_dp_buckets: int = 65536
+    
+    # Pattern Store (root-cause history for pattern intelligence)
+    pattern_store_enabled: bool = True
+    # Inside the package's data directory, whatever the working directory
+    pattern_store_path: str = str(Path(__file__).resolve().parents[1] / "data" / "reconagent_patterns.db")
+    # Patterns imported from the historical API the first time a break type is seen
+    pattern_store_seed_limit: int = 100
+    
+    # Batch Processing
+    batch_max_concurrency: int = 16
+    downstream_api_limits: Dict[str, int] = {}
     
     # Tolerance Settings
     default_amount_tolerance_bps: float = 0.5
     default_quantity_tolerance: float = 0.01
     fx_tolerance_bps: float = 2.0
+    extended_amount_tolerance_bps: float = 5.0
     
     # Decision Thresholds
     auto_resolve_confidence_threshold: float = 0.90
@@ -56,7 +131,7 @@ AGENT_REGISTRY = {
     "break_ingestion": {
         "name": "Break Ingestion Agent",
         "description": "Normalizes incoming reconciliation breaks",
-        "tools": ["get_breaks", "normalize_break", "validate_break"]
+        "tools": ["get_breaks", "normalize_break", "validate_break", "normalize_and_validate_break"]
     },
     "data_enrichment": {
         "name": "Data Enrichment Agent",
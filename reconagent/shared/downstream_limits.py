@@ -0,0 +1,103 @@
+"""
+Concurrency limits for downstream APIs shared by all MCP tool calls
+
+The limits are process-wide: every http_client call in the process holds
+a slot of the one ``downstream_limiter``. They are read from
+``settings.downstream_api_limits`` at import; a service that sets them any
+other way calls ``downstream_limiter.configure`` once during startup, not
+per batch or per engine.
+"""
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+from shared.config import settings
+
+
+# Downstream API names used by the MCP tool modules
+DOWNSTREAM_APIS = [
+    "breaks",
+    "oms",
+    "trade_capture",
+    "broker",
+    "settlement",
+    "custodian",
+    "reference_data",
+    "historical",
+]
+
+
+class DownstreamLimiter:
+    """
+    Caps the number of in-flight calls per downstream API
+
+    Agent methods run on worker threads, so limits are enforced with
+    thread semaphores around each HTTP call. APIs without a configured
+    limit are not throttled.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._limits: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.configure(limits or {})
+
+    def configure(self, limits: Dict[str, int]):
+        """
+        Set or change per-API limits for the whole process
+
+        Args:
+            limits: API name -> max concurrent calls (0 or None removes the limit)
+        """
+        with self._lock:
+            for api, limit in limits.items():
+                if limit:
+                    self._limits[api] = int(limit)
+                    self._semaphores[api] = threading.BoundedSemaphore(int(limit))
+                else:
+                    self._limits.pop(api, None)
+                    self._semaphores.pop(api, None)
+
+    @property
+    def limits(self) -> Dict[str, int]:
+        """Currently configured limits"""
+        return dict(self._limits)
+
+    @contextmanager
+    def limit(self, api: str):
+        """Hold a slot for one call to ``api`` for the duration of the block"""
+        semaphore = self._semaphores.get(api)
+        if semaphore is None:
+            yield
+            return
+
+        with semaphore:
+            yield
+
+    @asynccontextmanager
+    async def alimit(self, api: str):
+        """
+        Async ``limit``: wait for a slot without blocking the event loop
+
+        The slot is polled from the event loop rather than acquired on a
+        worker thread, so a caller cancelled while waiting never ends up
+        holding a slot it cannot release.
+        """
+        semaphore = self._semaphores.get(api)
+        if semaphore is None:
+            yield
+            return
+
+        delay = 0.001
+        while not semaphore.acquire(blocking=False):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+# Global limiter instance
+downstream_limiter = DownstreamLimiter(settings.downstream_api_limits)
@@ -0,0 +1,192 @@
+"""
+Pooled, keep-alive HTTP clients shared by all MCP tool modules
+"""
+import threading
+from typing import Any, Dict, Iterator, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from shared.config import settings
+from shared.downstream_limits import downstream_limiter
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``)"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClient:
+    """
+    Shared HTTP client for downstream APIs
+
+    The sync variant is a ``requests.Session`` whose adapter keeps a
+    keep-alive connection pool per host, so repeated calls to the same API
+    reuse TCP connections instead of opening one per request. The async
+    variant is an ``httpx.AsyncClient`` with the same pool limits, using
+    HTTP/2 when enabled and ``h2`` is installed. Both are created on first
+    use and every call holds a ``downstream_limiter`` slot for its API.
+    """
+
+    def __init__(
+        self,
+        pool_hosts: int = None,
+        pool_maxsize_per_host: int = None,
+        keepalive_expiry_seconds: float = None,
+        http2: bool = None,
+        timeout_seconds: float = None
+    ):
+        """
+        Initialize HTTP client
+
+        Args:
+            pool_hosts: Number of hosts to keep connection pools for
+            pool_maxsize_per_host: Keep-alive connections kept per host
+            keepalive_expiry_seconds: Idle time before an async connection is closed
+            http2: Use HTTP/2 for the async client when ``h2`` is installed
+            timeout_seconds: Default request timeout
+        """
+        self.pool_hosts = pool_hosts or settings.http_pool_hosts
+        self.pool_maxsize_per_host = pool_maxsize_per_host or settings.http_pool_maxsize_per_host
+        self.keepalive_expiry_seconds = (
+            settings.http_keepalive_expiry_seconds
+            if keepalive_expiry_seconds is None else keepalive_expiry_seconds
+        )
+        self.http2 = (settings.http2_enabled if http2 is None else http2) and _http2_available()
+        self.timeout_seconds = timeout_seconds or settings.agent_timeout_seconds
+        self._session: Optional[requests.Session] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled sync session"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_hosts,
+                        pool_maxsize=self.pool_maxsize_per_host
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Pooled async client
+
+        The client's connections belong to the event loop that first uses
+        it; call ``aclose`` before switching loops.
+        """
+        if self._async_client is None:
+            with self._lock:
+                if self._async_client is None:
+                    self._async_client = httpx.AsyncClient(
+                        http2=self.http2,
+                        timeout=self.timeout_seconds,
+                        limits=httpx.Limits(
+                            max_connections=self.pool_hosts * self.pool_maxsize_per_host,
+                            max_keepalive_connections=self.pool_maxsize_per_host,
+                            keepalive_expiry=self.keepalive_expiry_seconds
+                        )
+                    )
+        return self._async_client
+
+    def get(self, api: str, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        GET ``url`` over the pooled session
+
+        Args:
+            api: Downstream API name, used for concurrency limits
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Response (status not checked)
+        """
+        with downstream_limiter.limit(api):
+            return self.session.get(url, params=params, timeout=self.timeout_seconds)
+
+    def post(self, api: str, url: str, json: Any = None) -> requests.Response:
+        """
+        POST a JSON body to ``url`` over the pooled session
+
+        Args:
+            api: Downstream API name, used for concurrency limits
+            url: Request URL
+            json: JSON-serialisable request body
+
+        Returns:
+            Response (status not checked)
+        """
+        with downstream_limiter.limit(api):
+            return self.session.post(url, json=json, timeout=self.timeout_seconds)
+
+    def iter_lines(self, api: str, url: str, params: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+        """
+        Stream a GET response line by line (e.g. NDJSON)
+
+        The downstream limit slot is held until the stream is exhausted or
+        the generator is closed.
+
+        Args:
+            api: Downstream API name, used for concurrency limits
+            url: Request URL
+            params: Query parameters
+
+        Yields:
+            Non-empty response lines
+
+        Raises:
+            requests.HTTPError: If the response status is an error
+        """
+        with downstream_limiter.limit(api):
+            with self.session.get(url, params=params, stream=True, timeout=self.timeout_seconds) as response:
+                response.raise_for_status()
+                for line in response.iter_lines(chunk_size=64 * 1024):
+                    if line:
+                        yield line
+
+    async def aget(self, api: str, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """
+        GET ``url`` over the pooled async client
+
+        Waiting for a downstream limit slot does not block the event loop,
+        and a call cancelled while it waits does not take a slot.
+
+        Args:
+            api: Downstream API name, used for concurrency limits
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Response (status not checked)
+        """
+        async with downstream_limiter.alimit(api):
+            return await self.async_client.get(url, params=params)
+
+    def close(self):
+        """Close the sync session (it is recreated on next use)"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    async def aclose(self):
+        """Close the async client (it is recreated on next use)"""
+        client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.aclose()
+
+
+# Global client instance used by the MCP tool modules
+http_client = HttpClient()
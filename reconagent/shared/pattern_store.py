@@ -0,0 +1,301 @@
+"""
+Embedded store of historical break patterns
+
+Root-cause outcomes are kept in SQLite, indexed by break type and root
+cause, with a per-(break_type, root_cause) aggregate row that is updated
+in the same transaction as each new outcome. The aggregates are mirrored in
+memory, so the most frequent root cause for a break type (the prior used by
+predict_root_cause) is a dict lookup rather than a query or a remote call.
+"""
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from shared.config import settings
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pattern_events (
+    id INTEGER PRIMARY KEY,
+    break_id TEXT,
+    break_type TEXT NOT NULL,
+    root_cause TEXT NOT NULL,
+    resolution TEXT,
+    amount REAL,
+    confirmed INTEGER,
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_pattern_events_type_cause ON pattern_events (break_type, root_cause);
+CREATE INDEX IF NOT EXISTS ix_pattern_events_cause ON pattern_events (root_cause);
+
+CREATE TABLE IF NOT EXISTS pattern_stats (
+    break_type TEXT NOT NULL,
+    root_cause TEXT NOT NULL,
+    frequency INTEGER NOT NULL DEFAULT 0,
+    confirmed INTEGER NOT NULL DEFAULT 0,
+    amount_sum REAL NOT NULL DEFAULT 0,
+    amount_count INTEGER NOT NULL DEFAULT 0,
+    last_resolution TEXT,
+    last_seen TEXT,
+    PRIMARY KEY (break_type, root_cause)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_pattern_stats_cause ON pattern_stats (root_cause);
+
+CREATE TABLE IF NOT EXISTS seeded_break_types (
+    break_type TEXT PRIMARY KEY,
+    source TEXT,
+    seeded_at TEXT NOT NULL
+);
+"""
+
+_UPSERT_STATS = """
+INSERT INTO pattern_stats (
+    break_type, root_cause, frequency, confirmed, amount_sum, amount_count, last_resolution, last_seen
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (break_type, root_cause) DO UPDATE SET
+    frequency = frequency + excluded.frequency,
+    confirmed = confirmed + excluded.confirmed,
+    amount_sum = amount_sum + excluded.amount_sum,
+    amount_count = amount_count + excluded.amount_count,
+    last_resolution = COALESCE(excluded.last_resolution, last_resolution),
+    last_seen = excluded.last_seen
+"""
+
+
+class PatternStore:
+    """
+    SQLite-backed pattern history with in-memory frequency aggregates
+
+    The database is opened on first use. One connection is shared by all
+    threads behind a lock; writes are single small transactions, so
+    contention is negligible next to the agent work around them.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Open (or create) the store
+
+        Args:
+            path: SQLite file (defaults to settings.pattern_store_path;
+                ``":memory:"`` for a private in-memory store)
+        """
+        self.path = settings.pattern_store_path if path is None else path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # (break_type, root_cause) -> frequency, and per break type the
+        # most frequent root cause and the total
+        self._frequency: Dict[Tuple[str, str], int] = {}
+        self._top: Dict[str, Tuple[str, int]] = {}
+        self._totals: Dict[str, int] = {}
+        self._seeded = set()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database and load the aggregates on first use (call with the lock held)"""
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.executescript(_SCHEMA)
+            self._seeded = {row[0] for row in conn.execute("SELECT break_type FROM seeded_break_types")}
+            for break_type, root_cause, frequency in conn.execute(
+                "SELECT break_type, root_cause, frequency FROM pattern_stats"
+            ):
+                self._count(break_type, root_cause, frequency)
+            self._conn = conn
+        return self._conn
+
+    def _loaded(self):
+        if self._conn is None:
+            with self._lock:
+                self._connection()
+
+    def _count(self, break_type: str, root_cause: str, frequency: int):
+        key = (break_type, root_cause)
+        count = self._frequency.get(key, 0) + frequency
+        self._frequency[key] = count
+        self._totals[break_type] = self._totals.get(break_type, 0) + frequency
+        top = self._top.get(break_type)
+        if top is None or count > top[1] or top[0] == root_cause:
+            self._top[break_type] = (root_cause, count)
+
+    def record(
+        self,
+        break_type: str,
+        root_cause: str,
+        break_id: str = None,
+        resolution: str = None,
+        amount: float = None,
+        confirmed: bool = None
+    ):
+        """
+        Record one resolved break's root cause and update the aggregates
+
+        Args:
+            break_type: Break type
+            root_cause: Root cause the break was resolved with
+            break_id: Break identifier
+            resolution: How it was resolved (e.g. the human action)
+            amount: Amount difference of the break
+            confirmed: Whether a human agreed with the agent's decision
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                conn.execute(
+                    "INSERT INTO pattern_events "
+                    "(break_id, break_type, root_cause, resolution, amount, confirmed, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (break_id, break_type, root_cause, resolution, amount,
+                     None if confirmed is None else int(confirmed), now)
+                )
+                conn.execute(_UPSERT_STATS, (
+                    break_type, root_cause, 1, int(bool(confirmed)),
+                    amount or 0.0, int(amount is not None), resolution, now
+                ))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._count(break_type, root_cause, 1)
+
+    def seed(self, break_type: str, patterns: Iterable[Dict[str, Any]], source: str = None) -> int:
+        """
+        Import aggregated patterns (e.g. from the historical-patterns API) once per break type
+
+        Args:
+            break_type: Break type the patterns describe
+            patterns: Pattern dicts with root_cause, frequency and optionally
+                resolution / average_amount
+            source: Where the patterns came from
+
+        Returns:
+            Number of patterns imported (0 if the break type was already seeded)
+        """
+        now = datetime.now().isoformat()
+        rows = []
+        for pattern in patterns:
+            root_cause = pattern.get("root_cause")
+            frequency = int(pattern.get("frequency") or 0)
+            if not root_cause or frequency <= 0:
+                continue
+            average = pattern.get("average_amount")
+            rows.append((
+                pattern.get("break_type") or break_type, root_cause, frequency, 0,
+                (average or 0.0) * frequency, frequency if average is not None else 0,
+                pattern.get("resolution"), now
+            ))
+
+        with self._lock:
+            conn = self._connection()
+            if break_type in self._seeded:
+                return 0
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(_UPSERT_STATS, rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO seeded_break_types (break_type, source, seeded_at) VALUES (?, ?, ?)",
+                    (break_type, source, now)
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._seeded.add(break_type)
+            for row in rows:
+                self._count(row[0], row[1], row[2])
+        return len(rows)
+
+    def is_seeded(self, break_type: str) -> bool:
+        """True if historical patterns have been imported for the break type"""
+        self._loaded()
+        return break_type in self._seeded
+
+    def prior(self, break_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Most frequent root cause for a break type (O(1))
+
+        Args:
+            break_type: Break type
+
+        Returns:
+            root_cause, frequency and share of the break type's outcomes,
+            or None if the store has no history for it
+        """
+        self._loaded()
+        top = self._top.get(break_type)
+        if top is None:
+            return None
+        root_cause, frequency = top
+        return {
+            "root_cause": root_cause,
+            "frequency": frequency,
+            "share": frequency / self._totals[break_type]
+        }
+
+    def frequency(self, break_type: str, root_cause: str) -> int:
+        """Times a root cause has been recorded for a break type (O(1))"""
+        self._loaded()
+        return self._frequency.get((break_type, root_cause), 0)
+
+    def patterns(self, break_type: str = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Most frequent (break_type, root_cause) patterns
+
+        Args:
+            break_type: Optional filter by break type
+            limit: Number of patterns
+
+        Returns:
+            Patterns in the shape of the historical-patterns API
+        """
+        query = (
+            "SELECT break_type, root_cause, frequency, confirmed, amount_sum, amount_count, last_resolution "
+            "FROM pattern_stats"
+        )
+        params: Tuple[Any, ...] = ()
+        if break_type:
+            query += " WHERE break_type = ?"
+            params = (break_type,)
+        query += " ORDER BY frequency DESC, root_cause LIMIT ?"
+        with self._lock:
+            rows = self._connection().execute(query, params + (limit,)).fetchall()
+
+        return [
+            {
+                "pattern_id": f"PAT-{row_type}-{root_cause}",
+                "break_type": row_type,
+                "root_cause": root_cause,
+                "frequency": frequency,
+                "resolution": resolution,
+                "average_amount": amount_sum / amount_count if amount_count else None,
+                "confirmed": confirmed
+            }
+            for row_type, root_cause, frequency, confirmed, amount_sum, amount_count, resolution in rows
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """Store size"""
+        with self._lock:
+            events = self._connection().execute("SELECT COUNT(*) FROM pattern_events").fetchone()[0]
+        return {
+            "path": self.path,
+            "events": events,
+            "patterns": len(self._frequency),
+            "break_types": len(self._totals)
+        }
+
+    def close(self):
+        """Close the SQLite connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._frequency, self._top, self._totals, self._seeded = {}, {}, {}, set()
+
+
+pattern_store = PatternStore()
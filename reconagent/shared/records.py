@@ -0,0 +1,181 @@
+"""
+Compact, read-only break records for high-volume pipelines
+
+A normalized break is three nested dicts plus lists, which costs well over
+a kilobyte per break before any values. These records keep the same fields
+in ``__slots__``, intern the strings that repeat across breaks (instrument,
+account, currency, ...) and store ID lists as tuples. They implement the
+read-only ``Mapping`` protocol, so tool functions that use ``.get``,
+``[...]``, ``in`` or ``.items()`` on break dicts accept them unchanged; call
+``to_dict`` where a real dict is required (e.g. JSON output).
+"""
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Optional
+
+
+# Shared value for empty raw_fields / raw_data
+_EMPTY: Mapping = MappingProxyType({})
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _frozen(value: Optional[Dict[str, Any]]) -> Mapping:
+    return MappingProxyType(dict(value)) if value else _EMPTY
+
+
+class CompactRecord(Mapping):
+    """
+    Base for read-only, slot-backed records with a dict-like view
+
+    Subclasses list their fields in ``__slots__``; the mapping keys are the
+    slot names in declaration order.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Slot descriptors' setters bypass the read-only __setattr__
+        cls._setters = tuple(cls.__dict__[name].__set__ for name in cls.__slots__)
+
+    def __init__(self, **values: Any):
+        for name, set_value in zip(self.__slots__, self._setters):
+            set_value(self, values.get(name))
+
+    @classmethod
+    def _new(cls, *values: Any) -> "CompactRecord":
+        """Build from values in slot order (faster than keyword construction)"""
+        record = object.__new__(cls)
+        for set_value, value in zip(cls._setters, values):
+            set_value(record, value)
+        return record
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __eq__(self, other: Any) -> bool:
+        # Compare as plain dicts so ID tuples equal the lists in break dicts
+        if isinstance(other, CompactRecord):
+            other = other.to_dict()
+        elif not isinstance(other, Mapping):
+            return NotImplemented
+        return self.to_dict() == dict(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        return (_rebuild, (type(self), self.to_dict()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain nested dict (tuples become lists), as from ``Break.model_dump()``"""
+        result = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, CompactRecord):
+                value = value.to_dict()
+            elif isinstance(value, tuple):
+                value = list(value)
+            elif isinstance(value, MappingProxyType):
+                value = dict(value)
+            result[name] = value
+        return result
+
+
+def _rebuild(cls, data: Dict[str, Any]) -> CompactRecord:
+    return cls.from_dict(data)
+
+
+class CompactSystemLeg(CompactRecord):
+    """One system's side of a break (``system_a`` / ``system_b``)"""
+
+    __slots__ = ('system_name', 'quantity', 'amount', 'price', 'currency', 'timestamp', 'raw_fields')
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "CompactSystemLeg":
+        get = data.get
+        return cls._new(
+            _intern(get("system_name")),
+            get("quantity"),
+            get("amount"),
+            get("price"),
+            _intern(get("currency")),
+            get("timestamp"),
+            _frozen(get("raw_fields"))
+        )
+
+
+class CompactEntities(CompactRecord):
+    """Instrument, account and identifiers a break refers to"""
+
+    __slots__ = ('instrument', 'account', 'broker', 'trade_ids', 'order_ids', 'counterparty')
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "CompactEntities":
+        get = data.get
+        return cls._new(
+            _intern(get("instrument")),
+            _intern(get("account")),
+            _intern(get("broker")),
+            tuple(get("trade_ids") or ()),
+            tuple(get("order_ids") or ()),
+            _intern(get("counterparty"))
+        )
+
+
+class CompactBreak(CompactRecord):
+    """Normalized break with compact legs and entities"""
+
+    __slots__ = (
+        'break_id', 'break_type', 'status', 'system_a', 'system_b',
+        'entities', 'date', 'source', 'raw_data'
+    )
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "CompactBreak":
+        """
+        Build a compact record from a normalized break
+
+        Args:
+            data: Normalized break (e.g. from ``normalize_break``)
+
+        Returns:
+            Compact record with the same fields
+        """
+        if isinstance(data, CompactBreak):
+            return data
+        get = data.get
+        return cls._new(
+            get("break_id"),
+            _intern(get("break_type")),
+            _intern(get("status")),
+            CompactSystemLeg.from_dict(get("system_a") or {}),
+            CompactSystemLeg.from_dict(get("system_b") or {}),
+            CompactEntities.from_dict(get("entities") or {}),
+            get("date"),
+            _intern(get("source")),
+            _frozen(get("raw_data"))
+        )
+
+
+def compact_break(data: Mapping) -> CompactBreak:
+    """Compact record for a normalized break (returned as-is if already compact)"""
+    return CompactBreak.from_dict(data)
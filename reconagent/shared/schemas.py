@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from pydantic import BaseModel, Field
+from typing_extensions import NotRequired, TypedDict
 
 
 class BreakType(str, Enum):
@@ -56,6 +57,42 @@ class Break(BaseModel):
     raw_data: Dict[str, Any] = Field(default_factory=dict)
 
 
+# Plain-dict mirrors of Break, SystemData and BreakEntities for validating
+# with a TypeAdapter, which skips building and dumping model instances.
+# Fields with defaults are NotRequired; the defaults themselves still come
+# from the models (see break_tools.normalize_and_validate_break).
+
+class SystemDataRecord(TypedDict):
+    system_name: str
+    quantity: NotRequired[Optional[float]]
+    amount: NotRequired[Optional[float]]
+    price: NotRequired[Optional[float]]
+    currency: NotRequired[Optional[str]]
+    timestamp: NotRequired[Optional[datetime]]
+    raw_fields: NotRequired[Dict[str, Any]]
+
+
+class BreakEntitiesRecord(TypedDict):
+    instrument: str
+    account: NotRequired[Optional[str]]
+    broker: NotRequired[Optional[str]]
+    trade_ids: NotRequired[List[str]]
+    order_ids: NotRequired[List[str]]
+    counterparty: NotRequired[Optional[str]]
+
+
+class BreakRecord(TypedDict):
+    break_id: str
+    break_type: BreakType
+    status: NotRequired[str]
+    system_a: SystemDataRecord
+    system_b: SystemDataRecord
+    entities: BreakEntitiesRecord
+    date: NotRequired[datetime]
+    source: str
+    raw_data: NotRequired[Dict[str, Any]]
+
+
 class EnrichedData(BaseModel):
     break_id: str
     oms_data: Optional[Dict[str, Any]] = None
@@ -0,0 +1,83 @@
+"""
+Test N:M aggregation matching of partial fills
+"""
+import sys
+import os
+import random
+from itertools import combinations
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.tools.aggregation_matcher import find_aggregation
+from mcp.tools.matching_tools import correlate_trades
+
+
+def fill(candidate_id, quantity, price=100.0, score=0.8):
+    return {
+        "candidate_id": candidate_id,
+        "similarity_score": score,
+        "data": {"quantity": quantity, "amount": quantity * price}
+    }
+
+
+def brute_force_best(quantities, target):
+    best = target
+    for size in range(1, len(quantities) + 1):
+        for subset in combinations(quantities, size):
+            best = min(best, abs(target - sum(subset)))
+    return best
+
+
+def test_meet_in_the_middle_is_exact():
+    rng = random.Random(5)
+    for _ in range(20):
+        quantities = [rng.randint(1, 500) for _ in range(12)]
+        target = rng.randint(200, 2000)
+        result = find_aggregation([fill(f"F{i}", q) for i, q in enumerate(quantities)], target)
+        assert result["method"] == "meet_in_the_middle"
+        assert result["complete"]
+        assert abs(result["residual_quantity"]) == brute_force_best(quantities, target)
+
+
+def test_amount_breaks_quantity_ties():
+    candidates = [fill("A", 600, price=101.0), fill("B", 400), fill("C", 600), fill("D", 500)]
+    result = find_aggregation(candidates, 1000, target_amount=100000)
+    assert sorted(result["candidate_ids"]) == ["B", "C"]
+    assert result["residual_quantity"] == 0
+    assert result["residual_amount"] == 0
+
+
+def test_large_candidate_sets_use_bounded_dp():
+    rng = random.Random(9)
+    fills = [fill(f"F{i}", rng.randint(10, 1000)) for i in range(200)]
+    target = sum(f["data"]["quantity"] for f in fills[:37])
+
+    result = find_aggregation(fills, target, time_budget_ms=200)
+    assert result["method"] == "greedy_dp"
+    assert result["candidates_searched"] == 200
+    assert abs(result["residual_quantity"]) <= target * 0.001
+
+    capped = find_aggregation(fills, target, max_candidates=50, time_budget_ms=200)
+    assert capped["candidates_searched"] == 50
+    assert not capped["complete"]
+
+
+def test_time_budget_is_respected():
+    rng = random.Random(2)
+    fills = [fill(f"F{i}", rng.random() * 1000) for i in range(24)]
+    result = find_aggregation(fills, 5000.5, time_budget_ms=5)
+    assert result["elapsed_ms"] < 200
+    assert result["candidate_ids"]
+
+
+def test_correlate_trades_reports_aggregated_match():
+    break_data = {"system_a": {"quantity": 1000, "amount": 100000.0}, "system_b": {"quantity": 700}}
+    candidates = [fill("F1", 300), fill("F2", 200), fill("F3", 500), fill("F4", 900)]
+
+    correlation = correlate_trades(candidates, break_data)
+    assert correlation["correlation_type"] == "AGGREGATED_MATCH"
+    assert sorted(correlation["aggregation"]["candidate_ids"]) == ["F1", "F2", "F3"]
+
+    # Without break data the result is unchanged
+    assert correlate_trades(candidates)["correlation_type"] == "MULTIPLE_MATCHES"
@@ -0,0 +1,53 @@
+"""
+Test vectorized candidate scoring against calculate_similarity
+"""
+import sys
+import os
+import random
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.tools.matching_tools import (
+    CandidateBlock, calculate_similarity, score_candidates, score_candidate_records
+)
+
+
+def random_record(rng):
+    """Record with a random subset of fields, including zeros and junk values"""
+    record = {}
+    if rng.random() < 0.9:
+        record["instrument"] = rng.choice(["AAPL", "MSFT", None])
+    if rng.random() < 0.8:
+        record["currency"] = rng.choice(["USD", "EUR"])
+    for field, base in (("quantity", 1000), ("amount", 150000.0), ("price", 150.0)):
+        roll = rng.random()
+        if roll < 0.1:
+            continue
+        if roll < 0.15:
+            record[field] = 0
+        elif roll < 0.2:
+            record[field] = rng.choice([None, "n/a", "1000"])
+        else:
+            record[field] = base * rng.uniform(0.85, 1.15)
+    return record
+
+
+def test_scores_agree_with_scalar_function():
+    rng = random.Random(11)
+    candidates = [random_record(rng) for _ in range(500)]
+    block = CandidateBlock.from_records(candidates)
+
+    for _ in range(200):
+        data_a = random_record(rng)
+        scores = score_candidates(data_a, block)
+        expected = [calculate_similarity(data_a, candidate) for candidate in candidates]
+        assert scores.tolist() == expected
+
+
+def test_tier_boundaries():
+    data_a = {"quantity": 100.0}
+    candidates = [{"quantity": q} for q in (100.0, 100.5, 103.0, 108.0, 120.0, 0.0)]
+    assert score_candidate_records(data_a, candidates) == [1.0, 1.0, 0.7, 0.4, 0.0, 0.0]
+    assert score_candidate_records({"quantity": 0}, candidates)[-1] == 1.0
+    assert score_candidate_records({"trade_id": "X"}, candidates) == [0.0] * len(candidates)
@@ -0,0 +1,70 @@
+"""
+Test batch break classification against the scalar path
+"""
+import sys
+import os
+import random
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from orchestrator.v2.break_classifier import BreakClassifier
+
+BREAK_TYPES = [
+    "TRADE_OMS_MISMATCH", "CASH_RECONCILIATION", "BROKER_VS_INTERNAL", "PNL_RECONCILIATION",
+    "REGULATORY_DATA", "LIFECYCLE_EVENT", "CUSTODIAN_MISMATCH", "FO_VS_BO", "UNKNOWN"
+]
+INSTRUMENTS = ["AAPL", "FXEURUSD", "USDJPY", "SPX-CALL", "TSLA-PUT", "BASKET.SW", "MSFT-OPT", ""]
+EDGE_EXPOSURES = [0.0, 4999.99, 5000.0, 5000.01, 49999.99, 50000.0, 50000.01, 99999.99, 100000.0, 1e9]
+
+
+def make_breaks(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    breaks = []
+    for idx in range(count):
+        amount_b = rng.uniform(-1e6, 1e6)
+        exposure = EDGE_EXPOSURES[idx % len(EDGE_EXPOSURES)] if idx % 3 == 0 else rng.uniform(0, 2e5)
+        break_data = {
+            "break_id": f"BRK-{idx:05d}",
+            "break_type": rng.choice(BREAK_TYPES),
+            "system_a": {"amount": abs(amount_b) + exposure, "source": rng.choice(["OMS", "UNKNOWN"])},
+            "system_b": {"amount": amount_b},
+            "entities": {"instrument": rng.choice(INSTRUMENTS)},
+        }
+        if idx % 11 == 0:
+            del break_data["system_b"]
+        if idx % 13 == 0:
+            del break_data["entities"]
+        breaks.append(break_data)
+    return breaks
+
+
+def test_classify_many_matches_scalar_classify():
+    classifier = BreakClassifier()
+    breaks = make_breaks(3000)
+
+    batch = classifier.classify_many(breaks)
+
+    assert len(batch) == len(breaks)
+    for break_data, profile in zip(breaks, batch):
+        expected = classifier.classify(break_data)
+        assert profile.model_dump(exclude={"created_at"}) == expected.model_dump(exclude={"created_at"})
+        # Exposure must agree bit for bit, not just approximately
+        assert profile.exposure.hex() == expected.exposure.hex()
+
+
+def test_classify_many_accepts_columnar_batches():
+    classifier = BreakClassifier()
+    batch = classifier.classify_many({
+        "break_id": ["BRK-1", "BRK-2", "BRK-3"],
+        "break_type": ["TRADE_OMS_MISMATCH", "REGULATORY_DATA", "CASH_RECONCILIATION"],
+        "amount_a": [100.0, 10.0, 60000.0],
+        "amount_b": [-100.0, 10.0, 10000.0],
+        "instrument": ["AAPL-CALL", "AAPL", "EURUSD"],
+    })
+
+    assert [p.risk_tier.value for p in batch] == ["MEDIUM", "CRITICAL", "HIGH"]
+    assert [p.asset_class for p in batch] == ["DERIVATIVE", "EQUITY", "FX"]
+    assert batch.requires_matching.tolist() == [True, False, False]
+    assert batch.requires_pattern_analysis.tolist() == [False, True, True]
+    assert classifier.classify_many([]).exposure.shape == (0,)
@@ -0,0 +1,70 @@
+"""
+Test the TypeAdapter normalize+validate fast path against the Break model
+"""
+import sys
+import os
+import copy
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from mcp.tools.break_tools import normalize_and_validate_break, normalize_break, validate_break
+from mock_apis.main import backlog_break
+from shared.schemas import (
+    Break, BreakEntities, BreakEntitiesRecord, BreakRecord, SystemData, SystemDataRecord
+)
+
+
+def edge_case_breaks():
+    base = backlog_break(0)
+    minimal = {
+        "break_id": "BRK-MIN",
+        "break_type": "FO_VS_BO",
+        "system_a": {"system_name": "FO"},
+        "system_b": {"system_name": "BO", "amount": "12.5", "quantity": 3},
+        "entities": {"instrument": "AAPL"},
+        "date": "2025-01-02T03:04:05Z",
+        "source": "test",
+        "unexpected": "ignored"
+    }
+    empty_id = copy.deepcopy(base)
+    empty_id["break_id"] = ""
+    with_raw = copy.deepcopy(base)
+    with_raw["raw_data"] = {"nested": {"x": [1, 2]}}
+    with_raw["system_a"]["raw_fields"] = {"desk": "EQ"}
+    return [minimal, empty_id, with_raw]
+
+
+def test_fast_path_matches_model_round_trip():
+    breaks = [backlog_break(i) for i in range(200)] + edge_case_breaks()
+    for raw in breaks:
+        before = copy.deepcopy(raw)
+        result = normalize_and_validate_break(raw)
+        expected = Break(**raw).model_dump()
+
+        assert result["break_data"] == expected
+        assert result["validation"] == validate_break(expected)
+        assert normalize_break(raw) == expected
+        assert raw == before
+
+
+def test_invalid_breaks_return_errors():
+    missing_entities = backlog_break(1)
+    del missing_entities["entities"]
+    bad_type = dict(backlog_break(2), break_type="NOT_A_TYPE")
+
+    for raw in (missing_entities, bad_type, ["not", "a", "dict"]):
+        result = normalize_and_validate_break(raw)
+        assert result["error"].startswith("Failed to normalize break")
+        assert result["raw_data"] == raw
+
+
+@pytest.mark.parametrize("model, record", [
+    (Break, BreakRecord),
+    (SystemData, SystemDataRecord),
+    (BreakEntities, BreakEntitiesRecord)
+])
+def test_records_have_the_model_fields(model, record):
+    assert set(record.__annotations__) == set(model.model_fields)
@@ -0,0 +1,117 @@
+"""
+Test paginated / NDJSON break endpoints and streaming ingestion
+"""
+import sys
+import os
+import asyncio
+import json
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from agents.break_ingestion_agent import BreakIngestionAgent
+from mock_apis.main import app, backlog_break
+from orchestrator.v2.batch_engine import iterate_in_thread
+
+
+client = TestClient(app)
+
+
+def test_cursor_pages_cover_backlog_once():
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 25, "page_size": 10}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/breaks/page", params=params).json()
+        seen.extend(b["break_id"] for b in page["breaks"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert len(seen) == len(set(seen)) == 25
+    assert client.get("/api/breaks/page", params={"cursor": "bogus"}).status_code == 400
+
+
+def test_ndjson_stream_matches_pages():
+    response = client.get("/api/breaks/stream", params={"limit": 5})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    streamed = [json.loads(line) for line in response.text.splitlines() if line]
+    assert [b["break_id"] for b in streamed] == [backlog_break(i)["break_id"] for i in range(5)]
+
+    # Break-by-id route still resolves
+    assert client.get("/api/breaks/BRK-1").json()["break_id"] == "BRK-1"
+
+
+def test_ingestion_is_lazy():
+    pulled = []
+
+    def source():
+        for index in range(1000):
+            pulled.append(index)
+            yield backlog_break(index)
+
+    results = BreakIngestionAgent().iter_ingested_breaks(breaks=source())
+    first = next(results)
+
+    assert first["status"] in ("INGESTED", "VALIDATION_FAILED")
+    assert len(pulled) == 1
+
+
+def test_iterate_in_thread_preserves_order():
+    async def collect():
+        return [item async for item in iterate_in_thread(range(100), max_buffered=7)]
+
+    assert asyncio.run(collect()) == list(range(100))
+
+
+def test_iterate_in_thread_hands_over_items_as_they_arrive():
+    second_pulled = threading.Event()
+    closed = threading.Event()
+
+    def source():
+        try:
+            yield 1
+            # Blocks until the consumer has seen the first item
+            second_pulled.wait(5)
+            yield 2
+            yield 3
+        finally:
+            closed.set()
+
+    async def take_two():
+        taken = []
+        async for item in iterate_in_thread(source()):
+            taken.append(item)
+            second_pulled.set()
+            if len(taken) == 2:
+                break
+        return taken
+
+    start = time.perf_counter()
+    assert asyncio.run(take_two()) == [1, 2]
+    assert time.perf_counter() - start < 2
+    assert closed.wait(2)
+
+
+def test_ingestion_failure_keeps_partial_counts(monkeypatch):
+    def source(limit, break_type):
+        for index in range(3):
+            yield backlog_break(index)
+        raise ConnectionError("stream reset")
+
+    monkeypatch.setattr("agents.break_ingestion_agent.stream_breaks", source)
+    result = BreakIngestionAgent().ingest_multiple_breaks(limit=10, include_results=False)
+
+    assert result["total"] == 3
+    assert result["successful"] + result["failed"] == 3
+    assert result["error"] == "Ingestion stopped after 3 breaks: stream reset"
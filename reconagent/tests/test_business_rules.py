@@ -0,0 +1,158 @@
+"""
+Test the business-rule DSL, its decision table and hot reload
+"""
+import sys
+import os
+import textwrap
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+import mcp.tools.rules_tools as rules_tools
+from mcp.tools.business_rules import BUILTIN_RULE_SET, BusinessRuleLoader, RuleLoadError, compile_rules
+from mcp.tools.rules_tools import apply_business_rules, apply_business_rules_many, validate_rules
+
+
+RULES = """
+rule_sets:
+  DEFAULT:
+    DEFAULT:
+      rules:
+        - {rule: AMOUNT_TOLERANCE, critical: true}
+        - {rule: TIMING_LAG, max_lag_days: 1}
+    FX:
+      rules:
+        - {rule: AMOUNT_TOLERANCE, critical: true, tolerance_bps: 50}
+  TRADE_OMS_MISMATCH:
+    DEFAULT:
+      rules:
+        - {rule: CURRENCY_MATCH, critical: true}
+        - {rule: AMOUNT_TOLERANCE}
+      counterparties:
+        CPTY-LENIENT:
+          rules:
+            - {rule: CURRENCY_MATCH, critical: false}
+"""
+
+
+def write_rules(path, text):
+    path.write_text(textwrap.dedent(text))
+    # Make sure the mtime moves even on coarse-grained filesystems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def make_break(break_type="TRADE_OMS_MISMATCH", amount_b=100.1, currency_b="USD", lag_hours=1, counterparty=None):
+    now = datetime(2026, 1, 5, 12, 0)
+    return {
+        "break_id": f"BRK-{break_type}-{amount_b}-{currency_b}-{lag_hours}-{counterparty}",
+        "break_type": break_type,
+        "system_a": {"amount": 100.0, "currency": "USD", "timestamp": now.isoformat()},
+        "system_b": {"amount": amount_b, "currency": currency_b,
+                     "timestamp": (now - timedelta(hours=lag_hours)).isoformat()},
+        "entities": {"counterparty": counterparty}
+    }
+
+
+def test_decision_table_lookup(tmp_path):
+    path = tmp_path / "rules.yaml"
+    write_rules(path, RULES)
+    loader = BusinessRuleLoader(str(path))
+
+    assert loader.rule_set("TRADE_OMS_MISMATCH", "EQUITY").key == ("TRADE_OMS_MISMATCH", "DEFAULT")
+    assert loader.rule_set("CASH_RECONCILIATION", "FX").key == ("DEFAULT", "FX")
+    assert loader.rule_set("CASH_RECONCILIATION", None).key == ("DEFAULT", "DEFAULT")
+    lenient = loader.rule_set("TRADE_OMS_MISMATCH", None, "CPTY-LENIENT")
+    assert lenient.critical_rules == []
+    assert [spec.rule for spec in lenient.rules] == ["AMOUNT_TOLERANCE", "CURRENCY_MATCH"]
+
+    assert BusinessRuleLoader(str(tmp_path / "missing.yaml")).rule_set("X") is BUILTIN_RULE_SET
+
+
+def test_only_applicable_rules_are_evaluated(tmp_path, monkeypatch):
+    path = tmp_path / "rules.yaml"
+    write_rules(path, RULES)
+    monkeypatch.setattr(rules_tools, "business_rules", BusinessRuleLoader(str(path)))
+
+    fx = apply_business_rules(make_break("CASH_RECONCILIATION"), {"reference_data": {"asset_class": "FX"}})
+    assert fx["rules_applied"] == ["AMOUNT_TOLERANCE"]
+    assert fx["within_tolerance"]
+
+    late = apply_business_rules(make_break("CASH_RECONCILIATION", amount_b=100.0, lag_hours=30), {})
+    assert late["failed_rules"] == ["TIMING_LAG"]
+    assert "Exceeds lag tolerance" in late["tolerance_checks"]["timing"]["reason"]
+    assert validate_rules(late)
+
+    fx_mismatch = make_break(currency_b="EUR", amount_b=100.0)
+    assert not validate_rules(apply_business_rules(fx_mismatch, {}))
+    fx_mismatch["entities"]["counterparty"] = "CPTY-LENIENT"
+    assert validate_rules(apply_business_rules(fx_mismatch, {}))
+
+
+def test_reload_on_change_and_reject_invalid(tmp_path):
+    path = tmp_path / "rules.yaml"
+    write_rules(path, RULES)
+    loader = BusinessRuleLoader(str(path))
+    assert loader.rule_set("CASH_RECONCILIATION", "FX").rule("AMOUNT_TOLERANCE").tolerance_bps == 50
+
+    write_rules(path, RULES.replace("tolerance_bps: 50", "tolerance_bps: 75"))
+    assert loader.reload_if_changed(force_check=True)
+    assert loader.version == 2
+    assert loader.rule_set("CASH_RECONCILIATION", "FX").rule("AMOUNT_TOLERANCE").tolerance_bps == 75
+
+    write_rules(path, RULES.replace("AMOUNT_TOLERANCE, critical", "AMOUNT_TOLERANCES, critical"))
+    assert not loader.reload_if_changed(force_check=True)
+    assert loader.version == 2
+
+    with pytest.raises(RuleLoadError):
+        compile_rules({"rule_sets": {"DEFAULT": {"DEFAULT": {"rules": [{"rule": "CURRENCY_MATCH"}] * 2}}}})
+
+
+@pytest.mark.parametrize("text", [
+    "- DEFAULT\n",
+    "rule_sets: [DEFAULT]\n",
+    "rule_sets:\n  DEFAULT: [FX]\n",
+    "rule_sets:\n  DEFAULT:\n    DEFAULT:\n      counterparties: [GS]\n",
+    "rule_sets:\n  DEFAULT:\n    DEFAULT:\n      counterparties: {GS: [x]}\n",
+    "rule_sets:\n  DEFAULT:\n    DEFAULT:\n      rules: [AMOUNT_TOLERANCE]\n",
+])
+def test_malformed_structure_is_rejected(tmp_path, text):
+    path = tmp_path / "rules.yaml"
+    path.write_text(text)
+    with pytest.raises(RuleLoadError):
+        BusinessRuleLoader(str(path))
+
+    write_rules(path, RULES)
+    loader = BusinessRuleLoader(str(path))
+    write_rules(path, text)
+    assert not loader.reload_if_changed(force_check=True)
+    assert loader._rejected_mtime == os.stat(path).st_mtime_ns
+    assert loader.version == 1
+    assert loader.rule_set("CASH_RECONCILIATION", "FX").key == ("DEFAULT", "FX")
+
+
+def test_batch_agrees_across_rule_sets(tmp_path, monkeypatch):
+    path = tmp_path / "rules.yaml"
+    write_rules(path, RULES)
+    monkeypatch.setattr(rules_tools, "business_rules", BusinessRuleLoader(str(path)))
+
+    breaks, asset_classes = [], []
+    for break_type in ("TRADE_OMS_MISMATCH", "CASH_RECONCILIATION"):
+        for amount_b in (100.0, 100.004, 100.3, 0):
+            for currency_b in ("USD", "EUR"):
+                for lag_hours in (1, 30):
+                    for counterparty in (None, "CPTY-LENIENT"):
+                        for asset_class in ("EQUITY", "FX"):
+                            breaks.append(make_break(break_type, amount_b, currency_b, lag_hours, counterparty))
+                            asset_classes.append(asset_class)
+
+    batch = apply_business_rules_many(breaks, asset_classes)
+    for idx, break_data in enumerate(breaks):
+        expected = apply_business_rules(break_data, {"reference_data": {"asset_class": asset_classes[idx]}})
+        assert batch.evaluation(idx) == expected
+        assert bool(batch.within_tolerance[idx]) == expected["within_tolerance"]
+        assert bool(batch.all_critical_rules_passed[idx]) == validate_rules(expected)
+        assert batch.failed_rules(idx) == expected["failed_rules"]
@@ -0,0 +1,143 @@
+"""
+Test the open-trade candidate index and its use in find_match_candidates
+"""
+import sys
+import os
+import random
+from datetime import date, datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from mcp.tools.candidate_index import CandidateIndex
+from mcp.tools.matching_tools import find_match_candidates
+
+
+def make_trades(count, seed=7):
+    rng = random.Random(seed)
+    trades = []
+    for i in range(count):
+        quantity = rng.randint(1, 100) * 100
+        price = round(rng.uniform(50, 150), 2)
+        trades.append({
+            "trade_id": f"T{i}",
+            "instrument": rng.choice(["AAPL", "MSFT", "GOOGL"]),
+            "currency": rng.choice(["USD", "EUR"]),
+            "trade_date": rng.choice(["2026-01-05", "2026-01-06"]),
+            "quantity": quantity,
+            "amount": round(quantity * price, 2),
+            "price": price
+        })
+    return trades
+
+
+def naive_search(trades, instrument, currency, trade_date, quantity, amount, tolerance_pct):
+    return {
+        t["trade_id"] for t in trades
+        if t["instrument"] == instrument and t["currency"] == currency
+        and t["trade_date"] == trade_date
+        and abs(t["quantity"] - quantity) <= abs(quantity) * tolerance_pct
+        and abs(t["amount"] - amount) <= abs(amount) * tolerance_pct
+    }
+
+
+def test_search_matches_a_full_scan():
+    trades = make_trades(5000)
+    index = CandidateIndex(trades)
+    rng = random.Random(1)
+
+    for _ in range(50):
+        probe = rng.choice(trades)
+        args = (probe["instrument"], probe["currency"], probe["trade_date"],
+                probe["quantity"] * 1.03, probe["amount"] * 0.98, 0.05)
+        found = {t["trade_id"] for t in index.search(*args)}
+        assert found == naive_search(trades, *args)
+        assert probe["trade_id"] in found
+
+
+def test_incremental_insert_remove_and_bulk_load_agree():
+    trades = make_trades(2000)
+    bulk = CandidateIndex(trades[:1000])
+    bulk.add_trades(trades[1000:])
+    incremental = CandidateIndex()
+    for trade in trades:
+        incremental.add_trade(trade)
+
+    for trade_id in (f"T{i}" for i in range(0, 2000, 3)):
+        assert bulk.remove_trade(trade_id) is not None
+        incremental.remove_trade(trade_id)
+    assert bulk.remove_trade("T0") is None
+    assert len(bulk) == len(incremental) == 2000 - 667
+
+    for probe in trades[:100]:
+        args = (probe["instrument"], probe["currency"], probe["trade_date"])
+        kwargs = {"quantity": probe["quantity"], "amount": probe["amount"], "tolerance_pct": 0.1}
+        a = {t["trade_id"] for t in bulk.search(*args, **kwargs)}
+        b = {t["trade_id"] for t in incremental.search(*args, **kwargs)}
+        assert a == b
+        assert (probe["trade_id"] in a) == (probe["trade_id"] in bulk)
+
+
+def test_bulk_load_with_repeated_ids_keeps_the_last_record():
+    trades = make_trades(3)
+    index = CandidateIndex(trades[:2])
+    updated = dict(trades[1], quantity=trades[1]["quantity"] + 1)
+
+    assert index.add_trades([trades[1], trades[2], updated]) == 2
+    assert len(index) == 3
+    assert index.get("T1") is updated
+    for block in index._blocks.values():
+        assert sorted(block.quantity.ids) == sorted(block.amount.ids)
+        assert len(set(block.quantity.ids)) == len(block.quantity.ids)
+
+    assert index.remove_trade("T1") is updated
+    assert not index.search(updated["instrument"], updated["currency"], updated["trade_date"],
+                            quantity=updated["quantity"], tolerance_pct=0)
+
+    fresh = CandidateIndex()
+    assert fresh.add_trades([trades[0], dict(trades[0])]) == 1
+    assert len(fresh) == 1
+
+
+def test_bad_trade_leaves_bulk_load_untouched():
+    trades = make_trades(3)
+    index = CandidateIndex(trades[:1])
+    with pytest.raises(ValueError):
+        index.add_trades([trades[1], dict(trades[2], amount="n/a")])
+
+    assert len(index) == 1
+    assert "T1" not in index
+    assert sum(len(block.quantity.ids) for block in index._blocks.values()) == 1
+
+
+def test_trade_dates_are_normalized():
+    index = CandidateIndex([
+        {"trade_id": "T1", "instrument": "AAPL", "currency": "USD",
+         "trade_date": datetime(2026, 1, 5, 14, 30), "quantity": 100, "amount": 15000}
+    ])
+    assert index.search("AAPL", "USD", "2026-01-05T09:00:00", quantity=100)
+    assert index.search("AAPL", "USD", date(2026, 1, 5), amount=15000)
+    assert not index.search("AAPL", "USD", "2026-01-06", quantity=100)
+
+
+def test_find_match_candidates_scores_open_trades():
+    index = CandidateIndex([
+        {"trade_id": "T1", "instrument": "AAPL", "currency": "USD",
+         "trade_date": "2026-01-05", "quantity": 1000, "amount": 150000, "price": 150.0},
+        {"trade_id": "T2", "instrument": "AAPL", "currency": "USD",
+         "trade_date": "2026-01-05", "quantity": 5000, "amount": 750000, "price": 150.0},
+    ])
+    break_data = {
+        "entities": {"instrument": "AAPL"},
+        "system_a": {"quantity": 1000, "amount": 150000, "price": 150.0,
+                     "currency": "USD", "timestamp": "2026-01-05T10:00:00"},
+        "system_b": {},
+        "date": "2026-01-05T10:00:00"
+    }
+
+    candidates = find_match_candidates(break_data, {}, candidate_index=index)
+    assert [c["candidate_id"] for c in candidates] == ["T1"]
+    assert candidates[0]["source"] == "OPEN_TRADES"
+    assert candidates[0]["similarity_score"] == 1.0
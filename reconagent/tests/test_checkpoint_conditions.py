@@ -0,0 +1,91 @@
+"""
+Test compiled checkpoint conditions
+"""
+import sys
+import os
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from orchestrator.v2.checkpoint_conditions import (
+    CheckpointFacts, ConditionError, compile_condition
+)
+from orchestrator.v2.policies.policy_loader import PolicyLoadError, PolicyLoader
+
+
+def make_results(within_tolerance=True, confidence=0.9, root_cause="timing_lag", similarity=None):
+    results = {
+        "RULES_TOLERANCE": {"rules_evaluation": {"within_tolerance": within_tolerance}},
+        "PATTERN_INTELLIGENCE": {
+            "ml_insights": {"confidence": confidence, "probable_root_cause": root_cause}
+        },
+    }
+    if similarity is not None:
+        results["MATCHING_CORRELATION"] = {
+            "match_candidates": [{"similarity_score": similarity}, {"similarity_score": 0.1}]
+        }
+    return results
+
+
+def evaluate(condition, results):
+    return compile_condition(condition)(CheckpointFacts(results))
+
+
+def test_thresholds_are_applied_as_written():
+    condition = "within_tolerance and confidence > 0.85"
+
+    assert evaluate(condition, make_results(confidence=0.86))
+    assert not evaluate(condition, make_results(confidence=0.85))
+    assert not evaluate(condition, make_results(within_tolerance=False, confidence=0.99))
+
+
+def test_boolean_operators_and_precedence():
+    results = make_results(within_tolerance=False, root_cause="fee_mismatch")
+
+    assert evaluate("always", {})
+    assert evaluate("broker_fee_issue or within_tolerance and confidence > 0.99", results)
+    assert not evaluate("(broker_fee_issue or within_tolerance) and confidence > 0.99", results)
+    assert evaluate("not within_tolerance and confidence >= 0.9", results)
+    assert evaluate("match_found and match_score == 0.95", make_results(similarity=0.95))
+    assert not evaluate("match_found", make_results())
+
+
+def test_string_literals_compare_with_facts():
+    results = make_results(root_cause="fee_mismatch")
+
+    assert evaluate("root_cause == 'fee_mismatch'", results)
+    assert evaluate('root_cause != "timing_lag" and confidence > 0.5', results)
+    assert not evaluate("root_cause == 'timing_lag'", results)
+    assert evaluate("root_cause == 'unknown'", {})
+
+
+def test_conditions_are_compiled_once():
+    assert compile_condition("within_tolerance") is compile_condition("within_tolerance")
+    assert compile_condition("within_tolerance and confidence > 0.9").facts == {
+        "within_tolerance", "confidence"
+    }
+
+
+@pytest.mark.parametrize("condition", ["", "within_tolerance and", "unknown_fact", "(always", "confidence >> 1", "root_cause == 'timing_lag"])
+def test_malformed_conditions_are_rejected(condition):
+    with pytest.raises(ConditionError):
+        compile_condition(condition)
+
+
+def test_invalid_checkpoints_reject_the_policy_file(tmp_path):
+    policy_file = tmp_path / "policies.yaml"
+    policy_file.write_text(
+        "policies:\n"
+        "  DEFAULT:\n"
+        "    LOW:\n"
+        "      mandatory_agents: [BREAK_INGESTION]\n"
+        "      decision_checkpoints:\n"
+        "        - after_nodes: [RULES_TOLERANCE]\n"
+        "          condition: \"within_tolerance and\"\n"
+        "        - after_nodes: [RULES_TOLERANCE]\n"
+        "          condition: \"within_tolerance\"\n"
+    )
+
+    with pytest.raises(PolicyLoadError, match="checkpoint 0"):
+        PolicyLoader(str(policy_file))
@@ -0,0 +1,146 @@
+"""
+Test concurrent break processing on a single Dynamic Orchestrator v2 instance
+"""
+import sys
+import os
+import asyncio
+import random
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from orchestrator.v2.dynamic_orchestrator import DynamicReconciliationOrchestrator
+
+
+class EchoAgent:
+    """Agent stub that tags every result with the break it was given"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def _result(self, break_data, **extra):
+        # Small random delay so concurrent breaks interleave
+        time.sleep(random.uniform(0, 0.005))
+        return {"break_id": break_data["break_id"], "agent": self.name, **extra}
+
+    def ingest_break(self, raw_break=None):
+        return self._result(raw_break)
+
+    def enrich_break(self, break_data):
+        return self._result(break_data, enriched_data={"for_break": break_data["break_id"]})
+
+    def find_matches(self, break_data, enriched_data):
+        return self._result(break_data, seen=[enriched_data.get("for_break")], match_candidates=[])
+
+    def evaluate_rules(self, break_data, enriched_data):
+        within = break_data["system_a"]["amount"] == break_data["system_b"]["amount"]
+        return self._result(
+            break_data,
+            seen=[enriched_data.get("for_break")],
+            rules_evaluation={"within_tolerance": within, "for_break": break_data["break_id"]}
+        )
+
+    def analyze_patterns(self, break_data, rules_evaluation):
+        return self._result(break_data, seen=[rules_evaluation.get("for_break", break_data["break_id"])])
+
+    def make_decision(self, break_data, *upstream):
+        seen = [result.get("break_id") for result in upstream if result]
+        return self._result(break_data, seen=seen, decision={"action": "HIL_REVIEW", "for_break": break_data["break_id"]})
+
+    def create_workflow(self, break_data, decision, results):
+        seen = [decision.get("for_break")] + [r.get("break_id") for r in results.values() if r]
+        return self._result(break_data, seen=seen)
+
+
+def make_break(idx: int) -> dict:
+    exposure = [0.0, 2000.0, 20000.0, 75000.0, 250000.0][idx % 5]
+    return {
+        "break_id": f"BRK-{idx:04d}",
+        "break_type": ["TRADE_OMS_MISMATCH", "CASH_RECONCILIATION", "BROKER_VS_INTERNAL"][idx % 3],
+        "system_a": {"system_name": "OMS", "amount": 100000.0 + exposure, "quantity": 100, "currency": "USD"},
+        "system_b": {"system_name": "TC", "amount": 100000.0, "quantity": 100, "currency": "USD"},
+        "entities": {"instrument": "AAPL", "account": "ACC-12345"},
+        "source": "Test"
+    }
+
+
+def test_500_concurrent_breaks_stay_isolated():
+    """Results from concurrently processed breaks never leak across breaks"""
+    agent_names = [
+        "break_ingestion", "data_enrichment", "matching_correlation", "rules_tolerance",
+        "pattern_intelligence", "decisioning", "workflow_feedback"
+    ]
+    orchestrator = DynamicReconciliationOrchestrator(
+        agents={name: EchoAgent(name) for name in agent_names}
+    )
+    breaks = [make_break(idx) for idx in range(500)]
+
+    async def run_all():
+        return await asyncio.gather(*[
+            orchestrator.process_break_async(raw_break=break_data) for break_data in breaks
+        ])
+
+    results = asyncio.run(run_all())
+
+    assert len(results) == 500
+    for break_data, result in zip(breaks, results):
+        break_id = break_data["break_id"]
+        graph = result["execution_graph"]
+
+        assert result["break_id"] == break_id
+        assert graph["break_id"] == break_id
+        # Each run only records its own planned nodes
+        planned = {node["node_id"] for node in result["execution_plan"]["nodes"]}
+        assert {e["node_id"] for e in graph["executions"]} == planned
+        assert len(graph["executions"]) == len(planned)
+
+        for execution in graph["executions"]:
+            if execution["status"] != "COMPLETED":
+                continue
+            assert execution["result"]["break_id"] == break_id
+            assert all(seen == break_id for seen in execution["result"].get("seen", []))
+
+
+def test_batch_engine_streams_results_with_bounded_concurrency():
+    """BatchEngine caps breaks in flight and builds the summary incrementally"""
+    from orchestrator.v2.batch_engine import BatchEngine
+
+    agent_names = [
+        "break_ingestion", "data_enrichment", "matching_correlation", "rules_tolerance",
+        "pattern_intelligence", "decisioning", "workflow_feedback"
+    ]
+    orchestrator = DynamicReconciliationOrchestrator(
+        agents={name: EchoAgent(name) for name in agent_names}
+    )
+
+    in_flight = {"now": 0, "max": 0}
+    process_break_async = orchestrator.process_break_async
+
+    async def tracked(**kwargs):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        try:
+            return await process_break_async(**kwargs)
+        finally:
+            in_flight["now"] -= 1
+
+    orchestrator.process_break_async = tracked
+    engine = BatchEngine(orchestrator, max_concurrency=8)
+
+    async def consume():
+        seen = []
+        async for result in engine.stream(make_break(idx) for idx in range(60)):
+            seen.append(result)
+            assert engine.summary.breaks_processed == len(seen)
+        return seen
+
+    results = asyncio.run(consume())
+    summary = engine.summary.as_dict()
+
+    assert len(results) == 60
+    assert {r["break_id"] for r in results} == {f"BRK-{idx:04d}" for idx in range(60)}
+    assert in_flight["max"] <= 8
+    assert summary["total_agents_planned"] == sum(r["execution_plan"]["agents_planned"] for r in results)
+    assert summary["early_exits"] == sum(1 for r in results if r["performance"]["early_exit"])
+    assert sum(summary["decisions"].values()) == 60
@@ -0,0 +1,428 @@
+"""
+Test DAG Executor scheduling with stub agents (no mock API required)
+"""
+import sys
+import os
+import asyncio
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from orchestrator.v2.dag_executor import DAGExecutor
+from orchestrator.v2.readiness import PlanIndex, ReadinessTracker
+from orchestrator.v2.resilience import LatencyTracker, RetryPolicy
+from orchestrator.v2.speculation import EarlyExitStats
+from orchestrator.v2.schemas import (
+    AgentNode, BreakProfile, DecisionCheckpoint, ExecutionPlan, RiskTier
+)
+
+
+class StubAgent:
+    """Agent stub whose methods block for a fixed time and echo the break"""
+
+    def __init__(self, delay: float = 0.0, result: dict = None):
+        self.delay = delay
+        self.result = result or {}
+        self.calls = []
+
+    def _run(self, break_data, *args, **kwargs):
+        self.calls.append(break_data.get("break_id"))
+        time.sleep(self.delay)
+        return {"break_id": break_data.get("break_id"), **self.result}
+
+    enrich_break = find_matches = evaluate_rules = analyze_patterns = _run
+    make_decision = create_workflow = _run
+
+    def ingest_break(self, raw_break=None):
+        return self._run(raw_break)
+
+
+def make_plan(nodes, checkpoints=None, max_parallel=3, early_exit=True):
+    return ExecutionPlan(
+        plan_id="PLAN-TEST",
+        break_profile=BreakProfile(
+            break_id="BRK-TEST", break_type="TRADE_OMS_MISMATCH", risk_tier=RiskTier.HIGH
+        ),
+        nodes=nodes,
+        decision_checkpoints=checkpoints or [],
+        max_parallel=max_parallel,
+        early_exit_enabled=early_exit
+    )
+
+
+def test_ready_nodes_depend_on_their_own_dependencies_only():
+    """A node is ready once its dependencies finish, whatever its siblings are doing"""
+    plan = make_plan([
+        AgentNode(node_id="N1", agent_name="DATA_ENRICHMENT"),
+        AgentNode(node_id="N2", agent_name="MATCHING_CORRELATION", depends_on=["N1"]),
+        AgentNode(node_id="N3", agent_name="RULES_TOLERANCE", depends_on=["N1"]),
+        AgentNode(node_id="N4", agent_name="PATTERN_INTELLIGENCE", depends_on=["N3"]),
+    ])
+    tracker = ReadinessTracker(PlanIndex.for_plan(plan))
+
+    def ready():
+        return [n.node_id for n in tracker.take_ready()]
+
+    assert ready() == ["N1"]
+    tracker.mark_finished("N1")
+    assert ready() == ["N2", "N3"]
+    # N2 still running does not hold back N4
+    tracker.mark_finished("N3")
+    assert ready() == ["N4"]
+
+    # Skipped dependencies unblock their dependents
+    tracker = ReadinessTracker(PlanIndex.for_plan(plan))
+    ready()
+    tracker.mark_finished("N1")
+    ready()
+    tracker.mark_finished("N3", completed=False)
+    assert ready() == ["N4"]
+
+
+def test_checkpoint_is_checked_after_each_node():
+    """An early-exit checkpoint skips dependents as soon as its node completes"""
+    agents = {
+        "rules_tolerance": StubAgent(result={"rules_evaluation": {"within_tolerance": True}}),
+        "matching_correlation": StubAgent(),
+        "pattern_intelligence": StubAgent(),
+    }
+    plan = make_plan(
+        [
+            AgentNode(node_id="N1", agent_name="RULES_TOLERANCE"),
+            AgentNode(node_id="N2", agent_name="MATCHING_CORRELATION", depends_on=["N1"]),
+            AgentNode(node_id="N3", agent_name="PATTERN_INTELLIGENCE", depends_on=["N2"]),
+        ],
+        checkpoints=[DecisionCheckpoint(
+            checkpoint_id="CP1", after_nodes=["RULES_TOLERANCE"],
+            condition="within_rounding_tolerance", action="AUTO_RESOLVE"
+        )]
+    )
+
+    graph = asyncio.run(DAGExecutor(agents).execute(plan, {"break_id": "BRK-TEST"}))
+    by_agent = {e.agent_name: e for e in graph.executions}
+
+    assert graph.early_exit
+    assert graph.decision["action"] == "AUTO_RESOLVE"
+    assert agents["matching_correlation"].calls == []
+    assert by_agent["MATCHING_CORRELATION"].status == "SKIPPED"
+    assert by_agent["PATTERN_INTELLIGENCE"].status == "SKIPPED"
+
+
+def test_failed_node_still_releases_dependents():
+    agents = {"pattern_intelligence": StubAgent()}
+    plan = make_plan([
+        AgentNode(node_id="N1", agent_name="RULES_TOLERANCE"),
+        AgentNode(node_id="N2", agent_name="PATTERN_INTELLIGENCE", depends_on=["N1"]),
+    ], early_exit=False)
+
+    graph = asyncio.run(DAGExecutor(agents).execute(plan, {"break_id": "BRK-TEST"}))
+    by_agent = {e.agent_name: e for e in graph.executions}
+
+    assert by_agent["RULES_TOLERANCE"].status == "FAILED"
+    assert by_agent["PATTERN_INTELLIGENCE"].status == "COMPLETED"
+    assert agents["pattern_intelligence"].calls == ["BRK-TEST"]
+
+
+def test_node_launches_when_its_dependencies_finish():
+    """A slow sibling must not hold back nodes whose dependencies are met"""
+    agents = {
+        "data_enrichment": StubAgent(),
+        "matching_correlation": StubAgent(delay=0.4),
+        "rules_tolerance": StubAgent(delay=0.05),
+        "pattern_intelligence": StubAgent(delay=0.05),
+    }
+    plan = make_plan([
+        AgentNode(node_id="N1", agent_name="DATA_ENRICHMENT"),
+        AgentNode(node_id="N2", agent_name="MATCHING_CORRELATION", depends_on=["N1"]),
+        AgentNode(node_id="N3", agent_name="RULES_TOLERANCE", depends_on=["N1"]),
+        AgentNode(node_id="N4", agent_name="PATTERN_INTELLIGENCE", depends_on=["N3"]),
+    ], early_exit=False)
+
+    graph = asyncio.run(DAGExecutor(agents).execute(plan, {"break_id": "BRK-TEST"}))
+    by_agent = {e.agent_name: e for e in graph.executions}
+
+    assert all(e.status == "COMPLETED" for e in graph.executions)
+    assert by_agent["PATTERN_INTELLIGENCE"].started_at < by_agent["MATCHING_CORRELATION"].completed_at
+    # Critical path is N1 -> N2 (0.4s), not N2 + N4 stages back to back
+    assert graph.total_duration_ms < 600
+
+
+def test_blocking_agents_in_a_stage_run_concurrently():
+    """Blocking agent methods are dispatched off the event loop"""
+    agents = {
+        "matching_correlation": StubAgent(delay=0.3),
+        "rules_tolerance": StubAgent(delay=0.3),
+        "pattern_intelligence": StubAgent(delay=0.3),
+    }
+    plan = make_plan([
+        AgentNode(node_id="N1", agent_name="MATCHING_CORRELATION"),
+        AgentNode(node_id="N2", agent_name="RULES_TOLERANCE"),
+        AgentNode(node_id="N3", agent_name="PATTERN_INTELLIGENCE"),
+    ], early_exit=False)
+
+    graph = asyncio.run(DAGExecutor(agents).execute(plan, {"break_id": "BRK-TEST"}))
+
+    assert graph.agents_invoked == 3
+    assert graph.total_duration_ms < 600
+
+
+def test_checkpoint_evaluated_after_each_node_cancels_remaining():
+    """An early-exit checkpoint fires as soon as its node completes"""
+    agents = {
+        "rules_tolerance": StubAgent(result={"rules_evaluation": {"within_tolerance": True}}),
+        "matching_correlation": StubAgent(delay=0.5),
+    }
+    plan = make_plan(
+        [
+            AgentNode(node_id="N1", agent_name="RULES_TOLERANCE"),
+            AgentNode(node_id="N2", agent_name="MATCHING_CORRELATION"),
+        ],
+        checkpoints=[DecisionCheckpoint(
+            checkpoint_id="CP1", after_nodes=["RULES_TOLERANCE"],
+            condition="within_rounding_tolerance", action="AUTO_RESOLVE"
+        )]
+    )
+
+    graph = asyncio.run(DAGExecutor(agents).execute(plan, {"break_id": "BRK-TEST"}))
+    by_agent = {e.agent_name: e for e in graph.executions}
+
+    assert graph.early_exit
+    assert graph.decision["action"] == "AUTO_RESOLVE"
+    assert by_agent["MATCHING_CORRELATION"].status == "SKIPPED"
+    assert graph.total_duration_ms < 400
+
+
+class FlakyAgent(StubAgent):
+    """Agent stub whose first calls hang or fail before it recovers"""
+
+    def __init__(self, failures, delay: float = 0.0):
+        super().__init__(delay=delay)
+        self.failures = list(failures)
+
+    def _run(self, break_data, *args, **kwargs):
+        failure = self.failures.pop(0) if self.failures else None
+        if failure == "hang":
+            time.sleep(0.5)
+        elif failure == "error":
+            raise RuntimeError("downstream unavailable")
+        return super()._run(break_data, *args, **kwargs)
+
+    enrich_break = analyze_patterns = _run
+
+
+class AsyncFlakyAgent(FlakyAgent):
+    """FlakyAgent with coroutine methods, whose hung attempts can be cancelled"""
+
+    async def _run(self, break_data, *args, **kwargs):
+        failure = self.failures.pop(0) if self.failures else None
+        if failure == "hang":
+            await asyncio.sleep(0.5)
+        elif failure == "error":
+            raise RuntimeError("downstream unavailable")
+        self.calls.append(break_data.get("break_id"))
+        return {"break_id": break_data.get("break_id")}
+
+    enrich_break = analyze_patterns = _run
+
+
+def test_hung_and_failed_attempts_are_retried():
+    """A hung attempt times out and a failed one is retried with backoff"""
+    agents = {"data_enrichment": AsyncFlakyAgent(["hang", "error"])}
+    plan = make_plan([
+        AgentNode(node_id="N1", agent_name="DATA_ENRICHMENT", timeout_seconds=0.1),
+    ], early_exit=False)
+    executor = DAGExecutor(agents, retry_policy=RetryPolicy(2, 0.01, 0.05))
+
+    graph = asyncio.run(executor.execute(plan, {"break_id": "BRK-TEST"}))
+    execution = graph.executions[0]
+
+    assert execution.status == "COMPLETED"
+    assert execution.attempts == 3
+    assert execution.timeouts == 1
+    assert len(execution.attempt_errors) == 2
+    assert graph.total_duration_ms < 400
+
+
+def test_blocking_attempt_that_times_out_is_not_retried():
+    """A hung worker thread cannot be cancelled, so it is not given a second one"""
+    agent = FlakyAgent(["hang"])
+    plan = make_plan([
+        AgentNode(node_id="N1", agent_name="DATA_ENRICHMENT", timeout_seconds=0.1),
+    ], early_exit=False)
+    executor = DAGExecutor({"data_enrichment": agent}, retry_policy=RetryPolicy(3, 0.0, 0.0))
+
+    graph = asyncio.run(executor.execute(plan, {"break_id": "BRK-TEST"}))
+    execution = graph.executions[0]
+
+    assert execution.status == "FAILED"
+    assert execution.attempts == 1
+    assert execution.timeouts == 1
+    assert agent.failures == []
+
+
+def test_retries_share_one_node_budget():
+    """Attempt deadlines shrink to what is left of the node budget"""
+    agents = {"data_enrichment": AsyncFlakyAgent(["hang"] * 5)}
+    plan = make_plan([
+        AgentNode(node_id="N1", agent_name="DATA_ENRICHMENT", timeout_seconds=0.2),
+    ], early_exit=False)
+    executor = DAGExecutor(agents, retry_policy=RetryPolicy(4, 0.0, 0.0), node_budget_seconds=0.3)
+
+    graph = asyncio.run(executor.execute(plan, {"break_id": "BRK-TEST"}))
+    execution = graph.executions[0]
+
+    assert execution.status == "FAILED"
+    assert execution.attempts == 2
+    assert execution.timeouts == 2
+    assert execution.attempt_errors[1].endswith("after 0.1s")
+    assert graph.total_duration_ms < 450
+
+
+def test_node_fails_once_retries_are_exhausted():
+    agents = {"data_enrichment": FlakyAgent(["error"] * 5)}
+    plan = make_plan([AgentNode(node_id="N1", agent_name="DATA_ENRICHMENT")], early_exit=False)
+    executor = DAGExecutor(agents, retry_policy=RetryPolicy(1, 0.0, 0.0))
+
+    graph = asyncio.run(executor.execute(plan, {"break_id": "BRK-TEST"}))
+    execution = graph.executions[0]
+
+    assert execution.status == "FAILED"
+    assert execution.attempts == 2
+    assert "downstream unavailable" in execution.error
+
+
+def test_slow_read_only_attempt_is_hedged():
+    """A read-only agent past its p95 latency gets a second attempt"""
+    agents = {"data_enrichment": FlakyAgent(["hang"], delay=0.01)}
+    plan = make_plan([
+        AgentNode(node_id="N1", agent_name="DATA_ENRICHMENT", timeout_seconds=2),
+    ], early_exit=False)
+    tracker = LatencyTracker(min_samples=5)
+    for _ in range(5):
+        tracker.record("DATA_ENRICHMENT", 20.0)
+    executor = DAGExecutor(agents, latency_tracker=tracker, hedging_enabled=True)
+
+    graph = asyncio.run(executor.execute(plan, {"break_id": "BRK-TEST"}))
+    execution = graph.executions[0]
+
+    assert execution.status == "COMPLETED"
+    assert execution.hedged
+    assert execution.attempts == 1
+    assert graph.total_duration_ms < 300
+
+
+class GatedAgent(StubAgent):
+    """Agent stub whose calls block until the test releases them"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def _run(self, break_data, *args, **kwargs):
+        self.calls.append(break_data.get("break_id"))
+        self.release.wait(timeout=5)
+        return {"break_id": break_data.get("break_id")}
+
+    find_matches = _run
+
+
+def make_gated_plan(rules_result=None, matching_agent=None):
+    """DE -> RULES -> MATCHING, with MATCHING only needing DE's data"""
+    agents = {
+        "data_enrichment": StubAgent(),
+        "rules_tolerance": StubAgent(delay=0.2, result=rules_result),
+        "matching_correlation": matching_agent or StubAgent(delay=0.2),
+    }
+    plan = make_plan(
+        [
+            AgentNode(node_id="N1", agent_name="DATA_ENRICHMENT"),
+            AgentNode(node_id="N2", agent_name="RULES_TOLERANCE", depends_on=["N1"]),
+            AgentNode(node_id="N3", agent_name="MATCHING_CORRELATION", depends_on=["N2"]),
+        ],
+        checkpoints=[DecisionCheckpoint(
+            checkpoint_id="CP1", after_nodes=["RULES_TOLERANCE"],
+            condition="within_tolerance", action="AUTO_RESOLVE"
+        )]
+    )
+    return agents, plan
+
+
+def test_speculative_node_overlaps_its_gate():
+    agents, plan = make_gated_plan({"rules_evaluation": {"within_tolerance": False}})
+    executor = DAGExecutor(agents, speculative=True)
+
+    graph = asyncio.run(executor.execute(plan, {"break_id": "BRK-TEST"}))
+    by_agent = {e.agent_name: e for e in graph.executions}
+
+    assert not graph.early_exit
+    assert by_agent["MATCHING_CORRELATION"].status == "COMPLETED"
+    assert by_agent["MATCHING_CORRELATION"].speculative
+    assert graph.speculative_nodes == ["N3"]
+    assert graph.speculative_saved_ms > 100
+    assert graph.speculative_wasted_ms == 0
+    assert graph.total_duration_ms < 350
+
+
+def test_early_exit_cancels_speculative_work_and_reports_waste():
+    # MATCHING cannot finish before the checkpoint fires
+    matching = GatedAgent()
+    agents, plan = make_gated_plan({"rules_evaluation": {"within_tolerance": True}}, matching)
+    executor = DAGExecutor(agents, speculative=True)
+
+    try:
+        graph = asyncio.run(executor.execute(plan, {"break_id": "BRK-TEST"}))
+    finally:
+        matching.release.set()
+    by_agent = {e.agent_name: e for e in graph.executions}
+
+    assert graph.early_exit
+    assert matching.calls == ["BRK-TEST"]
+    assert by_agent["MATCHING_CORRELATION"].status == "SKIPPED"
+    assert by_agent["MATCHING_CORRELATION"].speculative
+    assert graph.speculative_saved_ms == 0
+    assert graph.speculative_wasted_ms > 100
+
+
+def test_profiles_that_usually_exit_early_are_not_speculated():
+    agents, plan = make_gated_plan({"rules_evaluation": {"within_tolerance": False}})
+    stats = EarlyExitStats(max_early_exit_rate=0.5, min_samples=4)
+    for _ in range(4):
+        stats.record("TRADE_OMS_MISMATCH", "HIGH", True)
+    executor = DAGExecutor(agents, speculative=True, early_exit_stats=stats)
+
+    graph = asyncio.run(executor.execute(plan, {"break_id": "BRK-TEST"}))
+
+    assert graph.speculative_nodes == []
+    assert stats.early_exit_rate("TRADE_OMS_MISMATCH", "HIGH") == 0.8
+
+
+def test_readiness_tracker_matches_dependency_scan():
+    """Incremental readiness releases the same nodes as a full rescan"""
+    nodes = [
+        AgentNode(node_id="N1", agent_name="DATA_ENRICHMENT"),
+        AgentNode(node_id="N2", agent_name="MATCHING_CORRELATION", depends_on=["N1"]),
+        AgentNode(node_id="N3", agent_name="RULES_TOLERANCE", depends_on=["N1"]),
+        AgentNode(node_id="N4", agent_name="PATTERN_INTELLIGENCE", depends_on=["N2", "N3"]),
+        AgentNode(node_id="N5", agent_name="DECISIONING", depends_on=["N9"]),
+    ]
+    plan = make_plan(nodes, checkpoints=[DecisionCheckpoint(
+        checkpoint_id="CP1", after_nodes=["MATCHING_CORRELATION", "RULES_TOLERANCE"],
+        condition="always", action="AUTO_RESOLVE"
+    )])
+    tracker = ReadinessTracker(PlanIndex.for_plan(plan))
+
+    assert [n.node_id for n in tracker.take_ready()] == ["N1"]
+    tracker.mark_finished("N1")
+    assert [n.node_id for n in tracker.take_ready()] == ["N2", "N3"]
+    tracker.mark_finished("N3")
+    assert tracker.take_ready() == [] and tracker.satisfied_checkpoints == []
+    tracker.mark_finished("N2", completed=False)
+    assert [n.node_id for n in tracker.take_ready()] == ["N4"]
+    # Skipped nodes unblock dependents but do not satisfy checkpoints
+    assert tracker.satisfied_checkpoints == []
+    # A dependency outside the plan never finishes
+    tracker.mark_finished("N4")
+    assert tracker.take_ready() == []
+    assert [n.node_id for n in PlanIndex.for_plan(plan).ready_after({"N1", "N2"})] == ["N3"]
@@ -0,0 +1,217 @@
+"""
+Test concurrent source fan-out and bulk lookups in enrichment
+"""
+import sys
+import os
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from mcp.tools import enrichment_tools
+from mcp.tools.enrichment_tools import EnrichmentEngine
+from shared.batching import MicroBatcher
+from shared.config import settings
+
+
+BREAK_DATA = {
+    "entities": {
+        "order_ids": ["ORD-1"],
+        "trade_ids": ["TRD-1"],
+        "account": "ACC-1",
+        "instrument": "AAPL"
+    }
+}
+
+
+def slow_source(name, delay):
+    def lookup(arg):
+        time.sleep(delay)
+        return {"source": name, "id": arg}
+    return lookup
+
+
+def patch_sources(monkeypatch, delays):
+    for func_name, delay in delays.items():
+        monkeypatch.setattr(enrichment_tools, func_name, slow_source(func_name, delay))
+
+
+def test_sources_are_fetched_concurrently(monkeypatch):
+    patch_sources(monkeypatch, {
+        "get_oms_data": 0.2,
+        "get_trade_capture": 0.2,
+        "get_broker_confirm": 0.2,
+        "get_settlement": 0.2,
+        "get_custodian_data": 0.2,
+        "get_reference_data": 0.2
+    })
+    engine = EnrichmentEngine(max_in_flight_per_source=8, source_timeout_seconds=5)
+
+    start = time.perf_counter()
+    enriched = engine.enrich(BREAK_DATA)
+    elapsed = time.perf_counter() - start
+
+    assert list(enriched) == [
+        "oms_data", "trade_capture_data", "broker_confirm_data",
+        "settlement_data", "custodian_data", "reference_data"
+    ]
+    assert enriched["settlement_data"] == {"source": "get_settlement", "id": "ACC-1"}
+    assert elapsed < 0.6
+
+
+def test_slow_source_times_out_with_partial_results(monkeypatch):
+    patch_sources(monkeypatch, {
+        "get_oms_data": 0.01,
+        "get_trade_capture": 0.01,
+        "get_broker_confirm": 1.0,
+        "get_settlement": 0.01,
+        "get_custodian_data": 0.01,
+        "get_reference_data": 0.01
+    })
+    engine = EnrichmentEngine(max_in_flight_per_source=8, source_timeout_seconds=0.2)
+
+    start = time.perf_counter()
+    enriched = engine.enrich(BREAK_DATA)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert enriched["broker_confirm_data"]["timed_out"] is True
+    assert "error" in enriched["broker_confirm_data"]
+    assert enriched["oms_data"] == {"source": "get_oms_data", "id": "ORD-1"}
+
+
+def test_hung_source_is_capped_and_fails_fast(monkeypatch):
+    """Timed-out lookups keep their threads, so a slow source cannot take more than its cap"""
+    release = threading.Event()
+    patch_sources(monkeypatch, {"get_oms_data": 0.0, "get_reference_data": 0.0})
+    monkeypatch.setattr(enrichment_tools, "get_broker_confirm", lambda arg: release.wait(5) and {"id": arg})
+    monkeypatch.setattr(enrichment_tools, "get_trade_capture", lambda arg: {"id": arg})
+    engine = EnrichmentEngine(max_in_flight_per_source=2, source_timeout_seconds=0.05)
+    break_data = {"entities": {"order_ids": ["ORD-1"], "trade_ids": ["TRD-1"]}}
+
+    try:
+        first = [engine.enrich(break_data) for _ in range(2)]
+        assert all(e["broker_confirm_data"]["timed_out"] for e in first)
+        assert engine.abandoned("broker") == 2
+
+        start = time.perf_counter()
+        third = engine.enrich(break_data)
+        assert time.perf_counter() - start < 0.04
+        assert third["broker_confirm_data"]["saturated"] is True
+        assert third["oms_data"] == {"source": "get_oms_data", "id": "ORD-1"}
+    finally:
+        release.set()
+
+    deadline = time.time() + 2
+    while engine.in_flight("broker") and time.time() < deadline:
+        time.sleep(0.01)
+    assert engine.in_flight("broker") == 0
+    assert engine.abandoned("broker") == 0
+    assert engine.enrich(break_data)["broker_confirm_data"] == {"id": "TRD-1"}
+
+
+def test_busy_source_queues_instead_of_failing(monkeypatch):
+    """Lookups beyond the source's threads wait their turn instead of failing as saturated"""
+    patch_sources(monkeypatch, {"get_oms_data": 0.05})
+    engine = EnrichmentEngine(max_in_flight_per_source=2, source_timeout_seconds=1)
+    break_data = {"entities": {"order_ids": ["ORD-1"]}}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(engine.enrich(break_data)))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [r["oms_data"] for r in results] == [{"source": "get_oms_data", "id": "ORD-1"}] * 6
+    assert engine.abandoned("oms") == 0
+
+
+def test_source_timeouts_are_keyed_by_api(monkeypatch):
+    monkeypatch.setattr(settings, "enrichment_source_timeouts", {"broker": 0.5})
+    assert EnrichmentEngine(source_timeout_seconds=5).source_timeout("broker") == 0.5
+
+    monkeypatch.setattr(settings, "enrichment_source_timeouts", {"broker_confirm_data": 0.5})
+    with pytest.raises(ValueError, match="broker_confirm_data"):
+        EnrichmentEngine()
+
+
+def test_missing_entities_skip_lookups():
+    assert EnrichmentEngine().enrich({"entities": {}}) == {}
+
+
+def test_micro_batcher_merges_concurrent_lookups():
+    calls = []
+
+    def fetch_many(ids):
+        calls.append(list(ids))
+        return {item_id: {"id": item_id} for item_id in ids if item_id != "MISSING"}
+
+    batcher = MicroBatcher(fetch_many, max_wait_seconds=0.05, max_batch_size=100)
+    results = {}
+    keys = [f"T{i % 10}" for i in range(30)] + ["MISSING"]
+    threads = [
+        threading.Thread(target=lambda key=key: results.__setitem__(key, batcher.get(key)))
+        for key in keys
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert sorted(calls[0]) == sorted(set(keys))
+    assert results["T3"] == {"id": "T3"}
+    assert results["MISSING"] is None
+
+
+def test_micro_batcher_splits_large_batches():
+    calls = []
+
+    def fetch_many(ids):
+        calls.append(len(ids))
+        return {item_id: item_id for item_id in ids}
+
+    batcher = MicroBatcher(fetch_many, max_wait_seconds=0, max_batch_size=4)
+    assert len(batcher.get_many([f"K{i}" for i in range(10)])) == 10
+    assert calls == [4, 4, 2]
+
+
+def test_enrich_many_groups_ids_by_source(monkeypatch):
+    requested = {}
+
+    def fake_bulk(name):
+        def lookup(ids):
+            requested[name] = list(ids)
+            return {item_id: {"source": name, "id": item_id} for item_id in ids}
+        return lookup
+
+    for func_name in [
+        "get_oms_data_bulk", "get_trade_capture_bulk", "get_broker_confirm_bulk",
+        "get_settlement_bulk", "get_custodian_data_bulk", "get_reference_data_bulk"
+    ]:
+        monkeypatch.setattr(enrichment_tools, func_name, fake_bulk(func_name))
+
+    breaks = [
+        BREAK_DATA,
+        {"entities": {"trade_ids": ["TRD-2"], "account": "ACC-1"}}
+    ]
+    enriched = EnrichmentEngine(max_in_flight_per_source=8, source_timeout_seconds=5).enrich_many(breaks)
+
+    assert requested["get_trade_capture_bulk"] == ["TRD-1", "TRD-2"]
+    assert set(enriched[0]) == {
+        "oms_data", "trade_capture_data", "broker_confirm_data",
+        "settlement_data", "custodian_data", "reference_data"
+    }
+    assert enriched[1] == {
+        "trade_capture_data": {"source": "get_trade_capture_bulk", "id": "TRD-2"},
+        "broker_confirm_data": {"source": "get_broker_confirm_bulk", "id": "TRD-2"},
+        "settlement_data": {"source": "get_settlement_bulk", "id": "ACC-1"},
+        "custodian_data": {"source": "get_custodian_data_bulk", "id": "ACC-1"}
+    }
@@ -0,0 +1,34 @@
+"""
+Test the shared HTTP client's downstream limits on the async path
+"""
+import sys
+import os
+import asyncio
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+import shared.http_client as http_client_module
+from shared.downstream_limits import DownstreamLimiter
+from shared.http_client import HttpClient
+
+
+def test_cancelled_aget_does_not_leak_a_slot(monkeypatch):
+    limiter = DownstreamLimiter({"oms": 1})
+    monkeypatch.setattr(http_client_module, "downstream_limiter", limiter)
+    client = HttpClient()
+
+    async def cancel_while_waiting():
+        with limiter.limit("oms"):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.aget("oms", "http://127.0.0.1:9/"), 0.05)
+        # Give a stray waiter the chance to grab the freed slot
+        await asyncio.sleep(0.1)
+
+    asyncio.run(cancel_while_waiting())
+
+    semaphore = limiter._semaphores["oms"]
+    assert semaphore.acquire(blocking=False)
+    semaphore.release()
@@ -0,0 +1,98 @@
+"""
+Test the local pattern store and its use by pattern and workflow tools
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+import mcp.tools.pattern_tools as pattern_tools
+import mcp.tools.workflow_tools as workflow_tools
+from shared.config import settings
+from shared.pattern_store import PatternStore
+
+
+API_PATTERNS = [
+    {"pattern_id": "PAT-1", "break_type": "TRADE_OMS_MISMATCH", "root_cause": "fee_mismatch",
+     "frequency": 12, "resolution": "AUTO_RESOLVE", "average_amount": 25.0},
+    {"pattern_id": "PAT-2", "break_type": "TRADE_OMS_MISMATCH", "root_cause": "timing_lag",
+     "frequency": 5, "resolution": "AUTO_RESOLVE"},
+]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = PatternStore(str(tmp_path / "patterns.db"))
+    monkeypatch.setattr(pattern_tools, "pattern_store", store)
+    monkeypatch.setattr(workflow_tools, "pattern_store", store)
+    yield store
+    store.close()
+
+
+def test_record_updates_prior_and_persists(store):
+    assert store.prior("TRADE_OMS_MISMATCH") is None
+
+    for root_cause in ("fee_mismatch", "timing_lag", "timing_lag"):
+        store.record("TRADE_OMS_MISMATCH", root_cause, amount=10.0, confirmed=True)
+
+    assert store.prior("TRADE_OMS_MISMATCH") == {"root_cause": "timing_lag", "frequency": 2, "share": 2 / 3}
+    assert store.frequency("TRADE_OMS_MISMATCH", "fee_mismatch") == 1
+
+    store.close()
+    reopened = PatternStore(store.path)
+    assert reopened.prior("TRADE_OMS_MISMATCH")["root_cause"] == "timing_lag"
+    assert reopened.stats()["events"] == 3
+    top = reopened.patterns("TRADE_OMS_MISMATCH")[0]
+    assert (top["frequency"], top["average_amount"], top["confirmed"]) == (2, 10.0, 2)
+    reopened.close()
+
+
+def test_api_is_fetched_once_per_break_type(store, monkeypatch):
+    calls = []
+
+    def fetch(break_type=None, limit=10):
+        calls.append((break_type, limit))
+        return API_PATTERNS[:limit]
+
+    monkeypatch.setattr(pattern_tools, "_fetch_historical_patterns", fetch)
+
+    # The seed size does not depend on the first caller's limit
+    first = pattern_tools.get_historical_patterns("TRADE_OMS_MISMATCH", limit=1)
+    second = pattern_tools.get_historical_patterns("TRADE_OMS_MISMATCH")
+    assert calls == [("TRADE_OMS_MISMATCH", settings.pattern_store_seed_limit)]
+    assert [p["root_cause"] for p in first] == ["fee_mismatch"]
+    assert [p["root_cause"] for p in second] == ["fee_mismatch", "timing_lag"]
+    assert second[0]["average_amount"] == 25.0
+    assert store.seed("TRADE_OMS_MISMATCH", API_PATTERNS) == 0
+
+
+def test_logged_feedback_shifts_prediction(store):
+    break_data = {
+        "break_id": "BRK-1",
+        "break_type": "TRADE_OMS_MISMATCH",
+        "system_a": {"amount": 100.0, "quantity": 10},
+        "system_b": {"amount": 5000.0, "quantity": 10},
+    }
+    store.seed("TRADE_OMS_MISMATCH", API_PATTERNS)
+
+    prediction = pattern_tools.predict_root_cause(break_data, {})
+    assert prediction["probable_root_cause"] == "fee_mismatch"
+
+    decision = {"action": "HIL_REVIEW"}
+    for _ in range(8):
+        workflow_tools.log_feedback(
+            "BRK-1", decision, "AUTO_RESOLVE",
+            break_type="TRADE_OMS_MISMATCH", root_cause="timing_lag"
+        )
+    assert store.prior("TRADE_OMS_MISMATCH")["root_cause"] == "timing_lag"
+
+    prediction = pattern_tools.predict_root_cause(break_data, {})
+    assert prediction["probable_root_cause"] == "timing_lag"
+    assert "seen 13 times" in prediction["explanation"]
+
+    # Without a root cause the feedback is only logged
+    workflow_tools.log_feedback("BRK-1", decision, "AUTO_RESOLVE", break_type="TRADE_OMS_MISMATCH")
+    assert store.stats()["events"] == 8
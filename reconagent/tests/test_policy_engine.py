@@ -0,0 +1,142 @@
+"""
+Test PolicyEngine plan caching
+"""
+import sys
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from orchestrator.v2.policy_engine import PolicyEngine
+from orchestrator.v2.schemas import BreakProfile, RiskTier
+from shared.config import settings
+
+POLICY_YAML = """
+policies:
+  TRADE_OMS_MISMATCH:
+    LOW:
+      mandatory_agents: [BREAK_INGESTION, DATA_ENRICHMENT, RULES_TOLERANCE]
+      optional_agents: [MATCHING_CORRELATION]
+      parallel_groups:
+        - [DATA_ENRICHMENT]
+        - [RULES_TOLERANCE, MATCHING_CORRELATION]
+      decision_checkpoints:
+        - after_nodes: [RULES_TOLERANCE]
+          condition: "within_tolerance"
+          action: AUTO_RESOLVE
+      max_parallel: {max_parallel}
+"""
+
+
+def make_profile(break_id, requires_matching=True):
+    return BreakProfile(
+        break_id=break_id, break_type="TRADE_OMS_MISMATCH",
+        risk_tier=RiskTier.LOW, requires_matching=requires_matching
+    )
+
+
+def test_plans_are_instantiated_from_cached_templates(tmp_path):
+    policy_file = tmp_path / "policies.yaml"
+    policy_file.write_text(POLICY_YAML.format(max_parallel=2))
+    engine = PolicyEngine(str(policy_file))
+
+    first = engine.create_execution_plan(make_profile("BRK-1"))
+    second = engine.create_execution_plan(make_profile("BRK-2"))
+    without_matching = engine.create_execution_plan(make_profile("BRK-3", requires_matching=False))
+
+    assert first.plan_id != second.plan_id
+    assert second.break_profile.break_id == "BRK-2"
+    assert [n.agent_name for n in second.nodes] == ["DATA_ENRICHMENT", "RULES_TOLERANCE", "MATCHING_CORRELATION"]
+    assert [n.agent_name for n in without_matching.nodes] == ["DATA_ENRICHMENT", "RULES_TOLERANCE"]
+    assert second.nodes[0] is first.nodes[0]
+    assert engine.cache_info()["hits"] == 1
+    assert engine.cache_info()["misses"] == 2
+    assert engine.cache_info()["size"] == 2
+
+
+def test_plan_cache_is_invalidated_when_the_policy_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "policy_reload_check_seconds", 0.0)
+    policy_file = tmp_path / "policies.yaml"
+    policy_file.write_text(POLICY_YAML.format(max_parallel=2))
+    engine = PolicyEngine(str(policy_file))
+
+    assert engine.create_execution_plan(make_profile("BRK-1")).max_parallel == 2
+
+    policy_file.write_text(POLICY_YAML.format(max_parallel=5))
+    touch_later(policy_file)
+
+    assert engine.create_execution_plan(make_profile("BRK-2")).max_parallel == 5
+    assert engine.cache_info()["invalidations"] == 1
+    assert engine.cache_info()["misses"] == 2
+
+
+def touch_later(path, seconds=1):
+    mtime = Path(path).stat().st_mtime + seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_invalid_policies_are_rejected(tmp_path):
+    from orchestrator.v2.policies.policy_loader import PolicyLoadError, PolicyLoader
+
+    policy_file = tmp_path / "policies.yaml"
+    policy_file.write_text(POLICY_YAML.format(max_parallel=0))
+
+    with pytest.raises(PolicyLoadError):
+        PolicyLoader(str(policy_file))
+
+
+@pytest.mark.parametrize("text", [
+    "- policies\n",
+    "policies: [DEFAULT]\n",
+    "policies:\n  DEFAULT: [LOW]\n",
+    "policies:\n  DEFAULT:\n    LOW:\n      decision_checkpoints: [within_tolerance]\n",
+])
+def test_malformed_policy_files_are_rejected(tmp_path, text):
+    from orchestrator.v2.policies.policy_loader import PolicyLoadError, PolicyLoader
+
+    policy_file = tmp_path / "policies.yaml"
+    policy_file.write_text(text)
+    with pytest.raises(PolicyLoadError):
+        PolicyLoader(str(policy_file))
+
+    # On reload the file is rejected once and not re-read until it changes
+    policy_file.write_text(POLICY_YAML.format(max_parallel=2))
+    loader = PolicyLoader(str(policy_file), watch=False)
+    policy_file.write_text(text)
+    touch_later(policy_file)
+    assert not loader.reload()
+    assert not loader._reload_if_modified()
+    assert loader.version == 1
+    assert loader.get_policy("TRADE_OMS_MISMATCH", "LOW").max_parallel == 2
+
+
+def test_watcher_swaps_in_valid_changes_and_keeps_policies_on_bad_ones(tmp_path):
+    from orchestrator.v2.policies.policy_loader import PolicyLoader
+
+    policy_file = tmp_path / "policies.yaml"
+    policy_file.write_text(POLICY_YAML.format(max_parallel=2))
+    loader = PolicyLoader(str(policy_file), watch=False)
+    loader.start_watching(interval_seconds=0.01)
+
+    def wait_for(predicate, timeout=2.0):
+        deadline = time.time() + timeout
+        while not predicate() and time.time() < deadline:
+            time.sleep(0.01)
+        return predicate()
+
+    try:
+        policy_file.write_text(POLICY_YAML.format(max_parallel=4))
+        touch_later(policy_file)
+        assert wait_for(lambda: loader.get_policy("TRADE_OMS_MISMATCH", "LOW").max_parallel == 4)
+        assert loader.version == 2
+
+        policy_file.write_text(POLICY_YAML.format(max_parallel="lots"))
+        touch_later(policy_file, 2)
+        assert not wait_for(lambda: loader.version != 2, timeout=0.3)
+        assert loader.get_policy("TRADE_OMS_MISMATCH", "LOW").max_parallel == 4
+    finally:
+        loader.stop_watching()
@@ -0,0 +1,61 @@
+"""
+Test compact break records and their mapping view
+"""
+import sys
+import os
+import pickle
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from agents.break_ingestion_agent import BreakIngestionAgent
+from mcp.tools.break_tools import normalize_break, validate_break
+from mcp.tools.enrichment_tools import EnrichmentEngine
+from mock_apis.main import backlog_break
+from shared.records import CompactBreak, compact_break
+
+
+def test_compact_break_reads_like_the_dict():
+    normalized = normalize_break(backlog_break(3))
+    record = compact_break(normalized)
+
+    assert record == normalized
+    assert record.to_dict() == normalized
+    assert record["entities"].get("instrument") == normalized["entities"]["instrument"]
+    assert record["system_a"]["amount"] == normalized["system_a"]["amount"]
+    assert record.get("missing", "default") == "default"
+    assert validate_break(record) == validate_break(normalized)
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert compact_break(record) is record
+
+    with pytest.raises(AttributeError):
+        record.status = "CLOSED"
+    with pytest.raises(TypeError):
+        record["status"] = "CLOSED"
+
+
+def test_repeated_strings_are_shared():
+    first = compact_break(normalize_break(backlog_break(1)))
+    second = compact_break(normalize_break(dict(backlog_break(2), entities=dict(
+        backlog_break(2)["entities"], instrument="".join(["AA", "PL"])
+    ))))
+    third = compact_break(normalize_break(dict(backlog_break(1), entities=dict(
+        backlog_break(1)["entities"], instrument="".join(["AA", "PL"])
+    ))))
+
+    assert second["entities"]["instrument"] is third["entities"]["instrument"]
+    assert first["system_a"]["currency"] is second["system_a"]["currency"]
+
+
+def test_tools_accept_compact_records():
+    result = BreakIngestionAgent().ingest_break(raw_break=backlog_break(4), compact=True)
+    record = result["break_data"]
+
+    assert isinstance(record, CompactBreak)
+    assert result["status"] == "INGESTED"
+    assert [key for key, _, _ in EnrichmentEngine().plan_lookups(record)] == [
+        "oms_data", "trade_capture_data", "broker_confirm_data",
+        "settlement_data", "custodian_data", "reference_data"
+    ]
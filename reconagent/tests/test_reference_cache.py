@@ -0,0 +1,166 @@
+"""
+Test the shared TTL cache, request coalescing and cached tool lookups
+"""
+import sys
+import os
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.tools import enrichment_tools
+from orchestrator.v2.break_classifier import BreakClassifier
+from shared.cache import SingleFlight, TTLCache
+
+
+def test_concurrent_misses_load_each_key_once():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"asset_class": "EQUITY"}
+
+    threads = [threading.Thread(target=cache.get_or_load, args=("AAPL", load)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert cache.get("AAPL") == {"asset_class": "EQUITY"}
+
+
+def test_entries_expire_and_size_is_bounded():
+    cache = TTLCache(max_size=2, ttl_seconds=0.05)
+    cache.set_many({"A": 1, "B": 2, "C": 3})
+
+    assert cache.get("A") is None
+    assert cache.missing(["A", "B", "C", "B"]) == ["A"]
+    time.sleep(0.06)
+    assert cache.missing(["B", "C"]) == ["B", "C"]
+
+
+def test_classifier_prefers_cached_reference_data():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    classifier = BreakClassifier(reference_cache=cache)
+    break_data = {"break_id": "BRK-1", "entities": {"instrument": "XYZ-CALL"}}
+
+    # Heuristic until reference data is known
+    assert classifier.classify(break_data).asset_class == "DERIVATIVE"
+
+    cache.set("XYZ-CALL", {"symbol": "XYZ-CALL", "asset_class": "EQUITY"})
+
+    assert classifier.classify(break_data).asset_class == "EQUITY"
+    assert classifier.classify_many([break_data]).profile(0).asset_class == "EQUITY"
+
+
+def test_prewarm_only_fetches_uncached_instruments(monkeypatch):
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    cache.set("AAPL", {"symbol": "AAPL", "asset_class": "EQUITY"})
+    requested = []
+
+    def fake_bulk(symbols=None):
+        requested.append(symbols)
+        return {s: {"symbol": s, "asset_class": "FX"} for s in symbols}
+
+    monkeypatch.setattr(enrichment_tools, "reference_data_cache", cache)
+    monkeypatch.setattr(enrichment_tools, "fetch_reference_data_bulk", fake_bulk)
+
+    assert enrichment_tools.prewarm_reference_data(["AAPL", "EURUSD", "EURUSD"]) == 1
+    assert enrichment_tools.prewarm_reference_data(["AAPL", "EURUSD"]) == 0
+    assert requested == [["EURUSD"]]
+    assert enrichment_tools.get_reference_data("EURUSD")["asset_class"] == "FX"
+
+
+def test_single_flight_shares_uncached_results():
+    flight = SingleFlight()
+    calls = []
+    results = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"error": "downstream unavailable"}
+
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("ACC-1", fetch)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"error": "downstream unavailable"}] * 8
+    assert flight.coalesced == 7
+
+
+def test_byte_budget_evicts_least_recently_used():
+    cache = TTLCache(max_size=100, ttl_seconds=60, max_bytes=250, sizeof=lambda value: len(value))
+    cache.set("A", "x" * 100)
+    cache.set("B", "x" * 100)
+    cache.get("A")
+    cache.set("C", "x" * 100)
+
+    assert cache.missing(["A", "B", "C"]) == ["B"]
+    assert cache.stats()["bytes"] == 200
+
+    # Larger than the whole budget: not cached, nothing else evicted
+    cache.set("D", "x" * 300)
+    assert cache.missing(["A", "C", "D"]) == ["D"]
+
+
+def test_account_lookups_fetch_once_per_account(monkeypatch):
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    fetched = []
+
+    def fake_fetch(account):
+        fetched.append(account)
+        time.sleep(0.02)
+        return {"account": account, "positions": []}
+
+    monkeypatch.setattr(enrichment_tools, "account_data_cache", cache)
+    monkeypatch.setattr(enrichment_tools, "_fetch_settlement", fake_fetch)
+
+    accounts = ["ACC-1", "ACC-2"] * 20
+    threads = [threading.Thread(target=enrichment_tools.get_settlement, args=(a,)) for a in accounts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(fetched) == ["ACC-1", "ACC-2"]
+    assert cache.stats()["loads"] == 2
+
+
+def test_account_payloads_are_copied_per_caller(monkeypatch):
+    monkeypatch.setattr(enrichment_tools, "_fetch_settlement", lambda account: {"positions": [{"qty": 1}]})
+    enrichment_tools.account_data_cache.clear()
+
+    first = enrichment_tools.get_settlement("ACC-COPY")
+    first["positions"][0]["qty"] = 999
+    first["positions"].append({"qty": 2})
+
+    assert enrichment_tools.get_settlement("ACC-COPY") == {"positions": [{"qty": 1}]}
+    bulk = enrichment_tools.get_settlement_bulk(["ACC-COPY"])
+    bulk["ACC-COPY"]["positions"].clear()
+    assert enrichment_tools.get_settlement("ACC-COPY") == {"positions": [{"qty": 1}]}
+    enrichment_tools.account_data_cache.clear()
+
+
+def test_reference_records_are_copied_per_caller(monkeypatch):
+    record = {"symbol": "COPY", "asset_class": "EQUITY", "identifiers": {"isin": "US0000000001"}}
+    monkeypatch.setattr(enrichment_tools, "_fetch_reference_data", lambda symbol: dict(record))
+    enrichment_tools.reference_data_cache.clear()
+
+    first = enrichment_tools.get_reference_data("COPY")
+    first["asset_class"] = "FX"
+    first["identifiers"]["isin"] = "changed"
+
+    assert enrichment_tools.get_reference_data("COPY") == record
+    assert enrichment_tools.reference_data_cache.get("COPY") == record
+    enrichment_tools.reference_data_cache.clear()
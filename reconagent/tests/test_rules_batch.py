@@ -0,0 +1,45 @@
+"""
+Test the vectorized business rules against apply_business_rules
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.tools.break_tools import normalize_break
+from mcp.tools.rules_tools import (
+    RULE_BITS, apply_business_rules, apply_business_rules_many, validate_rules
+)
+from mock_apis.main import backlog_break
+
+
+def edge_case_breaks():
+    return [
+        {"break_id": "EQUAL", "system_a": {"amount": 100.0, "quantity": 10, "currency": "USD"},
+         "system_b": {"amount": 100.0, "quantity": 10, "currency": "USD"}},
+        {"break_id": "QTY-ABS", "system_a": {"quantity": 10.005}, "system_b": {"quantity": 10}},
+        {"break_id": "ZERO", "system_a": {"amount": 0, "quantity": 0}, "system_b": {"amount": 5}},
+        {"break_id": "FX", "system_a": {"currency": "USD"}, "system_b": {"currency": "EUR"}},
+        {"break_id": "EMPTY", "system_a": {"currency": ""}, "system_b": {}},
+        {"break_id": "NO-LEGS"},
+    ]
+
+
+def test_batch_matches_scalar_rules():
+    breaks = [normalize_break(backlog_break(i)) for i in range(300)] + edge_case_breaks()
+    batch = apply_business_rules_many(breaks)
+
+    assert len(batch) == len(breaks)
+    for idx, break_data in enumerate(breaks):
+        expected = apply_business_rules(break_data, {})
+        assert batch.evaluation(idx) == expected
+        assert bool(batch.all_critical_rules_passed[idx]) == validate_rules(expected)
+
+
+def test_bitsets():
+    batch = apply_business_rules_many(edge_case_breaks())
+    assert batch.applied[0] == sum(RULE_BITS.values())
+    assert batch.within_tolerance.tolist() == [True, True, True, False, True, True]
+    assert batch.failed_rules(3) == ["CURRENCY_MATCH"]
+    assert not batch.all_critical_rules_passed[3]